@@ -15,9 +15,25 @@ import math
 import random
 import json
 import os
+import gc
+import argparse
+import tracemalloc
+import heapq
+import time
+import weakref
+import threading
+import queue
+import struct
+import hashlib
+import array
+import bisect
+import sys
+from collections import deque, OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator, Sequence, Set
+from dataclasses import dataclass, field
 
 # Initialize Pygame
 pygame.init()
@@ -26,6 +42,15 @@ pygame.init()
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+IDLE_WAIT_MS = 500  # Longest block on input in menus and pause before redrawing
+MAX_FRAME_TIME = 0.25  # Longest frame the fixed-step accumulator catches up on
+
+# Save State Configuration
+AUTOSAVE_FILE = "autosave.bin"
+SAVE_MAGIC = b"ACBS"
+SAVE_VERSION = 5  # 2 added the level seed, 3 the level kind and scroll, 4 pending chain reactions, 5 moving bricks
+REWIND_SECONDS = 10     # Gameplay kept for rewinding
+REWIND_BUDGET_KB = 256  # Memory cap for the rewind buffer
 
 # AWS Official Color Palette
 AWS_ORANGE = (255, 153, 0)      # #FF9900
@@ -43,18 +68,101 @@ PADDLE_SPEED = 400
 PADDLE_WIDTH = 120
 PADDLE_HEIGHT = 20
 POWERUP_FALL_SPEED = 150
+PADDLE_SMOOTH_RESIZE = True  # Animate Paddle Extend instead of snapping
+PADDLE_RESIZE_TIME = 0.2     # Seconds for a full extend/retract animation
+PADDLE_RESIZE_STEP = 6       # Width granularity of mid-animation sprites
+SLOW_MOTION_FACTOR = 0.7     # Game time runs this fast while Slow Motion is active
+
+BALL_TRAIL_LENGTH = 5
+
+# Ball Collisions
+BALL_HASH_CELL = 32  # Spatial hash cell size; grown to the widest ball if one is bigger
+BALL_COLLISION_COUNTS = (10, 100, 1000)  # Ball counts the collision benchmark measures
+DDOS_WAVE_INTERVAL = 3.0  # Seconds between ball storms in DDoS mode
+DDOS_WAVE_BALLS = 50      # Balls per storm
+DDOS_MAX_BALLS = 1000     # Storms stop adding balls at this many
+BALL_BATCH_COUNTS = (10, 100, 10000)  # Ball counts the batched physics benchmark measures
+
+# Landing Prediction
+PREDICT_MAX_BOUNCES = 32  # Wall and brick bounces a predicted path may take before giving up
+AIM_ASSIST_BALLS = 3      # Soonest-landing balls the aim assist draws a path for
+AUTOPILOT_GAMES = 4       # Headless games per policy in the autopilot benchmark
+AUTOPILOT_SECONDS = 60    # Seconds each of those games plays
+AUTOPILOT_BALLS = 3       # Top-speed balls each of those games starts with
+
+# Adaptive Quality Configuration
+QUALITY_WINDOW = 120                 # Frames per frame-time sample window
+QUALITY_PERCENTILE = 95              # Frame-time percentile the controller watches
+QUALITY_DOWNGRADE_MS = 1000 / FPS    # Percentile above this steps quality down
+QUALITY_UPGRADE_MS = 0.6 * 1000 / FPS  # Percentile below this counts toward stepping up
+QUALITY_UPGRADE_WINDOWS = 3          # Consecutive calm windows needed to step up
 
 # Power-up Configuration
 SHIELD_HEIGHT = 10
 LASER_COOLDOWN = 0.5
 POWERUP_DROP_CHANCE = 0.25  # Increased from 0.15 to 25%
 
+# Chain Reactions
+CHAIN_WORK_PER_FRAME = 64  # Neighbour hits a chain reaction may make per frame; the rest wait
+CHAIN_MAX_DROPS = 1        # Power-ups chain-destroyed blocks may drop per frame
+
+# Moving Bricks
+LEVEL_SLIDE_SPEED = 70     # Pixels per second a sliding row moves, wall to wall
+
+# Overlay Configuration
+OVERLAY_ALPHA = 128
+LEVEL_BANNER_DURATION = 1.5
+
 # Block Configuration
 BLOCK_WIDTH = 80
 BLOCK_HEIGHT = 30
 BLOCKS_PER_ROW = 12
 BLOCK_ROWS = 8
 
+# Level Files
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+LEVEL_FILES = ("basic", "web_app", "serverless", "ml_workflow", "advanced")  # Levels 1-5, in order
+LEVEL_CACHE_DIR = "__levelcache__"  # Compiled levels, next to the sources
+LEVEL_MAGIC = b"ACBL"
+LEVEL_FORMAT_VERSION = 2  # 2 added sliding rows
+LEVEL_GRID_COLUMNS = 11    # Cells across a generated level, mirrored about the middle one
+LEVEL_GRID_ROWS = 8        # Most rows a generated level grows to
+LEVEL_GENERATED_TOP = 50
+LEVEL_MIN_BRICKS = 8
+LEVEL_CACHE_SIZE = 64      # Generated layouts kept for replays and retries
+LEVEL_PRELOAD_CLEARED = 0.8  # Fraction of bricks destroyed before the next level is prepared
+
+# Endless Descent
+GAME_MODES = ("levels", "descent", "stress")
+DESCENT_TOP = 50                         # Where the newest row finishes sliding in
+DESCENT_DANGER_Y = SCREEN_HEIGHT - 200   # A row with bricks left past this costs a life
+DESCENT_SPEED = 10                       # Pixels per second in the first stage
+DESCENT_SPEED_STEP = 2                   # Extra pixels per second each stage
+DESCENT_MAX_SPEED = 60
+DESCENT_ROWS_PER_STAGE = 10              # Rows per stage, shown as the level
+DESCENT_START_ROWS = 5                   # Rows on the board when a run starts
+DESCENT_FORTRESS_EVERY = 12              # Every twelfth row is a wall of tough bricks
+DESCENT_POOL_ROWS = (DESCENT_DANGER_Y - DESCENT_TOP) // (BLOCK_HEIGHT + 10) + 3  # Reused brick rows
+
+# Stress Mode
+STRESS_BRICK_WIDTH = 12       # Micro-bricks
+STRESS_BRICK_HEIGHT = 6
+STRESS_BRICK_GAP = 2
+STRESS_WORLD_WIDTH = SCREEN_WIDTH * 3
+STRESS_TOP = 50
+STRESS_OPEN_HEIGHT = SCREEN_HEIGHT // 2  # Open space between the bricks and the paddle
+STRESS_DEFAULT_BRICKS = 20000
+STRESS_DEFAULT_BALLS = 200
+STRESS_MAX_BRICKS = 50000
+STRESS_MAX_BALLS = 1000
+STRESS_SIZES = ((1000, 10), (10000, 100), (50000, 500))  # (bricks, balls) the stress benchmark measures
+CAMERA_PAN_SPEED = 900  # Pixels per second the view pans up the board
+
+class EntityScope(Enum):
+    """Lifetime scope of entities owned by the EntityRegistry."""
+    LEVEL = "level"  # Torn down whenever a level ends
+    GAME = "game"    # Torn down only when a new game starts
+
 class GameState(Enum):
     """Game state enumeration for state management."""
     MENU = "menu"
@@ -87,6 +195,27 @@ class BlockType(Enum):
     CLOUDFORMATION = ("CloudFormation", 2, 75, AWS_RED)
     AUTO_SCALING = ("Auto Scaling", 1, 50, AWS_GREEN)
 
+@dataclass(frozen=True)
+class ChainEffect:
+    """What a block does to the blocks beside it when destroyed."""
+    damage: int
+    diagonal: bool  # Also hits the diagonal neighbours, not just the four beside it
+
+CHAIN_EFFECTS = {
+    BlockType.AUTO_SCALING: ChainEffect(damage=1, diagonal=True),     # Cascade: a hit to every neighbour
+    BlockType.CLOUDFORMATION: ChainEffect(damage=3, diagonal=False),  # Stack teardown: flattens the four beside it
+}
+
+@dataclass(frozen=True)
+class BrickMotion:
+    """How a block of a moving type patrols about where it was laid out."""
+    velocity: Tuple[float, float]
+    reach: Tuple[float, float]  # Furthest it goes either side, across and down
+
+BRICK_MOTIONS = {
+    BlockType.EKS: BrickMotion(velocity=(0.0, 16.0), reach=(0.0, 4.0)),  # Pods bob in the gap between rows
+}
+
 class PowerUpType(Enum):
     """Power-up types with their properties."""
     MULTI_BALL = ("Multi-Ball", 15, AWS_ORANGE)
@@ -96,6 +225,33 @@ class PowerUpType(Enum):
     SHIELD = ("Shield", 30, AWS_LIGHT_GRAY)
     SCORE_MULTIPLIER = ("Score Multiplier", 15, (255, 215, 0))
 
+class QualityTier(Enum):
+    """Cosmetic detail levels: (rank, gradients, ball trail length, service icons, text labels)."""
+    MINIMAL = (0, False, 0, False, False)
+    LOW = (1, False, 2, True, False)
+    HIGH = (2, True, 3, True, True)
+    ULTRA = (3, True, BALL_TRAIL_LENGTH, True, True)
+    
+    @property
+    def rank(self) -> int:
+        return self.value[0]
+    
+    @property
+    def gradients(self) -> bool:
+        return self.value[1]
+    
+    @property
+    def trail_length(self) -> int:
+        return self.value[2]
+    
+    @property
+    def icons(self) -> bool:
+        return self.value[3]
+    
+    @property
+    def labels(self) -> bool:
+        return self.value[4]
+
 @dataclass
 class Vector2D:
     """2D Vector class for position and velocity calculations."""
@@ -117,6 +273,118 @@ class Vector2D:
             return Vector2D(self.x / mag, self.y / mag)
         return Vector2D(0, 0)
 
+def _interpolate(previous: float, current: float, alpha: float) -> float:
+    """Blend a previous and current physics value; exactly current at alpha 1."""
+    return current - (current - previous) * (1.0 - alpha)
+
+# Held around every font load and render (sprites, HUD, menus, overlays),
+# since level preloading bakes sprites on a worker thread and SDL_ttf is
+# not thread-safe
+SPRITE_RENDER_LOCK = threading.RLock()
+
+def _prepare_sprite(surface: pygame.Surface, alpha: bool = True, scale: float = 1.0) -> pygame.Surface:
+    """Scale a logic-resolution sprite to the render scale and convert it to
+    the display format when there is a display surface.
+
+    With the texture renderer there is none, and surfaces stay as created.
+    """
+    if scale != 1.0:
+        width, height = surface.get_size()
+        surface = pygame.transform.smoothscale(
+            surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+    if not pygame.display.get_surface():
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+class BallSprites:
+    """Pre-rendered ball body and trail images for one radius, render scale and quality."""
+    
+    _cache: Dict[Tuple[int, float, QualityTier], "BallSprites"] = {}
+    
+    def __init__(self, radius: int, scale: float = 1.0, quality: QualityTier = QualityTier.ULTRA):
+        self.radius = radius
+        self.offset = radius + 1  # Sprite center, with a pixel of margin for the outline
+        self.scale = scale
+        self.quality = quality
+        self.body = self._render_body(radius)
+        
+        # One trail image per alpha level a trail of up to BALL_TRAIL_LENGTH can use
+        self.trails: Dict[int, pygame.Surface] = {}
+        for length in range(1, BALL_TRAIL_LENGTH + 1):
+            for i in range(length):
+                alpha = self.trail_alpha(i, length)
+                if alpha not in self.trails:
+                    trail = pygame.Surface((self.offset * 2, self.offset * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(trail, (*AWS_ORANGE, alpha), (self.offset, self.offset), radius)
+                    self.trails[alpha] = _prepare_sprite(trail, scale=scale)
+        
+        # Offset of the sprite center once scaled
+        self.scaled_offset = self.body.get_width() // 2
+    
+    @classmethod
+    def get(cls, radius: int, scale: float = 1.0, quality: QualityTier = QualityTier.ULTRA) -> "BallSprites":
+        """Get the sprites for a radius, scale and quality, rendering them on first use."""
+        key = (radius, scale, quality)
+        sprites = cls._cache.get(key)
+        if sprites is None:
+            with SPRITE_RENDER_LOCK:
+                sprites = cls._cache[key] = cls(radius, scale, quality)
+        return sprites
+    
+    @staticmethod
+    def trail_alpha(index: int, length: int) -> int:
+        """Alpha of the index-th oldest of length trail images."""
+        return int((index + 1) / length * 100)
+    
+    def _render_body(self, radius: int) -> pygame.Surface:
+        """Draw the AWS Q Developer ball with enhanced logo design."""
+        body = pygame.Surface((self.offset * 2, self.offset * 2), pygame.SRCALPHA)
+        center_x = center_y = self.offset
+        
+        # Draw multiple circles for gradient effect (simplified)
+        if self.quality.gradients:
+            for i in range(radius, 0, -2):
+                intensity = i / radius
+                color = tuple(int(c * intensity) for c in AWS_ORANGE)
+                pygame.draw.circle(body, color, (center_x, center_y), i)
+        else:
+            pygame.draw.circle(body, AWS_ORANGE, (center_x, center_y), radius)
+        
+        # Draw outer ring
+        pygame.draw.circle(body, AWS_WHITE, (center_x, center_y), radius, 2)
+        
+        # Draw AWS Q Developer logo elements
+        if self.quality.labels:
+            # Main Q shape
+            font_size = max(10, radius)
+            font = pygame.font.Font(None, font_size)
+            
+            # Draw Q with distinctive styling
+            q_text = font.render("Q", True, AWS_WHITE)
+            q_rect = q_text.get_rect(center=(center_x, center_y - 1))
+            body.blit(q_text, q_rect)
+            
+            # Add small "AI" indicator below Q
+            if radius >= 8:
+                ai_font = pygame.font.Font(None, max(8, radius // 2))
+                ai_text = ai_font.render("AI", True, AWS_WHITE)
+                ai_rect = ai_text.get_rect(center=(center_x, center_y + radius // 2))
+                body.blit(ai_text, ai_rect)
+        
+        # Add AWS branding dots around the Q
+        if radius >= 6 and self.quality.icons:
+            dot_positions = [
+                (center_x - radius + 2, center_y - 2),
+                (center_x + radius - 2, center_y - 2),
+                (center_x, center_y - radius + 2),
+                (center_x, center_y + radius - 2)
+            ]
+            
+            for dot_x, dot_y in dot_positions:
+                pygame.draw.circle(body, AWS_WHITE, (int(dot_x), int(dot_y)), 1)
+        
+        return _prepare_sprite(body, scale=self.scale)
+
 class Ball:
     """AWS Q Developer packet - the game ball with physics."""
     
@@ -125,25 +393,38 @@ class Ball:
         self.velocity = Vector2D(random.choice([-1, 1]), -1).normalize() * speed
         self.radius = 8
         self.speed = speed
-        self.trail_positions = []
+        self.previous_position = self.position  # Position before the last update, for interpolation
         
-    def update(self, dt: float, slow_motion: bool = False) -> None:
-        """Update ball position and handle wall collisions."""
+        # Trail history as a fixed-size ring buffer
+        self._trail: List[Tuple[float, float]] = [(0.0, 0.0)] * BALL_TRAIL_LENGTH
+        self._trail_next = 0
+        self._trail_count = 0
+    
+    @property
+    def trail_positions(self) -> List[Tuple[float, float]]:
+        """Trail positions, oldest first."""
+        start = (self._trail_next - self._trail_count) % BALL_TRAIL_LENGTH
+        return [self._trail[(start + i) % BALL_TRAIL_LENGTH] for i in range(self._trail_count)]
+        
+    def update(self, dt: float, slow_motion: bool = False, width: int = SCREEN_WIDTH) -> None:
+        """Update ball position and handle collisions with the walls of a world width wide."""
         # Apply slow motion effect
-        effective_dt = dt * 0.7 if slow_motion else dt
+        effective_dt = dt * SLOW_MOTION_FACTOR if slow_motion else dt
         
         # Store trail positions for visual effect
-        self.trail_positions.append((self.position.x, self.position.y))
-        if len(self.trail_positions) > 5:
-            self.trail_positions.pop(0)
+        self._trail[self._trail_next] = (self.position.x, self.position.y)
+        self._trail_next = (self._trail_next + 1) % BALL_TRAIL_LENGTH
+        if self._trail_count < BALL_TRAIL_LENGTH:
+            self._trail_count += 1
             
         # Update position
+        self.previous_position = self.position
         self.position = self.position + self.velocity * effective_dt
         
         # Wall collisions
-        if self.position.x <= self.radius or self.position.x >= SCREEN_WIDTH - self.radius:
+        if self.position.x <= self.radius or self.position.x >= width - self.radius:
             self.velocity.x = -self.velocity.x
-            self.position.x = max(self.radius, min(SCREEN_WIDTH - self.radius, self.position.x))
+            self.position.x = max(self.radius, min(width - self.radius, self.position.x))
             
         if self.position.y <= self.radius:
             self.velocity.y = -self.velocity.y
@@ -161,6 +442,25 @@ class Ball:
         
         self.velocity = Vector2D(math.sin(angle) * speed, -abs(math.cos(angle)) * speed)
     
+    def bounce_off_block(self, block_rect: pygame.Rect, block_velocity: Optional[Vector2D] = None) -> None:
+        """Bounce off the side of a block the ball is closest to.
+
+        The velocity is reflected relative to a moving block's, so a brick
+        sliding into the ball knocks it away; the ball keeps its speed.
+        """
+        if block_velocity is None:
+            if abs(self.position.x - block_rect.centerx) > abs(self.position.y - block_rect.centery):
+                self.velocity.x = -self.velocity.x
+            else:
+                self.velocity.y = -self.velocity.y
+            return
+        speed = self.velocity.magnitude()
+        if abs(self.position.x - block_rect.centerx) > abs(self.position.y - block_rect.centery):
+            self.velocity.x = 2 * block_velocity.x - self.velocity.x
+        else:
+            self.velocity.y = 2 * block_velocity.y - self.velocity.y
+        self.velocity = self.velocity.normalize() * speed
+    
     def get_rect(self) -> pygame.Rect:
         """Get ball collision rectangle."""
         return pygame.Rect(
@@ -170,117 +470,445 @@ class Ball:
             self.radius * 2
         )
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the AWS Q Developer ball with enhanced logo design."""
-        # Draw trail
-        for i, pos in enumerate(self.trail_positions):
-            alpha = (i + 1) / len(self.trail_positions) * 100
-            trail_surface = pygame.Surface((self.radius * 2, self.radius * 2))
-            trail_surface.set_alpha(alpha)
-            pygame.draw.circle(trail_surface, AWS_ORANGE, (self.radius, self.radius), self.radius)
-            screen.blit(trail_surface, (pos[0] - self.radius, pos[1] - self.radius))
+    def render_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """Position alpha of the way from the previous update to the last one."""
+        return (_interpolate(self.previous_position.x, self.position.x, alpha),
+                _interpolate(self.previous_position.y, self.position.y, alpha))
+    
+    def draw(self, screen: pygame.Surface, scale: float = 1.0,
+             quality: QualityTier = QualityTier.ULTRA, alpha: float = 1.0) -> None:
+        """Draw the ball and the newest quality.trail_length trail positions from cached sprites."""
+        sprites = BallSprites.get(self.radius, scale, quality)
+        offset = sprites.scaled_offset
         
-        # Draw main ball with gradient effect
-        center_x, center_y = int(self.position.x), int(self.position.y)
+        # Draw trail, oldest first
+        count = min(self._trail_count, quality.trail_length)
+        start = self._trail_next - count
+        for i in range(count):
+            x, y = self._trail[(start + i) % BALL_TRAIL_LENGTH]
+            screen.blit(sprites.trails[BallSprites.trail_alpha(i, count)],
+                        (int(x * scale) - offset, int(y * scale) - offset))
         
-        # Draw multiple circles for gradient effect (simplified)
-        for i in range(self.radius, 0, -2):
-            intensity = i / self.radius
-            color = tuple(int(c * intensity) for c in AWS_ORANGE)
-            pygame.draw.circle(screen, color, (center_x, center_y), i)
+        x, y = self.render_position(alpha)
+        screen.blit(sprites.body, (int(x * scale) - offset, int(y * scale) - offset))
+    
+    @staticmethod
+    def draw_at(screen: pygame.Surface, x: float, y: float, radius: int,
+                trail: Tuple[Tuple[float, float], ...], scale: float = 1.0,
+                quality: QualityTier = QualityTier.ULTRA) -> None:
+        """Draw a ball from plain values, with trail positions oldest first."""
+        sprites = BallSprites.get(radius, scale, quality)
+        offset = sprites.scaled_offset
+        count = min(len(trail), quality.trail_length)
+        for i, (trail_x, trail_y) in enumerate(trail[len(trail) - count:]):
+            screen.blit(sprites.trails[BallSprites.trail_alpha(i, count)],
+                        (int(trail_x * scale) - offset, int(trail_y * scale) - offset))
+        screen.blit(sprites.body, (int(x * scale) - offset, int(y * scale) - offset))
+
+class BallCollider:
+    """Elastic ball-ball collisions, found through a spatial hash built every frame.
+
+    Balls are binned by center into cells at least one ball across, so any
+    two touching balls sit in the same or neighbouring cells. Each cell is
+    checked against itself and four of its neighbours, which tests every
+    close pair once; with balls spread out the cost grows with the number
+    of balls rather than the number of pairs. Mass goes with the square of
+    the radius.
+    """
+    
+    NEIGHBOURS = ((1, 0), (1, 1), (0, 1), (-1, 1))  # Half the ring, so each pair of cells once
+    
+    def __init__(self, cell_size: int = BALL_HASH_CELL):
+        self.cell_size = cell_size
+        self.pairs_tested = 0  # Distance checks made by the last pairs() call
+    
+    def pairs(self, balls: List[Ball]) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) of balls that overlap, in a fixed order."""
+        size = max(self.cell_size, 2 * max((ball.radius for ball in balls), default=0))
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, ball in enumerate(balls):
+            cells.setdefault((int(ball.position.x // size), int(ball.position.y // size)), []).append(i)
         
-        # Draw outer ring
-        pygame.draw.circle(screen, AWS_WHITE, (center_x, center_y), self.radius, 2)
+        found = []
+        tested = 0
+        for (column, row), members in cells.items():
+            candidates = [members]
+            for dx, dy in self.NEIGHBOURS:
+                other = cells.get((column + dx, row + dy))
+                if other:
+                    candidates.append(other)
+            for n, i in enumerate(members):
+                a = balls[i]
+                ax, ay, ar = a.position.x, a.position.y, a.radius
+                for k, others in enumerate(candidates):
+                    for j in (others[n + 1:] if k == 0 else others):
+                        b = balls[j]
+                        tested += 1
+                        dx, dy, reach = b.position.x - ax, b.position.y - ay, ar + b.radius
+                        if dx * dx + dy * dy < reach * reach:
+                            found.append((i, j) if i < j else (j, i))
+        self.pairs_tested = tested
+        return found
+    
+    @staticmethod
+    def all_pairs(balls: List[Ball]) -> List[Tuple[int, int]]:
+        """The overlapping pairs found by testing every pair; the reference pairs() must match."""
+        found = []
+        for i, a in enumerate(balls):
+            for j in range(i + 1, len(balls)):
+                b = balls[j]
+                dx, dy, reach = b.position.x - a.position.x, b.position.y - a.position.y, a.radius + b.radius
+                if dx * dx + dy * dy < reach * reach:
+                    found.append((i, j))
+        return found
+    
+    def resolve(self, balls: List[Ball]) -> int:
+        """Bounce every overlapping pair of balls apart and return how many bounced."""
+        bounced = 0
+        for i, j in self.pairs(balls):
+            bounced += self.bounce(balls[i], balls[j])
+        return bounced
+    
+    @staticmethod
+    def bounce(a: Ball, b: Ball) -> bool:
+        """Separate two overlapping balls and exchange momentum along the line between them.
+
+        Returns False when they are already moving apart, leaving velocities alone.
+        """
+        dx, dy = b.position.x - a.position.x, b.position.y - a.position.y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            dx, dy, distance = 1.0, 0.0, 1.0  # Exactly on top of each other: part them sideways
+        nx, ny = dx / distance, dy / distance
+        mass_a, mass_b = a.radius ** 2, b.radius ** 2
+        total = mass_a + mass_b
         
-        # Draw AWS Q Developer logo elements
-        # Main Q shape
-        font_size = max(10, self.radius)
-        font = pygame.font.Font(None, font_size)
-        
-        # Draw Q with distinctive styling
-        q_text = font.render("Q", True, AWS_WHITE)
-        q_rect = q_text.get_rect(center=(center_x, center_y - 1))
-        screen.blit(q_text, q_rect)
-        
-        # Add small "AI" indicator below Q
-        if self.radius >= 8:
-            ai_font = pygame.font.Font(None, max(8, self.radius // 2))
-            ai_text = ai_font.render("AI", True, AWS_WHITE)
-            ai_rect = ai_text.get_rect(center=(center_x, center_y + self.radius // 2))
-            screen.blit(ai_text, ai_rect)
+        # Push apart so they only just touch, the lighter ball moving further
+        overlap = a.radius + b.radius - distance
+        if overlap > 0:
+            a.position = Vector2D(a.position.x - nx * overlap * mass_b / total,
+                                  a.position.y - ny * overlap * mass_b / total)
+            b.position = Vector2D(b.position.x + nx * overlap * mass_a / total,
+                                  b.position.y + ny * overlap * mass_a / total)
         
-        # Add AWS branding dots around the Q
-        if self.radius >= 6:
-            dot_positions = [
-                (center_x - self.radius + 2, center_y - 2),
-                (center_x + self.radius - 2, center_y - 2),
-                (center_x, center_y - self.radius + 2),
-                (center_x, center_y + self.radius - 2)
-            ]
-            
-            for dot_x, dot_y in dot_positions:
-                pygame.draw.circle(screen, AWS_WHITE, (int(dot_x), int(dot_y)), 1)
+        approach = (a.velocity.x - b.velocity.x) * nx + (a.velocity.y - b.velocity.y) * ny
+        if approach <= 0:
+            return False
+        impulse = 2 * approach / total
+        a.velocity = Vector2D(a.velocity.x - impulse * mass_b * nx, a.velocity.y - impulse * mass_b * ny)
+        b.velocity = Vector2D(b.velocity.x + impulse * mass_a * nx, b.velocity.y + impulse * mass_a * ny)
+        return True
 
-class Paddle:
-    """AWS Load Balancer - the player-controlled paddle."""
+class BallBatch:
+    """Ball physics for every ball at once, on NumPy arrays.
+
+    An optional path for huge ball counts. Each call gathers positions,
+    velocities and radii into arrays, and movement, wall reflection, paddle
+    overlap and the brick broadphase run as array operations over all the
+    balls. Only balls that touched the paddle or a brick are then handled
+    one by one, in ball order and with the scalar methods, so results are
+    identical to the scalar path. Standing-still bricks are looked up
+    through a packed copy of the level's BlockGrid cells, built once per
+    grid; moving bricks are left out of it and tested all at once, with
+    only their rects refreshed each frame. Endless levels, whose whole
+    pool keeps moving, test every brick at once. Needs NumPy: constructing
+    one raises ImportError without it.
+    """
     
-    def __init__(self, x: float, y: float):
-        self.position = Vector2D(x, y)
-        self.width = PADDLE_WIDTH
-        self.height = PADDLE_HEIGHT
-        self.speed = PADDLE_SPEED
-        self.extended = False
-        self.extend_timer = 0
-        self.original_width = PADDLE_WIDTH
+    _KEY_OFFSET = 1 << 20  # Cell coordinates are shifted by this to pack them in one int64 key
+    
+    def __init__(self):
+        import numpy
         
-    def update(self, dt: float, keys_pressed: Dict) -> None:
-        """Update paddle position based on input."""
-        # Handle movement
-        if keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_a]:
-            self.position.x -= self.speed * dt
-        if keys_pressed[pygame.K_RIGHT] or keys_pressed[pygame.K_d]:
-            self.position.x += self.speed * dt
-            
-        # Keep paddle within screen bounds
-        self.position.x = max(self.width / 2, min(SCREEN_WIDTH - self.width / 2, self.position.x))
+        self.np = numpy
+        # Packed grid: (grid, rects, keys, starts, counts, members, movers); members leave movers out
+        self._bricks: Optional[Tuple[Any, ...]] = None
+    
+    def _gather(self, balls: List[Ball]) -> Any:
+        values = self.np.array([(ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y, ball.radius)
+                                for ball in balls], dtype=float).reshape(-1, 5)
+        return values.T
+    
+    def move(self, balls: List[Ball], dt: float, slow_motion: bool = False, width: int = SCREEN_WIDTH,
+             height: int = SCREEN_HEIGHT) -> List[int]:
+        """Ball.update for every ball; returns the indices of the balls now below height."""
+        np = self.np
+        x, y, vx, vy, radius = self._gather(balls)
+        effective_dt = dt * SLOW_MOTION_FACTOR if slow_motion else dt
+        new_x, new_y = x + vx * effective_dt, y + vy * effective_dt
+        sides = (new_x <= radius) | (new_x >= width - radius)
+        new_x = np.where(sides, np.maximum(radius, np.minimum(width - radius, new_x)), new_x)
+        tops = new_y <= radius
+        new_y = np.where(tops, radius, new_y)
         
-        # Handle paddle extension timer
-        if self.extended:
-            self.extend_timer -= dt
-            if self.extend_timer <= 0:
-                self.extended = False
-                self.width = self.original_width
+        for ball, old_x, old_y, ball_x, ball_y in zip(balls, x.tolist(), y.tolist(), new_x.tolist(), new_y.tolist()):
+            ball._trail[ball._trail_next] = (old_x, old_y)
+            ball._trail_next = (ball._trail_next + 1) % BALL_TRAIL_LENGTH
+            if ball._trail_count < BALL_TRAIL_LENGTH:
+                ball._trail_count += 1
+            ball.previous_position = ball.position
+            ball.position = Vector2D(ball_x, ball_y)
+        for i in np.flatnonzero(sides).tolist():
+            balls[i].velocity.x = -balls[i].velocity.x
+        for i in np.flatnonzero(tops).tolist():
+            balls[i].velocity.y = -balls[i].velocity.y
+        return np.flatnonzero(new_y > height).tolist()
     
-    def extend_paddle(self, duration: float) -> None:
-        """Activate paddle extension power-up."""
-        self.extended = True
-        self.extend_timer = duration
-        self.width = self.original_width * 1.5
+    def contacts(self, balls: List[Ball], paddle_rect: pygame.Rect,
+                 level: "Level") -> Tuple[List[int], List[Tuple[int, List[int]]]]:
+        """Find what every ball's rect touches.
+
+        Returns the indices of balls overlapping paddle_rect while moving
+        down, and for each ball overlapping any brick, standing or not, its
+        index with the overlapping brick indices in list order.
+        """
+        np = self.np
+        x, y, _, vy, radius = self._gather(balls)
+        # Ball rects as pygame builds them from floats: corners truncated toward zero
+        left, top = np.trunc(x - radius).astype(np.int64), np.trunc(y - radius).astype(np.int64)
+        size = (2 * radius).astype(np.int64)
+        right, bottom = left + size, top + size
+        paddle = ((left < paddle_rect.right) & (right > paddle_rect.left) & (top < paddle_rect.bottom)
+                  & (bottom > paddle_rect.top) & (vy > 0))
+        
+        if level.endless:
+            rects = np.array([(rect.left, rect.top, rect.right, rect.bottom)
+                              for rect in (block.get_rect() for block in level.blocks)], dtype=np.int64).reshape(-1, 4)
+            touching = ((left[:, None] < rects[None, :, 2]) & (rects[None, :, 0] < right[:, None])
+                        & (top[:, None] < rects[None, :, 3]) & (rects[None, :, 1] < bottom[:, None]))
+            ball_indices, block_indices = np.nonzero(touching)
+        else:
+            ball_indices, block_indices = self._grid_contacts(level, left, top, right, bottom)
+        
+        bricks: List[Tuple[int, List[int]]] = []
+        if len(ball_indices):
+            splits = np.flatnonzero(np.diff(ball_indices)) + 1
+            for ball_group, block_group in zip(np.split(ball_indices, splits), np.split(block_indices, splits)):
+                bricks.append((int(ball_group[0]), block_group.tolist()))
+        return np.flatnonzero(paddle).tolist(), bricks
     
-    def get_rect(self) -> pygame.Rect:
-        """Get paddle collision rectangle."""
-        return pygame.Rect(
-            self.position.x - self.width / 2,
-            self.position.y - self.height / 2,
-            self.width,
-            self.height
-        )
+    def _grid_contacts(self, level: "Level", left: Any, top: Any, right: Any, bottom: Any) -> Tuple[Any, Any]:
+        """(ball, brick) index pairs of overlapping rects through the level's grid, sorted."""
+        np = self.np
+        grid = level._broadphase()
+        if self._bricks is None or self._bricks[0] is not grid:
+            rects = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in grid.rects],
+                             dtype=np.int64).reshape(-1, 4)
+            moving = set(level.movers)
+            still = {cell: [i for i in indices if i not in moving] for cell, indices in grid.cells.items()}
+            cells = sorted(cell for cell, indices in still.items() if indices)
+            keys = np.array([self._key(column, row) for column, row in cells], dtype=np.int64)
+            counts = np.array([len(still[cell]) for cell in cells], dtype=np.int64)
+            members = np.array([i for cell in cells for i in still[cell]], dtype=np.int64)
+            starts = np.cumsum(counts) - counts
+            movers = np.array(level.movers, dtype=np.int64)
+            self._bricks = (grid, rects, keys, starts, counts, members, movers)
+        _, rects, keys, starts, counts, members, movers = self._bricks
+        
+        ball_parts, block_parts = [], []
+        if len(movers):
+            # Only the moving bricks' rows change; test every ball against each of them
+            mover_rects = [grid.rects[i] for i in level.movers]
+            rects[movers] = [(rect.left, rect.top, rect.right, rect.bottom) for rect in mover_rects]
+            moved = rects[movers]
+            touching = ((left[:, None] < moved[None, :, 2]) & (moved[None, :, 0] < right[:, None])
+                        & (top[:, None] < moved[None, :, 3]) & (moved[None, :, 1] < bottom[:, None]))
+            hit_balls, hit_movers = np.nonzero(touching)
+            ball_parts.append(hit_balls)
+            block_parts.append(movers[hit_movers])
+        if not len(keys):
+            return self._pairs(ball_parts, block_parts, len(rects))
+        
+        size = grid.cell_size
+        first_column, last_column = left // size, (right - 1) // size
+        first_row, last_row = top // size, (bottom - 1) // size
+        for dx in range(int((last_column - first_column).max()) + 1):
+            for dy in range(int((last_row - first_row).max()) + 1):
+                inside = np.flatnonzero((first_column + dx <= last_column) & (first_row + dy <= last_row))
+                cell_keys = self._key(first_column[inside] + dx, first_row[inside] + dy)
+                slots = np.minimum(np.searchsorted(keys, cell_keys), len(keys) - 1)
+                found = keys[slots] == cell_keys
+                inside, slots = inside[found], slots[found]
+                lengths = counts[slots]
+                total = int(lengths.sum())
+                offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                ball_parts.append(np.repeat(inside, lengths))
+                block_parts.append(members[np.repeat(starts[slots], lengths) + offsets])
+        ball_indices, block_indices = np.concatenate(ball_parts), np.concatenate(block_parts)
+        
+        block_rects = rects[block_indices]
+        overlap = ((left[ball_indices] < block_rects[:, 2]) & (block_rects[:, 0] < right[ball_indices])
+                   & (top[ball_indices] < block_rects[:, 3]) & (block_rects[:, 1] < bottom[ball_indices]))
+        return self._pairs([ball_indices[overlap]], [block_indices[overlap]], len(rects))
+    
+    def _pairs(self, ball_parts: List[Any], block_parts: List[Any], bricks: int) -> Tuple[Any, Any]:
+        """One entry per (ball, brick) pair, sorted by ball and then brick, however many cells they share."""
+        np = self.np
+        if not ball_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        pairs = np.unique(np.concatenate(ball_parts) * bricks + np.concatenate(block_parts))
+        return pairs // bricks, pairs % bricks
+    
+    @classmethod
+    def _key(cls, column: Any, row: Any) -> Any:
+        return (column + cls._KEY_OFFSET) * (2 * cls._KEY_OFFSET) + row + cls._KEY_OFFSET
+
+@dataclass(frozen=True)
+class Landing:
+    """Where and when a ball will next reach the paddle line."""
+    x: float
+    time: float  # Seconds of ball travel from where the ball is now
+    path: Tuple[Tuple[float, float], ...]  # Ball centre where predicted, at each bounce, then landing
+
+class LandingPredictor:
+    """Predicts where each ball will reach the paddle line.
+
+    The path is ray-cast from the ball in straight segments: the time to
+    the next side wall, the top wall or the paddle line is closed form,
+    and bricks are only looked up along that one segment through the
+    level's broadphase, swept by the ball's radius. The ball reflects off
+    whatever it meets first, and a brick with one hit left is dropped from
+    the rest of the path. Moving bricks are taken where they are now.
+
+    A prediction is cached per ball until its velocity changes, which
+    happens at every bounce, so each is recomputed from where the ball
+    really is; in between, the remaining time is read off how far along
+    its straight segment the ball has come.
+    """
+    
+    def __init__(self):
+        self._cache: "weakref.WeakKeyDictionary[Ball, Tuple[Any, ...]]" = weakref.WeakKeyDictionary()
+        self.computed = 0  # Paths traced rather than served from the cache
+    
+    def predict(self, ball: Ball, level: "Level", line_y: float) -> Optional[Landing]:
+        """Where ball will next reach line_y, or None if it does not within PREDICT_MAX_BOUNCES."""
+        velocity = (ball.velocity.x, ball.velocity.y)
+        cached = self._cache.get(ball)
+        if cached is None or cached[0] != velocity or cached[1] is not level or cached[2] != line_y:
+            landing = self._trace(ball, level, line_y)
+            self.computed += 1
+            cached = (velocity, level, line_y, ball.position.x, ball.position.y, landing)
+            self._cache[ball] = cached
+        landing = cached[5]
+        if landing is None:
+            return None
+        vx, vy = velocity
+        travelled = ((ball.position.x - cached[3]) * vx + (ball.position.y - cached[4]) * vy) / (vx * vx + vy * vy)
+        if not travelled:
+            return landing
+        return Landing(landing.x, max(0.0, landing.time - travelled),
+                       ((ball.position.x, ball.position.y),) + landing.path[1:])
     
-    def draw(self, screen: pygame.Surface) -> None:
+    @staticmethod
+    def _trace(ball: Ball, level: "Level", line_y: float) -> Optional[Landing]:
+        radius = ball.radius
+        x, y = ball.position.x, ball.position.y
+        vx, vy = ball.velocity.x, ball.velocity.y
+        path = [(x, y)]
+        spent: Set[int] = set()
+        elapsed = 0.0
+        for _ in range(PREDICT_MAX_BOUNCES + 1):
+            if vy > 0 and y >= line_y:
+                return Landing(x, elapsed, tuple(path))
+            # Closed-form times to the walls and the paddle line along this segment
+            wall = max(0.0, (level.width - radius - x) / vx if vx > 0 else (radius - x) / vx) if vx else math.inf
+            floor = max(0.0, (line_y - y) / vy if vy > 0 else (radius - y) / vy) if vy else math.inf
+            step = min(wall, floor)
+            if step == math.inf:
+                return None
+            brick = LandingPredictor._first_brick(level, x, y, vx, vy, step, radius, spent)
+            if brick:
+                step = brick[0]
+            x, y = x + vx * step, y + vy * step
+            elapsed += step
+            path.append((x, y))
+            if brick:
+                _, across, index = brick
+                if across:
+                    vx = -vx
+                else:
+                    vy = -vy
+                if level.blocks[index].hits_remaining <= 1:
+                    spent.add(index)
+            elif floor <= wall and vy > 0:
+                return Landing(x, elapsed, tuple(path))
+            else:
+                if wall <= floor:
+                    vx = -vx
+                if floor <= wall:
+                    vy = -vy
+        return None
+    
+    @staticmethod
+    def _first_brick(level: "Level", x: float, y: float, vx: float, vy: float, step: float, radius: int,
+                     spent: Set[int]) -> Optional[Tuple[float, bool, int]]:
+        """The first standing brick the ball meets within step: (time, hit from the side, index)."""
+        end_x, end_y = x + vx * step, y + vy * step
+        swept = pygame.Rect(min(x, end_x) - radius - 1, min(y, end_y) - radius - 1,
+                            abs(end_x - x) + 2 * radius + 3, abs(end_y - y) + 2 * radius + 3)
+        best: Optional[Tuple[float, bool, int]] = None
+        for block in level.blocks_in(swept):
+            index = level.index_of.get(block)
+            if index is None or index in spent:
+                continue
+            # Slab test of the ball's centre against the brick grown by the radius
+            rect = block.get_rect()
+            if vx:
+                near_x, far_x = sorted(((rect.left - radius - x) / vx, (rect.right + radius - x) / vx))
+            elif rect.left - radius < x < rect.right + radius:
+                near_x, far_x = -math.inf, math.inf
+            else:
+                continue
+            if vy:
+                near_y, far_y = sorted(((rect.top - radius - y) / vy, (rect.bottom + radius - y) / vy))
+            elif rect.top - radius < y < rect.bottom + radius:
+                near_y, far_y = -math.inf, math.inf
+            else:
+                continue
+            enter = max(near_x, near_y)
+            if 0.0 < enter < min(far_x, far_y) and enter <= step and (best is None or enter < best[0]):
+                best = (enter, near_x > near_y, index)
+        return best
+
+class PaddleSprites:
+    """Pre-rendered paddle images keyed by (width, extended, render scale, quality)."""
+    
+    _cache: Dict[Tuple[int, bool, float, QualityTier], pygame.Surface] = {}
+    
+    @classmethod
+    def get(cls, width: int, extended: bool, scale: float = 1.0,
+            quality: QualityTier = QualityTier.ULTRA) -> pygame.Surface:
+        """Get the paddle image for a width, rendering it on first use."""
+        key = (width, extended, scale, quality)
+        sprite = cls._cache.get(key)
+        if sprite is None:
+            with SPRITE_RENDER_LOCK:
+                sprite = cls._cache[key] = _prepare_sprite(cls._render(width, extended, quality), scale=scale)
+        return sprite
+    
+    @staticmethod
+    def _render(width: int, extended: bool, quality: QualityTier = QualityTier.ULTRA) -> pygame.Surface:
         """Draw the AWS-branded paddle with logo elements."""
-        rect = self.get_rect()
+        sprite = pygame.Surface((width, PADDLE_HEIGHT), pygame.SRCALPHA)
+        rect = sprite.get_rect()
         
         # Draw main paddle body with gradient effect
-        color = AWS_GREEN if self.extended else AWS_ORANGE
+        color = AWS_GREEN if extended else AWS_ORANGE
         
         # Create gradient effect
-        for i in range(rect.height):
-            gradient_color = tuple(max(0, c - i * 3) for c in color)
-            pygame.draw.rect(screen, gradient_color, 
-                           (rect.left, rect.top + i, rect.width, 1))
+        if quality.gradients:
+            for i in range(rect.height):
+                gradient_color = tuple(max(0, c - i * 3) for c in color)
+                pygame.draw.rect(sprite, gradient_color, 
+                               (rect.left, rect.top + i, rect.width, 1))
+        else:
+            sprite.fill(color)
         
         # Draw border
-        pygame.draw.rect(screen, AWS_WHITE, rect, 2)
+        pygame.draw.rect(sprite, AWS_WHITE, rect, 2)
+        
+        if not quality.icons:
+            return sprite
         
         # Draw AWS logo elements
         center_x, center_y = rect.centerx, rect.centery
@@ -295,7 +923,7 @@ class Paddle:
             smile_points.append((x, y))
         
         if len(smile_points) > 2:
-            pygame.draw.lines(screen, AWS_WHITE, False, smile_points, 2)
+            pygame.draw.lines(sprite, AWS_WHITE, False, smile_points, 2)
         
         # Draw arrow tip at the end of smile
         arrow_tip = [
@@ -303,14 +931,14 @@ class Paddle:
             (center_x + 28, center_y - 1),
             (center_x + 28, center_y + 3)
         ]
-        pygame.draw.polygon(screen, AWS_WHITE, arrow_tip)
+        pygame.draw.polygon(sprite, AWS_WHITE, arrow_tip)
         
         # Draw "AWS" text
-        if rect.width >= 80:  # Only draw text if paddle is wide enough
+        if rect.width >= 80 and quality.labels:  # Only draw text if paddle is wide enough
             font = pygame.font.Font(None, 16)
             aws_text = font.render("AWS", True, AWS_WHITE)
             text_rect = aws_text.get_rect(center=(center_x, center_y - 6))
-            screen.blit(aws_text, text_rect)
+            sprite.blit(aws_text, text_rect)
         
         # Add small dots representing cloud services
         dot_positions = [
@@ -322,30 +950,128 @@ class Paddle:
         
         for dot_x, dot_y in dot_positions:
             if rect.left < dot_x < rect.right:  # Only draw dots within paddle bounds
-                pygame.draw.circle(screen, AWS_WHITE, (int(dot_x), int(dot_y)), 1)
+                pygame.draw.circle(sprite, AWS_WHITE, (int(dot_x), int(dot_y)), 1)
+        
+        return sprite
+
+class Paddle:
+    """AWS Load Balancer - the player-controlled paddle."""
+    
+    def __init__(self, x: float, y: float):
+        self.position = Vector2D(x, y)
+        self.width = PADDLE_WIDTH
+        self.height = PADDLE_HEIGHT
+        self.speed = PADDLE_SPEED
+        self.extended = False
+        self.original_width = PADDLE_WIDTH
+        self.display_width = float(PADDLE_WIDTH)  # Drawn width, eases toward width
+        
+    def update(self, dt: float, keys_pressed: Dict, width: int = SCREEN_WIDTH) -> None:
+        """Update paddle position based on input, within a world width wide."""
+        # Handle movement
+        if keys_pressed[pygame.K_LEFT] or keys_pressed[pygame.K_a]:
+            self.position.x -= self.speed * dt
+        if keys_pressed[pygame.K_RIGHT] or keys_pressed[pygame.K_d]:
+            self.position.x += self.speed * dt
+            
+        # Keep paddle within screen bounds
+        self.position.x = max(self.width / 2, min(width - self.width / 2, self.position.x))
+        
+        # Ease the drawn width toward the real width
+        if self.display_width != self.width:
+            if PADDLE_SMOOTH_RESIZE:
+                step = self.original_width * 0.5 / PADDLE_RESIZE_TIME * dt
+                if abs(self.width - self.display_width) <= step:
+                    self.display_width = self.width
+                else:
+                    self.display_width += step if self.width > self.display_width else -step
+            else:
+                self.display_width = self.width
+    
+    def extend_paddle(self) -> None:
+        """Activate paddle extension power-up. Expiry is scheduled by the game."""
+        self.extended = True
+        self.width = self.original_width * 1.5
+    
+    def reset_extension(self) -> None:
+        """Cancel any active paddle extension."""
+        self.extended = False
+        self.width = self.original_width
+    
+    def get_rect(self) -> pygame.Rect:
+        """Get paddle collision rectangle."""
+        return pygame.Rect(
+            self.position.x - self.width / 2,
+            self.position.y - self.height / 2,
+            self.width,
+            self.height
+        )
+    
+    @property
+    def drawn_width(self) -> int:
+        """Width of the sprite to draw this frame."""
+        if self.display_width == self.width:
+            return int(self.width)
+        # Mid-transition widths snap to a few pre-rendered variants
+        return int(round(self.display_width / PADDLE_RESIZE_STEP) * PADDLE_RESIZE_STEP)
+    
+    def draw(self, screen: pygame.Surface, scale: float = 1.0,
+             quality: QualityTier = QualityTier.ULTRA) -> None:
+        """Draw the paddle from its cached sprite."""
+        width = self.drawn_width
+        sprite = PaddleSprites.get(width, self.extended, scale, quality)
+        screen.blit(sprite, (int((self.position.x - width / 2) * scale),
+                             int((self.position.y - self.height / 2) * scale)))
 
 class Block:
     """AWS Service block with different properties based on service type."""
     
+    # Rendered blocks keyed by (type, hits remaining, width, height, render scale, quality)
+    _sprites: Dict[Tuple[BlockType, int, int, int, float, QualityTier], pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, block_type: BlockType):
         self.position = Vector2D(x, y)
-        self.block_type = block_type
         self.width = BLOCK_WIDTH
         self.height = BLOCK_HEIGHT
+        self.velocity: Optional[Vector2D] = None  # None for blocks that stay put
+        self.bounds = (x, y, x, y)  # Left, top, right, bottom limits of a moving block's center
+        self.reset(block_type)
+    
+    def reset(self, block_type: BlockType) -> None:
+        """Make this an undamaged block of block_type, for blocks reused from a pool."""
+        self.block_type = block_type
         self.hits_remaining = block_type.value[1]
         self.max_hits = block_type.value[1]
         self.points = block_type.value[2]
         self.color = block_type.value[3]
         self.destroyed = False
         
-    def hit(self) -> Tuple[int, bool]:
+    def hit(self, damage: int = 1) -> Tuple[int, bool]:
         """Handle block being hit. Returns (points, destroyed)."""
-        self.hits_remaining -= 1
+        self.hits_remaining = max(0, self.hits_remaining - damage)
         if self.hits_remaining <= 0:
             self.destroyed = True
             return self.points, True
         return 0, False
     
+    def patrol(self, velocity: Vector2D, bounds: Tuple[float, float, float, float]) -> None:
+        """Make this a moving block that goes back and forth within bounds."""
+        self.velocity = velocity
+        self.bounds = bounds
+    
+    def move(self, dt: float) -> None:
+        """Advance a moving block, turning back at the edges of its bounds."""
+        position, velocity = self.position, self.velocity
+        left, top, right, bottom = self.bounds
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
+        if not left <= position.x <= right:
+            position.x = min(max(position.x, left), right)
+            velocity.x = -velocity.x
+        if not top <= position.y <= bottom:
+            position.y = min(max(position.y, top), bottom)
+            velocity.y = -velocity.y
+    
     def get_rect(self) -> pygame.Rect:
         """Get block collision rectangle."""
         return pygame.Rect(
@@ -355,34 +1081,60 @@ class Block:
             self.height
         )
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the AWS service block with service-specific icons."""
+    def draw(self, screen: pygame.Surface, scale: float = 1.0,
+             quality: QualityTier = QualityTier.ULTRA) -> None:
+        """Draw the block from its cached sprite."""
         if self.destroyed:
             return
-            
-        rect = self.get_rect()
+        
+        sprite = Block.sprite(self.block_type, self.hits_remaining, self.width, self.height, scale, quality)
+        screen.blit(sprite, (int((self.position.x - self.width / 2) * scale),
+                             int((self.position.y - self.height / 2) * scale)))
+    
+    @classmethod
+    def sprite(cls, block_type: BlockType, hits_remaining: int, width: int, height: int,
+               scale: float = 1.0, quality: QualityTier = QualityTier.ULTRA) -> pygame.Surface:
+        """Get the image of a block in a given state, rendering it on first use."""
+        key = (block_type, hits_remaining, width, height, scale, quality)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            template = cls(0, 0, block_type)
+            template.hits_remaining, template.width, template.height = hits_remaining, width, height
+            with SPRITE_RENDER_LOCK:
+                sprite = cls._sprites[key] = _prepare_sprite(template._render(quality), scale=scale)
+        return sprite
+    
+    def _render(self, quality: QualityTier = QualityTier.ULTRA) -> pygame.Surface:
+        """Draw the AWS service block with service-specific icons."""
+        screen = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        rect = screen.get_rect()
         
         # Calculate color intensity based on remaining hits
         intensity = self.hits_remaining / self.max_hits
         color = tuple(int(c * intensity) for c in self.color)
         
         # Draw block with gradient effect
-        for i in range(rect.height):
-            gradient_color = tuple(max(0, c - i * 2) for c in color)
-            pygame.draw.rect(screen, gradient_color, 
-                           (rect.left, rect.top + i, rect.width, 1))
+        if quality.gradients:
+            for i in range(rect.height):
+                gradient_color = tuple(max(0, c - i * 2) for c in color)
+                pygame.draw.rect(screen, gradient_color, 
+                               (rect.left, rect.top + i, rect.width, 1))
+        else:
+            screen.fill(color)
         
         # Draw border
         pygame.draw.rect(screen, AWS_WHITE, rect, 2)
         
         # Draw service-specific icon
-        self._draw_service_icon(screen, rect)
+        if quality.icons:
+            self._draw_service_icon(screen, rect)
         
         # Draw service name (smaller font to make room for icon)
-        font = pygame.font.Font(None, 12)
-        text = font.render(self.block_type.value[0], True, AWS_WHITE)
-        text_rect = text.get_rect(center=(rect.centerx, rect.bottom - 8))
-        screen.blit(text, text_rect)
+        if quality.labels:
+            font = pygame.font.Font(None, 12)
+            text = font.render(self.block_type.value[0], True, AWS_WHITE)
+            text_rect = text.get_rect(center=(rect.centerx, rect.bottom - 8))
+            screen.blit(text, text_rect)
         
         # Draw hit indicator
         if self.max_hits > 1:
@@ -390,6 +1142,8 @@ class Block:
             hit_text = hit_font.render(f"{self.hits_remaining}", True, AWS_WHITE)
             hit_rect = hit_text.get_rect(topright=(rect.right - 3, rect.top + 2))
             screen.blit(hit_text, hit_rect)
+        
+        return screen
     
     def _draw_service_icon(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
         """Draw service-specific icon based on block type."""
@@ -536,6 +1290,8 @@ class Block:
 class PowerUp:
     """Collectible power-up that falls from destroyed blocks."""
     
+    _sprites: Dict[Tuple[PowerUpType, float], pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, powerup_type: PowerUpType):
         self.position = Vector2D(x, y)
         self.powerup_type = powerup_type
@@ -543,13 +1299,15 @@ class PowerUp:
         self.width = 40
         self.height = 20
         self.collected = False
+        self.previous_position = self.position
         
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, height: int = SCREEN_HEIGHT) -> None:
         """Update power-up position."""
+        self.previous_position = self.position
         self.position = self.position + self.velocity * dt
         
-        # Remove if off screen
-        if self.position.y > SCREEN_HEIGHT:
+        # Remove once it falls out of a world height tall
+        if self.position.y > height:
             self.collected = True  # Mark for removal
     
     def get_rect(self) -> pygame.Rect:
@@ -561,12 +1319,34 @@ class PowerUp:
             self.height
         )
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the power-up."""
+    def render_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """Position alpha of the way from the previous update to the last one."""
+        return (_interpolate(self.previous_position.x, self.position.x, alpha),
+                _interpolate(self.previous_position.y, self.position.y, alpha))
+    
+    def draw(self, screen: pygame.Surface, scale: float = 1.0, alpha: float = 1.0) -> None:
+        """Draw the power-up from its cached sprite."""
         if self.collected:
             return
-            
-        rect = self.get_rect()
+        
+        x, y = self.render_position(alpha)
+        left, top = int(x - self.width / 2), int(y - self.height / 2)
+        screen.blit(PowerUp.sprite(self.powerup_type, scale), (int(left * scale), int(top * scale)))
+    
+    @classmethod
+    def sprite(cls, powerup_type: PowerUpType, scale: float = 1.0) -> pygame.Surface:
+        """Get the image of a power-up type, rendering it on first use."""
+        key = (powerup_type, scale)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            with SPRITE_RENDER_LOCK:
+                sprite = cls._sprites[key] = _prepare_sprite(cls(0, 0, powerup_type)._render(), scale=scale)
+        return sprite
+    
+    def _render(self) -> pygame.Surface:
+        """Draw the power-up."""
+        screen = pygame.Surface((self.width, self.height))
+        rect = screen.get_rect()
         
         # Draw power-up background
         pygame.draw.rect(screen, self.powerup_type.value[2], rect)
@@ -577,19 +1357,24 @@ class PowerUp:
         text = font.render(self.powerup_type.value[0][:8], True, AWS_WHITE)
         text_rect = text.get_rect(center=rect.center)
         screen.blit(text, text_rect)
+        return screen
 
 class Laser:
     """Laser projectile fired from paddle."""
     
+    _sprites: Dict[float, pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float):
         self.position = Vector2D(x, y)
         self.velocity = Vector2D(0, -400)  # Move upward
         self.width = 4
         self.height = 15
         self.active = True
+        self.previous_position = self.position
         
     def update(self, dt: float) -> None:
         """Update laser position."""
+        self.previous_position = self.position
         self.position = self.position + self.velocity * dt
         
         # Remove if off screen
@@ -605,18 +1390,37 @@ class Laser:
             self.height
         )
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def render_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """Position alpha of the way from the previous update to the last one."""
+        return (_interpolate(self.previous_position.x, self.position.x, alpha),
+                _interpolate(self.previous_position.y, self.position.y, alpha))
+    
+    def draw(self, screen: pygame.Surface, scale: float = 1.0, alpha: float = 1.0) -> None:
         """Draw the laser."""
         if not self.active:
             return
-            
-        rect = self.get_rect()
-        pygame.draw.rect(screen, AWS_RED, rect)
-        pygame.draw.rect(screen, AWS_WHITE, rect, 1)
+        
+        x, y = self.render_position(alpha)
+        left, top = int(x - self.width / 2), int(y - self.height / 2)
+        screen.blit(Laser.sprite(scale), (int(left * scale), int(top * scale)))
+    
+    @classmethod
+    def sprite(cls, scale: float = 1.0) -> pygame.Surface:
+        """Get the laser image, rendering it on first use."""
+        sprite = cls._sprites.get(scale)
+        if sprite is None:
+            template = cls(0, 0)
+            sprite = pygame.Surface((template.width, template.height))
+            sprite.fill(AWS_RED)
+            pygame.draw.rect(sprite, AWS_WHITE, sprite.get_rect(), 1)
+            sprite = cls._sprites[scale] = _prepare_sprite(sprite, alpha=False, scale=scale)
+        return sprite
 
 class Shield:
     """Protective barrier above paddle."""
     
+    _sprites: Dict[Tuple[int, int, float], pygame.Surface] = {}
+    
     def __init__(self, paddle_x: float, paddle_y: float, paddle_width: float):
         self.position = Vector2D(paddle_x, paddle_y - 30)
         self.width = paddle_width
@@ -645,12 +1449,30 @@ class Shield:
             return True
         return False
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the shield."""
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw the shield from its cached sprite."""
         if not self.active:
             return
-            
+        
         rect = self.get_rect()
+        screen.blit(Shield.sprite(rect.width, self.hits_remaining, scale), (int(rect.x * scale), int(rect.y * scale)))
+    
+    @classmethod
+    def sprite(cls, width: int, hits_remaining: int, scale: float = 1.0) -> pygame.Surface:
+        """Get the image of a shield in a given state, rendering it on first use."""
+        key = (width, hits_remaining, scale)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            template = cls(0, 0, width)
+            template.hits_remaining = hits_remaining
+            sprite = cls._sprites[key] = _prepare_sprite(template._render((width, template.height)),
+                                                         alpha=False, scale=scale)
+        return sprite
+    
+    def _render(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Draw the shield."""
+        screen = pygame.Surface(size)
+        rect = screen.get_rect()
         
         # Color based on remaining hits
         if self.hits_remaining == 3:
@@ -662,190 +1484,1391 @@ class Shield:
             
         pygame.draw.rect(screen, color, rect)
         pygame.draw.rect(screen, AWS_WHITE, rect, 2)
+        return screen
 
-class Level:
-    """Level data and block arrangements representing AWS architectures."""
+@dataclass
+class BlockHit:
+    """A ball, laser or chain reaction hit a block."""
+    block: Block
+    source: str  # "ball", "laser" or "chain"
+
+@dataclass
+class BlockDestroyed:
+    """A block lost its last hit point."""
+    block: Block
+    source: str = "ball"
+    multiplier: int = 1  # Score multiplier when it was hit, not when the batch is scored
+
+@dataclass
+class PaddleBounce:
+    """A ball bounced off the paddle."""
+    ball: Ball
+
+@dataclass
+class PowerUpCollected:
+    """The paddle caught a falling power-up."""
+    powerup_type: PowerUpType
+
+@dataclass
+class BallLost:
+    """A ball fell past the bottom of the screen."""
+    ball: Ball
+
+@dataclass
+class RowBreached:
+    """An endless-descent row slid past the danger line with bricks left."""
+    bricks: int
+
+@dataclass
+class LevelComplete:
+    """Every block in the level was destroyed."""
+    level_number: int
+
+class GameEventBus:
+    """Per-frame queue of gameplay events with batched delivery.
+
+    The physics pass only appends events. Once per frame dispatch() hands
+    each subscriber the whole batch of its event type, in EVENT_TYPES order,
+    so rule handlers (scoring, drops) run before LevelComplete and
+    presentation handlers can collapse a batch into a single sound.
+    """
     
-    def __init__(self, level_number: int):
-        self.level_number = level_number
-        self.blocks: List[Block] = []
-        self.completed = False
-        self.generate_level()
+    EVENT_TYPES = (BlockHit, BlockDestroyed, PaddleBounce, PowerUpCollected, BallLost, RowBreached, LevelComplete)
     
-    def generate_level(self) -> None:
-        """Generate blocks for the current level."""
-        self.blocks.clear()
-        
-        if self.level_number == 1:
-            self._generate_basic_level()
-        elif self.level_number == 2:
-            self._generate_web_app_level()
-        elif self.level_number == 3:
-            self._generate_serverless_level()
-        elif self.level_number == 4:
-            self._generate_ml_workflow_level()
-        else:
-            self._generate_advanced_level()
-    
-    def _generate_basic_level(self) -> None:
-        """Level 1: Basic S3 and Lambda blocks."""
-        start_x = BLOCK_WIDTH
-        start_y = 100
-        
-        # Row 1: S3 blocks
-        for i in range(8):
-            x = start_x + i * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y, BlockType.S3))
-        
-        # Row 2: Lambda blocks
-        for i in range(8):
-            x = start_x + i * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + BLOCK_HEIGHT + 10, BlockType.LAMBDA))
-    
-    def _generate_web_app_level(self) -> None:
-        """Level 2: Web application architecture."""
-        start_x = BLOCK_WIDTH
-        start_y = 80
-        
-        # Load balancer tier (API Gateway)
-        for i in range(6):
-            x = start_x + (i + 1) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y, BlockType.API_GATEWAY))
-        
-        # Compute tier (EC2)
-        for i in range(8):
-            x = start_x + i * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + (BLOCK_HEIGHT + 10), BlockType.EC2))
-        
-        # Database tier (RDS)
-        for i in range(4):
-            x = start_x + (i + 2) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + 2 * (BLOCK_HEIGHT + 10), BlockType.RDS))
-    
-    def _generate_serverless_level(self) -> None:
-        """Level 3: Serverless architecture with special blocks."""
-        start_x = BLOCK_WIDTH
-        start_y = 70
-        
-        # API Gateway
-        for i in range(6):
-            x = start_x + (i + 1) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y, BlockType.API_GATEWAY))
-        
-        # Lambda functions
-        for i in range(8):
-            x = start_x + i * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + (BLOCK_HEIGHT + 10), BlockType.LAMBDA))
-        
-        # Storage and monitoring
-        for i in range(6):
-            x = start_x + (i + 1) * (BLOCK_WIDTH + 5)
-            block_type = BlockType.S3 if i % 2 == 0 else BlockType.CLOUDWATCH
-            self.blocks.append(Block(x, start_y + 2 * (BLOCK_HEIGHT + 10), block_type))
-        
-        # Special blocks
-        self.blocks.append(Block(start_x + 3 * (BLOCK_WIDTH + 5), 
-                                start_y + 3 * (BLOCK_HEIGHT + 10), BlockType.Q_DEVELOPER))
-        self.blocks.append(Block(start_x + 5 * (BLOCK_WIDTH + 5), 
-                                start_y + 3 * (BLOCK_HEIGHT + 10), BlockType.AUTO_SCALING))
-    
-    def _generate_ml_workflow_level(self) -> None:
-        """Level 4: Machine learning workflow."""
-        start_x = BLOCK_WIDTH
-        start_y = 60
-        
-        # Data ingestion (S3)
-        for i in range(8):
-            x = start_x + i * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y, BlockType.S3))
-        
-        # ML processing (SageMaker)
-        for i in range(6):
-            x = start_x + (i + 1) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + (BLOCK_HEIGHT + 10), BlockType.SAGEMAKER))
-        
-        # AI services (Bedrock)
-        for i in range(4):
-            x = start_x + (i + 2) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + 2 * (BLOCK_HEIGHT + 10), BlockType.BEDROCK))
-        
-        # Infrastructure (EKS)
-        for i in range(6):
-            x = start_x + (i + 1) * (BLOCK_WIDTH + 5)
-            self.blocks.append(Block(x, start_y + 3 * (BLOCK_HEIGHT + 10), BlockType.EKS))
-        
-        # Special blocks
-        self.blocks.append(Block(start_x + 2 * (BLOCK_WIDTH + 5), 
-                                start_y + 4 * (BLOCK_HEIGHT + 10), BlockType.CLOUDFORMATION))
-    
-    def _generate_advanced_level(self) -> None:
-        """Advanced levels with mixed architectures."""
-        start_x = BLOCK_WIDTH
-        start_y = 50
-        
-        # Create a complex pattern with all block types
-        block_types = list(BlockType)
-        
-        for row in range(6):
-            blocks_in_row = 8 - (row % 3)  # Varying row lengths
-            start_offset = (8 - blocks_in_row) // 2
-            
-            for col in range(blocks_in_row):
-                x = start_x + (start_offset + col) * (BLOCK_WIDTH + 5)
-                y = start_y + row * (BLOCK_HEIGHT + 10)
-                
-                # Select block type based on position and level
-                type_index = (row * blocks_in_row + col + self.level_number) % len(block_types)
-                block_type = block_types[type_index]
-                
-                self.blocks.append(Block(x, y, block_type))
+    def __init__(self):
+        self._queue: List[Any] = []
+        self._subscribers: Dict[type, List[Callable[[List[Any]], None]]] = {
+            event_type: [] for event_type in self.EVENT_TYPES
+        }
     
-    def is_complete(self) -> bool:
-        """Check if all blocks are destroyed."""
-        return all(block.destroyed for block in self.blocks)
+    def subscribe(self, event_type: type, handler: Callable[[List[Any]], None]) -> None:
+        """Deliver batches of event_type to handler."""
+        self._subscribers[event_type].append(handler)
     
-    def get_remaining_blocks(self) -> int:
+    def unsubscribe(self, event_type: type, handler: Callable[[List[Any]], None]) -> None:
+        """Stop delivering event_type to handler."""
+        self._subscribers[event_type].remove(handler)
+    
+    def emit(self, event: Any) -> None:
+        """Queue an event for the next dispatch."""
+        self._queue.append(event)
+    
+    def pending(self) -> int:
+        """Get the number of queued events."""
+        return len(self._queue)
+    
+    def clear(self) -> None:
+        """Drop queued events without delivering them."""
+        self._queue.clear()
+    
+    def dispatch(self) -> None:
+        """Deliver every queued event to its subscribers in batches."""
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, []
+        batches: Dict[type, List[Any]] = {}
+        for event in queue:
+            batches.setdefault(type(event), []).append(event)
+        for event_type in self.EVENT_TYPES:
+            batch = batches.get(event_type)
+            if batch:
+                for handler in self._subscribers[event_type]:
+                    handler(batch)
+
+class GameScheduler:
+    """Game-time scheduler for timed effects and cooldowns.
+
+    Timers live in a min-heap ordered by deadline, so advancing the clock
+    only touches timers that are due. Each timer key has registered
+    activation and expiry callbacks; restarting a key replaces its deadline
+    and the stale heap entry is skipped when popped. Timer state is plain
+    data and can be saved and restored as long as the same keys are
+    registered on the receiving side.
+    """
+    
+    def __init__(self):
+        self.time = 0.0
+        self.time_scale = 1.0
+        self.paused = False
+        self._heap: List[Tuple[float, int, str]] = []
+        self._deadlines: Dict[str, Tuple[float, int]] = {}
+        self._handlers: Dict[str, Tuple[Optional[Callable[[], None]], Optional[Callable[[], None]]]] = {}
+        self._sequence = 0
+    
+    def register(self, key: str, on_expire: Optional[Callable[[], None]] = None,
+                 on_activate: Optional[Callable[[], None]] = None) -> None:
+        """Register the callbacks fired when a timer starts and expires."""
+        self._handlers[key] = (on_activate, on_expire)
+    
+    def start(self, key: str, duration: float) -> None:
+        """Start (or restart) a timer and fire its activation callback."""
+        self.set_remaining(key, duration)
+        on_activate = self._handlers[key][0]
+        if on_activate:
+            on_activate()
+    
+    def is_registered(self, key: str) -> bool:
+        return key in self._handlers
+    
+    def set_remaining(self, key: str, duration: float) -> None:
+        """Set a timer's remaining time without firing any callback."""
+        assert key in self._handlers, f"Unregistered timer: {key}"
+        if duration <= 0:
+            self.cancel(key)
+            return
+        self._sequence += 1
+        deadline = self.time + duration
+        self._deadlines[key] = (deadline, self._sequence)
+        heapq.heappush(self._heap, (deadline, self._sequence, key))
+    
+    def cancel(self, key: str) -> None:
+        """Stop a timer without firing its expiry callback."""
+        self._deadlines.pop(key, None)
+    
+    def clear(self) -> None:
+        """Stop every timer without firing callbacks."""
+        self._deadlines.clear()
+        self._heap.clear()
+    
+    def is_active(self, key: str) -> bool:
+        """Check whether a timer is running."""
+        return key in self._deadlines
+    
+    def remaining(self, key: str) -> float:
+        """Get a timer's remaining game time, or 0 if it is not running."""
+        deadline = self._deadlines.get(key)
+        return max(0.0, deadline[0] - self.time) if deadline else 0.0
+    
+    def advance(self, dt: float) -> None:
+        """Advance game time and fire expiry callbacks of due timers in order."""
+        if self.paused:
+            return
+        self.time += dt * self.time_scale
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            deadline, sequence, key = heapq.heappop(heap)
+            if self._deadlines.get(key) != (deadline, sequence):
+                continue  # Restarted or cancelled since this entry was pushed
+            del self._deadlines[key]
+            on_expire = self._handlers[key][1]
+            if on_expire:
+                on_expire()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize clock and running timers."""
+        return {
+            "time": self.time,
+            "time_scale": self.time_scale,
+            "paused": self.paused,
+            "timers": {key: self.remaining(key) for key in self._deadlines},
+        }
+    
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """Restore state written by to_dict. Callbacks are not fired."""
+        self.clear()
+        self.time = data["time"]
+        self.time_scale = data["time_scale"]
+        self.paused = data["paused"]
+        for key, remaining in data["timers"].items():
+            self.set_remaining(key, remaining)
+
+class PowerUpTimers(MutableMapping):
+    """Dict-style view of power-up remaining times backed by a GameScheduler.
+
+    Reading gives the remaining seconds (0 when inactive). Assigning
+    reschedules the expiry without re-applying the power-up effect.
+    """
+    
+    def __init__(self, scheduler: GameScheduler):
+        self.scheduler = scheduler
+    
+    @staticmethod
+    def key(powerup_type: PowerUpType) -> str:
+        return f"powerup.{powerup_type.name}"
+    
+    def __getitem__(self, powerup_type: PowerUpType) -> float:
+        return self.scheduler.remaining(self.key(powerup_type))
+    
+    def __setitem__(self, powerup_type: PowerUpType, remaining: float) -> None:
+        self.scheduler.set_remaining(self.key(powerup_type), remaining)
+    
+    def __delitem__(self, powerup_type: PowerUpType) -> None:
+        self.scheduler.cancel(self.key(powerup_type))
+    
+    def __iter__(self) -> Iterator[PowerUpType]:
+        return iter(PowerUpType)
+    
+    def __len__(self) -> int:
+        return len(PowerUpType)
+
+class EntityRegistry:
+    """Central owner of every transient game entity.
+
+    All paddles, balls, power-ups, lasers and shields are created through the
+    registry and belong to a scope. Tearing down a scope releases every entity
+    of the kinds living in it, so nothing leaks from one level or game into
+    the next.
+    """
+    
+    # kind -> (entity class, scope, maximum live count or None)
+    KINDS: Dict[str, Tuple[type, EntityScope, Optional[int]]] = {
+        "paddles": (Paddle, EntityScope.GAME, 1),
+        "balls": (Ball, EntityScope.LEVEL, None),
+        "powerups": (PowerUp, EntityScope.LEVEL, None),
+        "lasers": (Laser, EntityScope.LEVEL, None),
+        "shields": (Shield, EntityScope.LEVEL, 1),
+    }
+    
+    def __init__(self):
+        self.paddles: List[Paddle] = []
+        self.balls: List[Ball] = []
+        self.powerups: List[PowerUp] = []
+        self.lasers: List[Laser] = []
+        self.shields: List[Shield] = []
+        self.created = 0
+    
+    def get(self, kind: str) -> List[Any]:
+        """Get the live entity list for a kind."""
+        assert kind in self.KINDS, f"Unknown entity kind: {kind}"
+        return getattr(self, kind)
+    
+    def spawn(self, kind: str, entity: Any) -> Any:
+        """Register a newly created entity and return it."""
+        entity_class, _, limit = self.KINDS[kind]
+        assert isinstance(entity, entity_class), f"{entity!r} is not a {entity_class.__name__}"
+        entities = self.get(kind)
+        if limit is not None and len(entities) >= limit:
+            # Single-slot kinds replace their current occupant
+            entities.clear()
+        entities.append(entity)
+        self.created += 1
+        return entity
+    
+    def release(self, kind: str, entity: Any) -> None:
+        """Remove a single entity."""
+        self.get(kind).remove(entity)
+    
+    def teardown(self, scope: EntityScope) -> None:
+        """Release every entity in the given scope.
+
+        Game teardown also releases level-scoped entities, since a level
+        never outlives the game it belongs to.
+        """
+        for kind, (_, kind_scope, _) in self.KINDS.items():
+            if scope == EntityScope.GAME or kind_scope == scope:
+                self.get(kind).clear()
+    
+    def counts(self) -> Dict[str, int]:
+        """Get the live count of every entity kind."""
+        return {kind: len(self.get(kind)) for kind in self.KINDS}
+    
+    def assert_consistent(self) -> None:
+        """Check every live entity against its kind's class and limit."""
+        for kind, (entity_class, _, limit) in self.KINDS.items():
+            entities = self.get(kind)
+            assert limit is None or len(entities) <= limit, f"Too many {kind}: {len(entities)}"
+            for entity in entities:
+                assert isinstance(entity, entity_class), f"{entity!r} found among {kind}"
+    
+    def assert_torn_down(self, scope: EntityScope) -> None:
+        """Check that no entity of the given scope survived teardown."""
+        for kind, (_, kind_scope, _) in self.KINDS.items():
+            if scope == EntityScope.GAME or kind_scope == scope:
+                assert not self.get(kind), f"{len(self.get(kind))} {kind} leaked past {scope.value} teardown"
+
+# Level file brick codes; '.' is an empty cell
+LEVEL_CODES: Dict[str, BlockType] = {
+    "S": BlockType.S3, "L": BlockType.LAMBDA, "W": BlockType.CLOUDWATCH,
+    "E": BlockType.EC2, "R": BlockType.RDS, "A": BlockType.API_GATEWAY,
+    "K": BlockType.EKS, "M": BlockType.SAGEMAKER, "B": BlockType.BEDROCK,
+    "Q": BlockType.Q_DEVELOPER, "F": BlockType.CLOUDFORMATION, "U": BlockType.AUTO_SCALING,
+}
+
+def level_cell_position(column: int, row: int, top: int) -> Tuple[int, int]:
+    """Center of the brick in a level grid cell."""
+    return BLOCK_WIDTH + column * (BLOCK_WIDTH + 5), top + row * (BLOCK_HEIGHT + 10)
+
+def _in_play_area(x: float, y: float) -> bool:
+    """Whether a brick centered at (x, y) lies within the top half of the screen."""
+    return (BLOCK_WIDTH / 2 <= x <= SCREEN_WIDTH - BLOCK_WIDTH / 2
+            and BLOCK_HEIGHT / 2 <= y <= SCREEN_HEIGHT // 2 - BLOCK_HEIGHT / 2)
+
+class LevelFormatError(ValueError):
+    """A level file or compiled level that does not describe a valid level."""
+
+@dataclass
+class LevelData:
+    """A compiled level: brick types and center positions as packed arrays.
+
+    types index BlockType in declaration order. With rotate set, each type
+    moves on by the level number, so one layout serves every advanced level.
+    Bricks flagged in sliding move with their row from wall to wall, every
+    other row setting off the other way; the rest patrol if their type has
+    a BRICK_MOTIONS entry.
+    """
+    name: str
+    rotate: bool
+    types: array.array  # "B"
+    xs: array.array     # "h"
+    ys: array.array     # "h"
+    sliding: array.array = field(default_factory=lambda: array.array("B"))  # Per brick, or empty for none
+    
+    def blocks(self, level_number: int) -> List[Block]:
+        """Create the level's blocks, moving ones already patrolling."""
+        block_types = tuple(BlockType)
+        shift = level_number if self.rotate else 0
+        blocks = [Block(x, y, block_types[(type_index + shift) % len(block_types)])
+                  for type_index, x, y in zip(self.types, self.xs, self.ys)]
+        
+        rows: Dict[float, List[Block]] = {}
+        for block, slides in zip(blocks, self.sliding):
+            if slides:
+                rows.setdefault(block.position.y, []).append(block)
+        for number, y in enumerate(sorted(rows)):
+            row = rows[y]
+            low = BLOCK_WIDTH / 2 - min(block.position.x for block in row)
+            high = SCREEN_WIDTH - BLOCK_WIDTH / 2 - max(block.position.x for block in row)
+            speed = LEVEL_SLIDE_SPEED if number % 2 == 0 else -LEVEL_SLIDE_SPEED
+            for block in row:
+                block.patrol(Vector2D(speed, 0.0), (block.position.x + low, y, block.position.x + high, y))
+        
+        for block in blocks:
+            motion = BRICK_MOTIONS.get(block.block_type)
+            if motion is not None and block.velocity is None:
+                (x, y), (reach_x, reach_y) = (block.position.x, block.position.y), motion.reach
+                block.patrol(Vector2D(*motion.velocity), (x - reach_x, y - reach_y, x + reach_x, y + reach_y))
+        return blocks
+    
+    def validate(self) -> List[str]:
+        """Describe everything wrong with the level; empty if it is playable."""
+        problems = []
+        if not self.types:
+            problems.append("no bricks")
+        if not len(self.types) == len(self.xs) == len(self.ys) or self.sliding and len(self.sliding) != len(self.types):
+            problems.append("brick arrays differ in length")
+        if any(type_index >= len(BlockType) for type_index in self.types):
+            problems.append("unknown brick type")
+        positions = list(zip(self.xs, self.ys))
+        if len(set(positions)) != len(positions):
+            problems.append("overlapping bricks")
+        off = sum(not _in_play_area(x, y) for x, y in positions)
+        if off:
+            problems.append(f"{off} bricks off the play area")
+        return problems
+
+class LevelLoader:
+    """Loads level files, compiling them to a cached binary form.
+
+    A level file is a "key: value" header (name, top, optional rotate and
+    slide, the grid rows that slide, counted from 1) followed by a grid of
+    LEVEL_CODES letters, one row of bricks per line; '#' lines are
+    comments. Cells are BLOCK_WIDTH + 5 pixels apart across and
+    BLOCK_HEIGHT + 10 down, from x = BLOCK_WIDTH and y = top.
+
+    Compiled levels live in LEVEL_CACHE_DIR beside the sources, named by a
+    hash of the source text, so an edited file is recompiled on next load
+    and an unchanged one is a single read into packed arrays. Each level
+    is loaded at most once per loader.
+    """
+    
+    HEADER_KEYS = ("name", "top", "rotate", "slide")
+    
+    def __init__(self, directory: str = LEVELS_DIR):
+        self.directory = directory
+        self.compiled = 0  # Levels compiled from source rather than read from the cache
+        self._loaded: Dict[str, LevelData] = {}
+    
+    def load(self, name: str) -> LevelData:
+        """Get a level by file name (without extension)."""
+        level = self._loaded.get(name)
+        if level is None:
+            level = self._loaded[name] = self._load(name)
+        return level
+    
+    def _load(self, name: str) -> LevelData:
+        source_path = os.path.join(self.directory, name + ".level")
+        with open(source_path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()[:16]
+        cache_dir = os.path.join(self.directory, LEVEL_CACHE_DIR)
+        cache_path = os.path.join(cache_dir, f"{name}.{digest}.bin")
+        
+        try:
+            with open(cache_path, "rb") as f:
+                return self.decode(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, LevelFormatError) as e:
+            print(f"Warning: Recompiling level {name}: {e}")
+        
+        level = self.parse(source.decode("utf-8"), source_path)
+        self.compiled += 1
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale in os.listdir(cache_dir):
+                if stale.startswith(name + ".") and stale.endswith(".bin"):
+                    os.remove(os.path.join(cache_dir, stale))
+            temporary = cache_path + ".tmp"
+            with open(temporary, "wb") as f:
+                f.write(self.encode(level))
+            os.replace(temporary, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not cache compiled level {name}: {e}")
+        return level
+    
+    @classmethod
+    def parse(cls, text: str, source: str = "<level>") -> LevelData:
+        """Validate level file text and compile it to a LevelData."""
+        header: Dict[str, str] = {}
+        rows: List[Tuple[int, str]] = []
+        for line_number, line in enumerate(text.splitlines(), 1):
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            if ":" in line and not rows:
+                key, value = (part.strip() for part in line.split(":", 1))
+                if key not in cls.HEADER_KEYS:
+                    raise LevelFormatError(f"{source}:{line_number}: unknown header '{key}'")
+                header[key] = value
+                continue
+            rows.append((line_number, line))
+        
+        if "top" not in header:
+            raise LevelFormatError(f"{source}: missing 'top' header")
+        try:
+            top = int(header["top"])
+        except ValueError:
+            raise LevelFormatError(f"{source}: 'top' must be a whole number of pixels") from None
+        rotate = header.get("rotate", "false").lower()
+        if rotate not in ("true", "false"):
+            raise LevelFormatError(f"{source}: 'rotate' must be true or false")
+        try:
+            slide = {int(row) - 1 for row in header.get("slide", "").replace(",", " ").split()}
+        except ValueError:
+            raise LevelFormatError(f"{source}: 'slide' must list grid row numbers") from None
+        if any(not 0 <= row < len(rows) for row in slide):
+            raise LevelFormatError(f"{source}: 'slide' names a row the level does not have")
+        
+        block_types = tuple(BlockType)
+        types, xs, ys, sliding = array.array("B"), array.array("h"), array.array("h"), array.array("B")
+        for row, (line_number, line) in enumerate(rows):
+            for column, code in enumerate(line):
+                if code == ".":
+                    continue
+                if code not in LEVEL_CODES:
+                    raise LevelFormatError(f"{source}:{line_number}: unknown brick '{code}' in column {column + 1}")
+                x, y = level_cell_position(column, row, top)
+                if not _in_play_area(x, y):
+                    raise LevelFormatError(f"{source}:{line_number}: brick in column {column + 1} is off the play area")
+                types.append(block_types.index(LEVEL_CODES[code]))
+                xs.append(x)
+                ys.append(y)
+                sliding.append(row in slide)
+        if not types:
+            raise LevelFormatError(f"{source}: level has no bricks")
+        return LevelData(header.get("name", ""), rotate == "true", types, xs, ys, sliding if slide else array.array("B"))
+    
+    @staticmethod
+    def encode(level: LevelData) -> bytes:
+        """Pack a compiled level into its binary form."""
+        writer = _StateWriter()
+        writer.pack("4sHB", LEVEL_MAGIC, LEVEL_FORMAT_VERSION, level.rotate)
+        writer.string(level.name)
+        writer.array("B", level.types)
+        writer.array("h", level.xs)
+        writer.array("h", level.ys)
+        writer.array("B", level.sliding)
+        return writer.getvalue()
+    
+    @staticmethod
+    def decode(data: bytes) -> LevelData:
+        """Unpack a level written by encode."""
+        reader = _StateReader(data)
+        try:
+            magic, version, rotate = reader.unpack("4sHB")
+            if magic != LEVEL_MAGIC or version != LEVEL_FORMAT_VERSION:
+                raise LevelFormatError("not a compiled level of this version")
+            level = LevelData(reader.string(), bool(rotate), reader.array("B"), reader.array("h"), reader.array("h"),
+                              reader.array("B"))
+        except (SaveStateError, struct.error) as e:
+            raise LevelFormatError(f"corrupt compiled level: {e}") from e
+        if (not reader.at_end() or not len(level.types) == len(level.xs) == len(level.ys)
+                or level.sliding and len(level.sliding) != len(level.types)):
+            raise LevelFormatError("corrupt compiled level")
+        if any(type_index >= len(BlockType) for type_index in level.types):
+            raise LevelFormatError("corrupt compiled level: unknown brick type")
+        return level
+
+# Service tiers of a generated architecture, top to bottom
+ARCHITECTURE_TIERS: Tuple[Tuple[BlockType, ...], ...] = (
+    (BlockType.API_GATEWAY, BlockType.CLOUDWATCH),          # Edge
+    (BlockType.LAMBDA, BlockType.EC2, BlockType.EKS),       # Compute
+    (BlockType.S3, BlockType.RDS),                          # Data
+    (BlockType.SAGEMAKER, BlockType.BEDROCK),               # Machine learning
+)
+SPECIAL_SERVICES = (BlockType.Q_DEVELOPER, BlockType.AUTO_SCALING, BlockType.CLOUDFORMATION)
+FORTRESS_SERVICES = (BlockType.EKS, BlockType.BEDROCK, BlockType.CLOUDFORMATION)
+
+class LevelGenerator:
+    """Seeded procedural layouts for the levels after the hand-made ones.
+
+    Each layout is mirrored about the middle column and drawn from one of
+    three patterns: tiers (a row of one service per architecture tier),
+    clusters (diamonds of one service) and fortress (tiers behind a wall of
+    tough bricks with gates). Difficulty grows with the level number: more
+    rows, denser rows, tougher services and more fortresses. The same
+    (seed, level number) always gives the same layout; the most recent
+    cache_size layouts are kept, least recently used dropped first.
+    """
+    
+    PATTERNS = ("tiers", "clusters", "fortress")
+    
+    def __init__(self, cache_size: int = LEVEL_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[int, int], LevelData]" = OrderedDict()
+        self._lock = threading.Lock()  # Used from the level preload worker too
+    
+    def get(self, seed: int, level_number: int) -> LevelData:
+        """Get the layout for (seed, level_number), generating it on first use."""
+        key = (seed, level_number)
+        with self._lock:
+            level = self._cache.get(key)
+            if level is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return level
+        
+        level = self.generate(seed, level_number)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = level
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return level
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+    
+    @classmethod
+    def generate(cls, seed: int, level_number: int) -> LevelData:
+        """Generate a layout without touching the cache."""
+        rng = random.Random(f"{seed}/{level_number}")
+        difficulty = max(1, level_number - len(LEVEL_FILES))
+        rows = min(LEVEL_GRID_ROWS, 3 + (difficulty + 1) // 2)
+        pattern = rng.choices(cls.PATTERNS, (3, 2, min(4, difficulty // 2)))[0]
+        grid: List[List[Optional[BlockType]]] = [[None] * LEVEL_GRID_COLUMNS for _ in range(rows)]
+        getattr(cls, "_" + pattern)(rng, grid, difficulty)
+        
+        if sum(cell is not None for row in grid for cell in row) < LEVEL_MIN_BRICKS:
+            grid[0] = [cls._service(rng, 0, difficulty)] * LEVEL_GRID_COLUMNS
+        
+        slide = {row for row in range(rows) if rng.random() < min(0.3, 0.03 * difficulty)}
+        
+        block_types = tuple(BlockType)
+        types, xs, ys, sliding = array.array("B"), array.array("h"), array.array("h"), array.array("B")
+        for row, cells in enumerate(grid):
+            for column, block_type in enumerate(cells):
+                if block_type is not None:
+                    x, y = level_cell_position(column, row, LEVEL_GENERATED_TOP)
+                    types.append(block_types.index(block_type))
+                    xs.append(x)
+                    ys.append(y)
+                    sliding.append(row in slide)
+        return LevelData(f"{pattern.title()} {level_number}", False, types, xs, ys,
+                         sliding if slide else array.array("B"))
+    
+    @staticmethod
+    def _service(rng: random.Random, tier: int, difficulty: int) -> BlockType:
+        """Pick a service from a tier, favouring its toughest as difficulty grows."""
+        options = ARCHITECTURE_TIERS[tier]
+        if rng.random() < min(0.8, 0.12 * difficulty):
+            return max(options, key=lambda block_type: block_type.value[1])
+        return rng.choice(options)
+    
+    @staticmethod
+    def _place(grid: List[List[Optional[BlockType]]], row: int, column: int,
+               block_type: Optional[BlockType]) -> None:
+        """Set a cell and its mirror image."""
+        grid[row][column] = grid[row][LEVEL_GRID_COLUMNS - 1 - column] = block_type
+    
+    @classmethod
+    def _tiers(cls, rng: random.Random, grid: List[List[Optional[BlockType]]], difficulty: int) -> None:
+        density = min(0.95, 0.55 + 0.04 * difficulty)
+        for row in range(len(grid)):
+            service = cls._service(rng, row * len(ARCHITECTURE_TIERS) // len(grid), difficulty)
+            for column in range(LEVEL_GRID_COLUMNS // 2 + 1):
+                if rng.random() < density:
+                    cls._place(grid, row, column, service)
+        if rng.random() < 0.5:
+            cls._place(grid, rng.randrange(len(grid)), LEVEL_GRID_COLUMNS // 2, rng.choice(SPECIAL_SERVICES))
+    
+    @classmethod
+    def _clusters(cls, rng: random.Random, grid: List[List[Optional[BlockType]]], difficulty: int) -> None:
+        half = LEVEL_GRID_COLUMNS // 2 + 1
+        for _ in range(min(6, 2 + difficulty // 3)):
+            center_row, center_column = rng.randrange(len(grid)), rng.randrange(half)
+            radius = rng.choice((1, 1, 2))
+            service = cls._service(rng, rng.randrange(len(ARCHITECTURE_TIERS)), difficulty)
+            for row in range(max(0, center_row - radius), min(len(grid), center_row + radius + 1)):
+                for column in range(max(0, center_column - radius), min(half, center_column + radius + 1)):
+                    if abs(row - center_row) + abs(column - center_column) <= radius:
+                        cls._place(grid, row, column, service)
+            if rng.random() < 0.3:
+                cls._place(grid, center_row, center_column, rng.choice(SPECIAL_SERVICES))
+    
+    @classmethod
+    def _fortress(cls, rng: random.Random, grid: List[List[Optional[BlockType]]], difficulty: int) -> None:
+        cls._tiers(rng, grid[:-1], difficulty)
+        wall = rng.choice(FORTRESS_SERVICES)
+        grid[-1] = [wall] * LEVEL_GRID_COLUMNS
+        for _ in range(max(1, 3 - difficulty // 4)):
+            cls._place(grid, len(grid) - 1, rng.randrange(LEVEL_GRID_COLUMNS // 2 + 1), None)
+        if difficulty >= 4:
+            for row in range(len(grid) - 1):
+                cls._place(grid, row, 0, wall)
+
+    @classmethod
+    def row(cls, seed: int, index: int) -> List[Optional[BlockType]]:
+        """Row index of an endless descent: one tier's service, or a fortress wall."""
+        rng = random.Random(f"{seed}/row/{index}")
+        difficulty = 1 + index // DESCENT_ROWS_PER_STAGE
+        grid: List[List[Optional[BlockType]]] = [[None] * LEVEL_GRID_COLUMNS]
+        if index % DESCENT_FORTRESS_EVERY == DESCENT_FORTRESS_EVERY - 1:
+            grid[0] = [rng.choice(FORTRESS_SERVICES)] * LEVEL_GRID_COLUMNS
+            cls._place(grid, 0, rng.randrange(LEVEL_GRID_COLUMNS // 2 + 1), None)
+            return grid[0]
+        service = cls._service(rng, index // 3 % len(ARCHITECTURE_TIERS), difficulty)
+        density = min(0.9, 0.45 + 0.03 * difficulty)
+        for column in range(LEVEL_GRID_COLUMNS // 2 + 1):
+            if rng.random() < density:
+                cls._place(grid, 0, column, service)
+        if rng.random() < 0.1:
+            cls._place(grid, 0, LEVEL_GRID_COLUMNS // 2, rng.choice(SPECIAL_SERVICES))
+        return grid[0]
+
+def _pregenerate_chunk(seed: int, level_numbers: List[int]) -> List[Tuple[int, int, List[str]]]:
+    """Generate and validate levels; (level number, brick count, problems) for each."""
+    results = []
+    for level_number in level_numbers:
+        level = LevelGenerator.generate(seed, level_number)
+        results.append((level_number, len(level.types), level.validate()))
+    return results
+
+def pregenerate_levels(count: int, seed: int = 0, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Generate and validate count procedural levels across worker processes."""
+    if count < 1:
+        raise ValueError(f"Levels to pregenerate must be at least 1, got {count}")
+    first = len(LEVEL_FILES) + 1
+    level_numbers = list(range(first, first + count))
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-count // (workers * 4)))
+    chunks = [level_numbers[i:i + chunk_size] for i in range(0, count, chunk_size)]
+    
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        results = [result for chunk in pool.map(_pregenerate_chunk, [seed] * len(chunks), chunks)
+                   for result in chunk]
+    elapsed = time.perf_counter() - start
+    
+    invalid = [(level_number, problems) for level_number, _, problems in results if problems]
+    for level_number, problems in invalid[:10]:
+        print(f"Warning: Generated level {level_number} is invalid: {'; '.join(problems)}")
+    bricks = [brick_count for _, brick_count, _ in results]
+    return {
+        "levels": len(results),
+        "workers": workers,
+        "seconds": elapsed,
+        "levels_per_s": len(results) / elapsed,
+        "invalid": len(invalid),
+        "bricks_min": min(bricks),
+        "bricks_max": max(bricks),
+    }
+
+class BlockGrid:
+    """Uniform-grid broadphase over a list of blocks.
+
+    Each block index is listed in every cell_size square its rect overlaps,
+    with the rects kept alongside. blocks_in() only tests the blocks of the
+    cells a rect touches and returns them in list order, so the first block
+    a ball hits is the same one a scan of the whole list would find. A
+    block that moves is updated with move(), which only touches the cell
+    lists when it crosses into other cells.
+    """
+    
+    def __init__(self, blocks: List[Block]):
+        self.blocks = blocks
+        self.count = len(blocks)
+        self.rects = [block.get_rect() for block in blocks]
+        # Cells of two bricks across keep both buckets and the cells a ball spans few
+        self.cell_size = max((max(rect.width, rect.height) * 2 for rect in self.rects), default=1)
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, rect in enumerate(self.rects):
+            for cell in self._cells(rect):
+                self.cells.setdefault(cell, []).append(index)
+    
+    def _cells(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+    
+    def move(self, index: int) -> None:
+        """Catch up with block index having moved."""
+        before = self.rects[index]
+        after = self.rects[index] = self.blocks[index].get_rect()
+        size = self.cell_size
+        if (before.left // size, before.top // size, (before.right - 1) // size, (before.bottom - 1) // size) == \
+                (after.left // size, after.top // size, (after.right - 1) // size, (after.bottom - 1) // size):
+            return
+        old, new = set(self._cells(before)), set(self._cells(after))
+        cells = self.cells
+        for cell in old - new:
+            cells[cell].remove(index)
+            if not cells[cell]:
+                del cells[cell]
+        for cell in new - old:
+            bisect.insort(cells.setdefault(cell, []), index)  # Kept sorted for list-order results
+    
+    def indices_in(self, rect: pygame.Rect) -> List[int]:
+        """Indices of every block, standing or not, that overlaps rect, in list order."""
+        cells = self.cells
+        found = set().union(*(cells[cell] for cell in self._cells(rect) if cell in cells))
+        rects = self.rects
+        return [i for i in sorted(found) if rect.colliderect(rects[i])]
+    
+    def blocks_in(self, rect: pygame.Rect) -> List[Block]:
+        """Blocks still standing that overlap rect, in list order."""
+        cells = self.cells
+        found = [cells[cell] for cell in self._cells(rect) if cell in cells]
+        if len(found) == 1:
+            candidates: Any = found[0]
+        else:
+            candidates = sorted(set().union(*found))
+        blocks, rects = self.blocks, self.rects
+        return [blocks[i] for i in candidates if not blocks[i].destroyed and rect.colliderect(rects[i])]
+
+class AdjacencyIndex:
+    """Which blocks sit beside which, for chain reactions.
+
+    Built once from block geometry: blocks whose rects come within half a
+    brick of each other are neighbours, orthogonal when they line up along
+    either axis and diagonal otherwise. Any layout works, and a lookup is a
+    list access. around() finds the same for one block of a live grid.
+    """
+    
+    def __init__(self, blocks: List[Block]):
+        self.orthogonal: List[Tuple[int, ...]] = []
+        self.diagonal: List[Tuple[int, ...]] = []
+        grid = BlockGrid(blocks)
+        for i in range(len(blocks)):
+            orthogonal, diagonal = self.around(grid, i)
+            self.orthogonal.append(orthogonal)
+            self.diagonal.append(diagonal)
+    
+    @staticmethod
+    def reach(rect: pygame.Rect) -> pygame.Rect:
+        """The area other blocks must touch to be beside a block with this rect."""
+        margin = max(1, min(rect.width, rect.height) // 2)
+        return rect.inflate(2 * margin, 2 * margin)
+    
+    @classmethod
+    def around(cls, grid: BlockGrid, index: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Orthogonal and diagonal neighbours of block index where grid has the blocks now."""
+        rects = grid.rects
+        rect = rects[index]
+        orthogonal, diagonal = [], []
+        for j in grid.indices_in(cls.reach(rect)):
+            if j == index:
+                continue
+            other = rects[j]
+            lined_up = (rect.left < other.right and other.left < rect.right
+                        or rect.top < other.bottom and other.top < rect.bottom)
+            (orthogonal if lined_up else diagonal).append(j)
+        return tuple(orthogonal), tuple(diagonal)
+
+class Level:
+    """Level data and block arrangements representing AWS architectures."""
+    
+    loader = LevelLoader()
+    generator = LevelGenerator()
+    endless = False  # Endless levels move their blocks and never complete
+    advances = True  # Clearing the level moves on to the next one
+    width, height = SCREEN_WIDTH, SCREEN_HEIGHT  # Size of the world the level is played in
+    scroll = 0.0
+    newest_row = -1
+    
+    def __init__(self, level_number: int, seed: int = 0, blocks: Optional[List[Block]] = None):
+        """Build level_number, or adopt blocks restored from a save state."""
+        self.level_number = level_number
+        self.seed = seed
+        self.blocks: List[Block] = []
+        self.completed = False
+        self._grid: Optional[BlockGrid] = None
+        if blocks is None:
+            self.generate_level()
+        else:
+            self.blocks = blocks
+        self.index_of: Dict[Block, int] = {block: i for i, block in enumerate(self.blocks)}
+        self.movers = [i for i, block in enumerate(self.blocks) if block.velocity is not None]
+        self._index_neighbours()
+    
+    def generate_level(self) -> None:
+        """Build the blocks for the current level from its level file, or
+        generate them past the last file."""
+        if 1 <= self.level_number <= len(LEVEL_FILES):
+            layout = self.loader.load(LEVEL_FILES[self.level_number - 1])
+        else:
+            layout = self.generator.get(self.seed, self.level_number)
+        self.blocks.clear()
+        self.blocks.extend(layout.blocks(self.level_number))
+    
+    def is_complete(self) -> bool:
+        """Check if all blocks are destroyed."""
+        return all(block.destroyed for block in self.blocks)
+    
+    def get_remaining_blocks(self) -> int:
         """Get count of remaining blocks."""
         return sum(1 for block in self.blocks if not block.destroyed)
+    
+    def _index_neighbours(self) -> None:
+        self.adjacency = AdjacencyIndex(self.blocks)
+        # Moving blocks, and blocks one could slide up to, look neighbours up where blocks are now
+        sweeps = []
+        for index in self.movers:
+            block = self.blocks[index]
+            left, top, right, bottom = block.bounds
+            sweeps.append(pygame.Rect(left - block.width / 2, top - block.height / 2,
+                                      right - left + block.width, bottom - top + block.height).inflate(2, 2))
+        self.live_neighbours: Set[int] = set(self.movers)
+        if sweeps:
+            self.live_neighbours.update(i for i, block in enumerate(self.blocks)
+                                        if AdjacencyIndex.reach(block.get_rect()).collidelist(sweeps) != -1)
+    
+    def neighbours(self, index: int, diagonal: bool = True) -> Tuple[int, ...]:
+        """Indices of the blocks beside block index, diagonal ones included if asked."""
+        if index in self.live_neighbours:
+            orthogonal, diagonals = AdjacencyIndex.around(self._broadphase(), index)
+            return orthogonal + diagonals if diagonal else orthogonal
+        adjacency = self.adjacency
+        if diagonal:
+            return adjacency.orthogonal[index] + adjacency.diagonal[index]
+        return adjacency.orthogonal[index]
+    
+    def _broadphase(self) -> BlockGrid:
+        grid = self._grid
+        if grid is None or grid.blocks is not self.blocks or grid.count != len(self.blocks):
+            grid = self._grid = BlockGrid(self.blocks)
+        return grid
+    
+    def blocks_in(self, rect: pygame.Rect) -> List[Block]:
+        """Blocks still standing that overlap rect, in block order."""
+        return self._broadphase().blocks_in(rect)
+    
+    def update(self, dt: float) -> List[int]:
+        """Move the standing moving blocks; only endless levels ever breach rows.
 
-class UI:
-    """User interface rendering and management."""
+        Costs one step per moving block, whatever the size of the level.
+        """
+        if self.movers:
+            grid, blocks = self._broadphase(), self.blocks
+            for index in self.movers:
+                block = blocks[index]
+                if not block.destroyed:
+                    block.move(dt)
+                    grid.move(index)
+        return []
+    
+    def place_movers(self, states: Tuple[Tuple[float, float, float, float], ...]) -> None:
+        """Put the moving blocks back at (x, y, velocity x, velocity y), in movers order."""
+        grid, blocks = self._broadphase(), self.blocks
+        for index, (x, y, vx, vy) in zip(self.movers, states):
+            block = blocks[index]
+            block.position.x, block.position.y = x, y
+            block.velocity = Vector2D(vx, vy)
+            grid.move(index)
+    
+    def scroll_to(self, scroll: float) -> None:
+        """Move an endless level to a scroll position; fixed levels do not scroll."""
+
+class DescentLevel(Level):
+    """Endless descent: brick rows keep sliding down from the top.
+
+    Row k of a run is generated from (seed, k) and sits at DESCENT_TOP +
+    scroll - k * ROW_PITCH. The blocks are a fixed pool of DESCENT_POOL_ROWS
+    rows created once: row k always lives in pool slot k % DESCENT_POOL_ROWS,
+    and a slot is refilled in place when the next row scrolls in, whether
+    its last row was cleared or slid past the danger line. blocks is the
+    whole pool in slot order, so memory and every pass over blocks cost
+    the same however long the run lasts. The level number is the stage,
+    one per DESCENT_ROWS_PER_STAGE rows.
+    """
+    
+    endless = True
+    advances = False
+    ROW_PITCH = BLOCK_HEIGHT + 10
+    
+    def __init__(self, seed: int = 0, blocks: Optional[List[Block]] = None, scroll: float = 0.0):
+        """Start a run, or adopt a pool restored from a save state at scroll."""
+        self.scroll = 0.0
+        self.newest_row = -1
+        super().__init__(1, seed, blocks)
+        if blocks is not None:
+            self.scroll = scroll
+            self.newest_row = int(scroll // self.ROW_PITCH) + 1
+            self._position_rows()
+    
+    def generate_level(self) -> None:
+        """Build the empty pool and scroll the starting rows in."""
+        self.blocks.clear()
+        for _ in range(DESCENT_POOL_ROWS):
+            for column in range(LEVEL_GRID_COLUMNS):
+                block = Block(level_cell_position(column, 0, 0)[0], 0, BlockType.S3)
+                block.destroyed = True
+                self.blocks.append(block)
+        self.scroll, self.newest_row = 0.0, -1
+        self.scroll_to(DESCENT_START_ROWS * self.ROW_PITCH)
+    
+    @property
+    def speed(self) -> float:
+        """Descent speed in pixels per second for the current stage."""
+        return min(DESCENT_MAX_SPEED, DESCENT_SPEED + (self.level_number - 1) * DESCENT_SPEED_STEP)
+    
+    def is_complete(self) -> bool:
+        return False
+    
+    def _index_neighbours(self) -> None:
+        pass  # Rows keep moving; neighbours come from pool slots instead
+    
+    def neighbours(self, index: int, diagonal: bool = True) -> Tuple[int, ...]:
+        """Blocks beside block index, worked out from pool slots."""
+        slot, column = divmod(index, LEVEL_GRID_COLUMNS)
+        row = self._slot_row(slot)
+        columns = [c for c in (column - 1, column + 1) if 0 <= c < LEVEL_GRID_COLUMNS]
+        found = [slot * LEVEL_GRID_COLUMNS + c for c in columns]
+        for other_row in (row - 1, row + 1):
+            if self.newest_row - DESCENT_POOL_ROWS < other_row <= self.newest_row:
+                other_slot = other_row % DESCENT_POOL_ROWS
+                found.append(other_slot * LEVEL_GRID_COLUMNS + column)
+                if diagonal:
+                    found.extend(other_slot * LEVEL_GRID_COLUMNS + c for c in columns)
+        return tuple(found)
+    
+    def blocks_in(self, rect: pygame.Rect) -> List[Block]:
+        """Blocks still standing that overlap rect; the pool moves, so it is scanned."""
+        return [block for block in self.blocks if not block.destroyed and rect.colliderect(block.get_rect())]
+    
+    def _slot(self, slot: int) -> List[Block]:
+        return self.blocks[slot * LEVEL_GRID_COLUMNS:(slot + 1) * LEVEL_GRID_COLUMNS]
+    
+    def _slot_row(self, slot: int) -> int:
+        """The run row currently held by a pool slot (negative before the run fills it)."""
+        return self.newest_row - (self.newest_row - slot) % DESCENT_POOL_ROWS
+    
+    def update(self, dt: float) -> List[int]:
+        """Slide the board down; return the bricks left in each row that crossed the danger line."""
+        scroll = self.scroll + self.speed * dt
+        breached = []
+        # Checked before refilling, so a row is never recycled unseen
+        for slot in range(DESCENT_POOL_ROWS):
+            if DESCENT_TOP + scroll - self._slot_row(slot) * self.ROW_PITCH > DESCENT_DANGER_Y:
+                alive = [block for block in self._slot(slot) if not block.destroyed]
+                for block in alive:
+                    block.destroyed = True
+                if alive:
+                    breached.append(len(alive))
+        self.scroll_to(scroll)
+        return breached
+    
+    def scroll_to(self, scroll: float) -> None:
+        """Move the board down to scroll, refilling slots with the rows that came in."""
+        self.scroll = scroll
+        newest = int(scroll // self.ROW_PITCH) + 1
+        for row in range(max(self.newest_row + 1, newest - DESCENT_POOL_ROWS + 1), newest + 1):
+            for block, block_type in zip(self._slot(row % DESCENT_POOL_ROWS), self.generator.row(self.seed, row)):
+                if block_type is None:
+                    block.destroyed = True
+                else:
+                    block.reset(block_type)
+        self.newest_row = max(self.newest_row, newest)
+        self._position_rows()
+    
+    def _position_rows(self) -> None:
+        self.level_number = 1 + max(0, self.newest_row) // DESCENT_ROWS_PER_STAGE
+        for slot in range(DESCENT_POOL_ROWS):
+            y = DESCENT_TOP + self.scroll - self._slot_row(slot) * self.ROW_PITCH
+            for block in self._slot(slot):
+                block.position.y = y
+
+@dataclass(frozen=True)
+class StressConfig:
+    """Board size of the stress mode."""
+    bricks: int = STRESS_DEFAULT_BRICKS
+    balls: int = STRESS_DEFAULT_BALLS
+    
+    def __post_init__(self):
+        if not 1 <= self.bricks <= STRESS_MAX_BRICKS:
+            raise ValueError(f"Stress bricks must be 1-{STRESS_MAX_BRICKS}, got {self.bricks}")
+        if not 1 <= self.balls <= STRESS_MAX_BALLS:
+            raise ValueError(f"Stress balls must be 1-{STRESS_MAX_BALLS}, got {self.balls}")
+
+class StressLevel(Level):
+    """A giant board of micro-bricks for finding where the game stops scaling.
+
+    The bricks fill rows across a world STRESS_WORLD_WIDTH wide and as tall
+    as they need, with at least STRESS_OPEN_HEIGHT of open space below for
+    the paddle; a Camera shows one screen of it. Services come in bands so the
+    board has every toughness. The level never completes.
+    """
+    
+    advances = False
+    PITCH_X = STRESS_BRICK_WIDTH + STRESS_BRICK_GAP
+    PITCH_Y = STRESS_BRICK_HEIGHT + STRESS_BRICK_GAP
+    COLUMNS = (STRESS_WORLD_WIDTH - STRESS_BRICK_GAP) // PITCH_X
+    
+    def __init__(self, bricks: int = STRESS_DEFAULT_BRICKS, seed: int = 0,
+                 blocks: Optional[List[Block]] = None):
+        """Build a board of bricks micro-bricks, or adopt blocks restored from a save state."""
+        self.bricks = len(blocks) if blocks is not None else bricks
+        rows = -(-self.bricks // self.COLUMNS)
+        self.width = STRESS_WORLD_WIDTH
+        self.height = max(SCREEN_HEIGHT, STRESS_TOP + rows * self.PITCH_Y + STRESS_OPEN_HEIGHT)
+        super().__init__(1, seed, blocks)
+    
+    def generate_level(self) -> None:
+        block_types = list(BlockType)
+        offset = random.Random(f"{self.seed}/stress").randrange(len(block_types))
+        left = STRESS_BRICK_GAP + STRESS_BRICK_WIDTH / 2
+        top = STRESS_TOP + STRESS_BRICK_HEIGHT / 2
+        self.blocks.clear()
+        for index in range(self.bricks):
+            row, column = divmod(index, self.COLUMNS)
+            block_type = block_types[(offset + row // 8 + column // 24) % len(block_types)]
+            block = Block(left + column * self.PITCH_X, top + row * self.PITCH_Y, block_type)
+            block.width, block.height = STRESS_BRICK_WIDTH, STRESS_BRICK_HEIGHT
+            self.blocks.append(block)
+    
+    def is_complete(self) -> bool:
+        return False
+    
+    def _index_neighbours(self) -> None:
+        pass  # The board is a regular grid; neighbours are arithmetic on the index
+    
+    def neighbours(self, index: int, diagonal: bool = True) -> Tuple[int, ...]:
+        row, column = divmod(index, self.COLUMNS)
+        found = []
+        for other_row in (row - 1, row, row + 1):
+            for other_column in (column - 1, column, column + 1):
+                if (other_row, other_column) == (row, column) or not 0 <= other_column < self.COLUMNS:
+                    continue
+                if not diagonal and other_row != row and other_column != column:
+                    continue
+                other = other_row * self.COLUMNS + other_column
+                if 0 <= other < self.bricks:
+                    found.append(other)
+        return tuple(found)
+
+class ChainReactions:
+    """Chain bricks spreading damage to their neighbours, breadth first.
+
+    A destroyed chain brick is queued by index; advance() takes sources off
+    the front of the queue and hits their standing neighbours, and any chain
+    brick that breaks is queued at the back by the BlockDestroyed handler.
+    At most budget neighbour hits are made per frame, so a chain across
+    thousands of bricks plays out over several frames instead of stalling one.
+    """
+    
+    def __init__(self, budget: int = CHAIN_WORK_PER_FRAME):
+        self.budget = budget
+        self.pending: deque = deque()
+    
+    def clear(self) -> None:
+        self.pending.clear()
+    
+    def trigger(self, level: Level, block: Block) -> None:
+        """Queue a destroyed block if it is a chain brick of level."""
+        index = level.index_of.get(block)
+        if index is not None and block.block_type in CHAIN_EFFECTS:
+            self.pending.append(index)
+    
+    def advance(self, level: Level, hit: Callable[[Block, int], None]) -> int:
+        """Spread queued chains within the budget and return the hits made."""
+        blocks, pending = level.blocks, self.pending
+        work = 0
+        while pending:
+            source = blocks[pending[0]]
+            effect = CHAIN_EFFECTS.get(source.block_type)
+            if effect is None or not source.destroyed:  # Refilled since it was queued
+                pending.popleft()
+                continue
+            targets = [blocks[i] for i in level.neighbours(pending[0], effect.diagonal) if not blocks[i].destroyed]
+            if work and work + len(targets) > self.budget:
+                break
+            pending.popleft()
+            for target in targets:
+                hit(target, effect.damage)
+            work += len(targets)
+        return work
+
+class Camera:
+    """One screen's view onto a level world larger than the screen.
+
+    x follows the paddle. Holding Up or W pans the view up the board;
+    otherwise it sinks back to the bottom, where the paddle is.
+    """
+    
+    def __init__(self, world_width: int, world_height: int):
+        self.world_width, self.world_height = world_width, world_height
+        self.x = 0.0
+        self.y = float(max(0, world_height - SCREEN_HEIGHT))
+    
+    def update(self, dt: float, keys_pressed: Any, paddle_x: float) -> None:
+        self.x = max(0.0, min(self.world_width - SCREEN_WIDTH, paddle_x - SCREEN_WIDTH / 2))
+        step = CAMERA_PAN_SPEED * dt
+        if keys_pressed[pygame.K_UP] or keys_pressed[pygame.K_w]:
+            step = -step
+        self.y = max(0.0, min(self.world_height - SCREEN_HEIGHT, self.y + step))
+    
+    @property
+    def rect(self) -> pygame.Rect:
+        """The world area in view."""
+        return pygame.Rect(int(self.x), int(self.y), SCREEN_WIDTH, SCREEN_HEIGHT)
+
+class PhaseTimer:
+    """Wall time spent in each phase of the game update, for perf reports.
+
+    start() marks the beginning of a frame; each lap(phase) adds the time
+    since the previous mark to that phase.
+    """
     
     def __init__(self):
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.totals: Dict[str, float] = {}
+        self._mark = 0.0
+    
+    def start(self) -> None:
+        self._mark = time.perf_counter()
+    
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.totals[phase] = self.totals.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+class LevelPreloader:
+    """Builds the next level on a worker thread while the current one is played.
+
+    prepare() starts one build per level number; bake, if given, then runs
+    on the worker with the new level to warm render caches for it. take()
+    hands the finished level over, waiting for a build still in progress,
+    or builds it on the calling thread if none was prepared.
+    """
+    
+    def __init__(self, bake: Optional[Callable[[Level], None]] = None):
+        self.bake = bake
+        self.hits = 0    # Levels handed over ready-made
+        self.misses = 0  # Levels built on the calling thread
+        self._key: Optional[Tuple[int, int]] = None  # (level number, seed) being built
+        self._level: Optional[Level] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def prepare(self, level_number: int, seed: int = 0) -> None:
+        """Start building level_number in the background, unless already started."""
+        if self._key == (level_number, seed):
+            return
+        if self._thread:
+            self._thread.join()
+        self._key, self._level = (level_number, seed), None
+        self._thread = threading.Thread(target=self._build, args=(level_number, seed),
+                                        name="level-preload", daemon=True)
+        self._thread.start()
+    
+    def take(self, level_number: int, seed: int = 0) -> Level:
+        """Get level_number, ready-made if it was prepared."""
+        level = None
+        if self._key == (level_number, seed):
+            self._thread.join()
+            level = self._level
+        self._key, self._level, self._thread = None, None, None
+        if level is None:
+            self.misses += 1
+            return Level(level_number, seed)
+        self.hits += 1
+        return level
+    
+    def _build(self, level_number: int, seed: int) -> None:
+        try:
+            level = Level(level_number, seed)
+            if self.bake:
+                self.bake(level)
+        except Exception as e:
+            print(f"Warning: Could not preload level {level_number}: {e}")
+            return
+        self._level = level
+
+class GlyphStrip:
+    """A row of pre-rendered glyphs, so changing numbers are drawn by blitting."""
+    
+    def __init__(self, font: pygame.font.Font, chars: str, color: Tuple[int, int, int]):
+        with SPRITE_RENDER_LOCK:
+            glyphs = [font.render(char, True, color) for char in chars]
+        height = font.get_height()
+        self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), height), pygame.SRCALPHA)
+        self.areas: Dict[str, pygame.Rect] = {}
+        
+        x = 0
+        for char, glyph in zip(chars, glyphs):
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.areas[char] = pygame.Rect(x, 0, glyph.get_width(), height)
+            x += glyph.get_width()
+    
+    def width(self, text: str) -> int:
+        """Get the pixel width of text drawn from this strip."""
+        return sum(self.areas[char].width for char in text)
+    
+    def blit(self, dest: pygame.Surface, text: str, position: Tuple[int, int]) -> None:
+        """Draw text onto a transparent destination surface."""
+        x, y = position
+        for char in text:
+            area = self.areas[char]
+            dest.blit(self.surface, (x, y), area, special_flags=pygame.BLEND_RGBA_MAX)
+            x += area.width
+
+class HUD:
+    """Heads-up display built from cached per-field surfaces.
+
+    Each field (score, lives, level, one per active power-up) keeps the
+    text it was last drawn with and is only rebuilt when that text changes.
+    Labels are rendered once; numbers are composed from glyph strips.
+    """
+    
+    GLYPHS = "0123456789,.s"
+    
+    def __init__(self, font_medium: pygame.font.Font, font_small: pygame.font.Font, scale: float = 1.0):
+        self.font_medium = font_medium
+        self.font_small = font_small
+        self.scale = scale
+        self._strips: Dict[Tuple[int, Tuple[int, int, int]], GlyphStrip] = {}
+        self._labels: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._fields: Dict[str, Tuple[str, pygame.Surface]] = {}
+        self.field_renders = 0
+    
+    def _strip(self, font: pygame.font.Font, color: Tuple[int, int, int]) -> GlyphStrip:
+        key = (id(font), color)
+        strip = self._strips.get(key)
+        if strip is None:
+            strip = self._strips[key] = GlyphStrip(font, self.GLYPHS, color)
+        return strip
+    
+    def _label(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, id(font), color)
+        label = self._labels.get(key)
+        if label is None:
+            with SPRITE_RENDER_LOCK:
+                label = self._labels[key] = font.render(text, True, color)
+        return label
+    
+    def _field(self, name: str, label_text: str, value_text: str,
+               font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get a field's surface, rebuilding it only if its text changed."""
+        text = label_text + value_text
+        cached = self._fields.get(name)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        
+        label = self._label(label_text, font, color)
+        strip = self._strip(font, color)
+        surface = pygame.Surface((label.get_width() + strip.width(value_text), font.get_height()),
+                                 pygame.SRCALPHA)
+        surface.blit(label, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        strip.blit(surface, value_text, (label.get_width(), 0))
+        self._fields[name] = (text, surface)
+        self.field_renders += 1
+        return surface
+    
+    def draw(self, screen: pygame.Surface, score: int, lives: int, level: int,
+             active_powerups: Dict[PowerUpType, float]) -> None:
+        """Draw every field."""
+        width = screen.get_width()
+        scale = self.scale
+        margin = round(10 * scale)
         
-    def draw_hud(self, screen: pygame.Surface, score: int, lives: int, level: int, 
-                 active_powerups: Dict[PowerUpType, float]) -> None:
-        """Draw the heads-up display."""
         # Score
-        score_text = self.font_medium.render(f"Score: {score:,}", True, AWS_WHITE)
-        screen.blit(score_text, (10, 10))
+        score_surface = self._field("score", "Score: ", f"{score:,}", self.font_medium, AWS_WHITE)
+        screen.blit(score_surface, (margin, margin))
         
         # Lives
-        lives_text = self.font_medium.render(f"Lives: {lives}", True, AWS_WHITE)
-        screen.blit(lives_text, (SCREEN_WIDTH - 150, 10))
+        lives_surface = self._field("lives", "Lives: ", str(lives), self.font_medium, AWS_WHITE)
+        screen.blit(lives_surface, (width - round(150 * scale), margin))
         
         # Level
-        level_text = self.font_medium.render(f"Level {level}", True, AWS_WHITE)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, 25))
-        screen.blit(level_text, level_rect)
+        level_surface = self._field("level", "Level ", str(level), self.font_medium, AWS_WHITE)
+        screen.blit(level_surface, level_surface.get_rect(center=(width // 2, round(25 * scale))))
         
         # Active power-ups
-        y_offset = 50
+        y_offset = round(50 * scale)
         for powerup_type, remaining_time in active_powerups.items():
             if remaining_time > 0:
-                powerup_text = self.font_small.render(
-                    f"{powerup_type.value[0]}: {remaining_time:.1f}s", 
-                    True, powerup_type.value[2]
-                )
-                screen.blit(powerup_text, (10, y_offset))
-                y_offset += 25
+                powerup_surface = self._field(powerup_type.name, f"{powerup_type.value[0]}: ",
+                                              f"{remaining_time:.1f}s", self.font_small, powerup_type.value[2])
+                screen.blit(powerup_surface, (margin, y_offset))
+                y_offset += round(25 * scale)
+
+class UI:
+    """User interface rendering and management."""
+    
+    def __init__(self, render_scale: float = 1.0):
+        with SPRITE_RENDER_LOCK:
+            self.font_large = pygame.font.Font(None, 48)
+            self.font_medium = pygame.font.Font(None, 32)
+            self.font_small = pygame.font.Font(None, 24)
+        
+        # Static screens: name -> (inputs they were rendered from, surface)
+        self._screen_cache: Dict[str, Tuple[Any, pygame.Surface]] = {}
+        
+        # The HUD is drawn every frame straight at the internal resolution
+        if render_scale == 1.0:
+            self.hud = HUD(self.font_medium, self.font_small)
+        else:
+            with SPRITE_RENDER_LOCK:
+                self.hud = HUD(pygame.font.Font(None, round(32 * render_scale)),
+                               pygame.font.Font(None, round(24 * render_scale)), render_scale)
+    
+    def _draw_cached(self, screen: pygame.Surface, name: str, key: Any,
+                     render: Callable[[pygame.Surface], None]) -> None:
+        """Blit a full-screen page, re-rendering it only when its inputs change.
+
+        Pages are laid out at SCREEN_WIDTH x SCREEN_HEIGHT and scaled once to
+        the screen's internal resolution.
+        """
+        size = screen.get_size()
+        key = (size, key)
+        cached = self._screen_cache.get(name)
+        if cached is None or cached[0] != key:
+            page = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            with SPRITE_RENDER_LOCK:
+                render(page)
+            cached = self._screen_cache[name] = (key, _prepare_sprite(page, alpha=False,
+                                                                      scale=size[0] / SCREEN_WIDTH))
+        screen.blit(cached[1], (0, 0))
+    
+    def invalidate_screens(self) -> None:
+        """Drop every cached static screen."""
+        self._screen_cache.clear()
+        
+    def draw_hud(self, screen: pygame.Surface, score: int, lives: int, level: int, 
+                 active_powerups: Dict[PowerUpType, float]) -> None:
+        """Draw the heads-up display."""
+        self.hud.draw(screen, score, lives, level, active_powerups)
     
     def draw_menu(self, screen: pygame.Surface, title: str, options: List[str], 
                   selected_index: int) -> None:
         """Draw a menu screen."""
+        self._draw_cached(screen, "menu", (title, tuple(options), selected_index),
+                          lambda surface: self._render_menu(surface, title, options, selected_index))
+    
+    def _render_menu(self, screen: pygame.Surface, title: str, options: List[str],
+                     selected_index: int) -> None:
         screen.fill(AWS_DARK_BLUE)
         
         # Title
@@ -866,6 +2889,10 @@ class UI:
     
     def draw_game_over(self, screen: pygame.Surface, final_score: int, high_score: int) -> None:
         """Draw game over screen."""
+        self._draw_cached(screen, "game_over", (final_score, high_score),
+                          lambda surface: self._render_game_over(surface, final_score, high_score))
+    
+    def _render_game_over(self, screen: pygame.Surface, final_score: int, high_score: int) -> None:
         screen.fill(AWS_DARK_BLUE)
         
         # Game Over text
@@ -894,6 +2921,10 @@ class UI:
     
     def draw_high_scores(self, screen: pygame.Surface, high_score: int) -> None:
         """Draw high scores screen."""
+        self._draw_cached(screen, "high_scores", high_score,
+                          lambda surface: self._render_high_scores(surface, high_score))
+    
+    def _render_high_scores(self, screen: pygame.Surface, high_score: int) -> None:
         screen.fill(AWS_DARK_BLUE)
         
         # Title
@@ -945,6 +2976,9 @@ class UI:
     
     def draw_controls(self, screen: pygame.Surface) -> None:
         """Draw controls/help screen."""
+        self._draw_cached(screen, "controls", None, self._render_controls)
+    
+    def _render_controls(self, screen: pygame.Surface) -> None:
         screen.fill(AWS_DARK_BLUE)
         
         # Title
@@ -959,6 +2993,7 @@ class UI:
         controls = [
             ("Arrow Keys or A/D", "Move Load Balancer paddle"),
             ("P or ESC", "Pause/Resume game"),
+            ("Backspace", "Hold to rewind the last few seconds"),
             ("SPACE", "Select menu options"),
             ("Up/Down Arrows", "Navigate menus")
         ]
@@ -1011,6 +3046,288 @@ class UI:
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, 650))
         screen.blit(instruction_text, instruction_rect)
 
+class OverlayCache:
+    """Full-screen overlays rendered once and reused every frame.
+
+    Overlays are per-pixel alpha surfaces keyed by name (and level number
+    for level banners), so drawing one is a single blit. They are laid out
+    at SCREEN_WIDTH x SCREEN_HEIGHT and scaled to size.
+    """
+    
+    def __init__(self, size: Tuple[int, int], font: pygame.font.Font):
+        self.size = size
+        self.font = font
+        self._surfaces: Dict[Any, pygame.Surface] = {}
+    
+    def get(self, key: Any) -> pygame.Surface:
+        """Get an overlay, rendering it on first use."""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            with SPRITE_RENDER_LOCK:
+                surface = self._surfaces[key] = self._render(key)
+        return surface
+    
+    def invalidate(self, size: Optional[Tuple[int, int]] = None) -> None:
+        """Drop every cached overlay, e.g. after a resize."""
+        if size is not None:
+            self.size = size
+        self._surfaces.clear()
+    
+    def _render(self, key: Any) -> pygame.Surface:
+        width, height = SCREEN_WIDTH, SCREEN_HEIGHT
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        if key == "pause":
+            surface.fill((*AWS_DARK_BLUE, OVERLAY_ALPHA))
+            text = self.font.render("PAUSED", True, AWS_WHITE)
+            surface.blit(text, text.get_rect(center=(width // 2, height // 2)))
+        elif key == "dim":
+            surface.fill((*AWS_DARK_BLUE, OVERLAY_ALPHA))
+        elif isinstance(key, tuple) and key[0] == "level":
+            banner = pygame.Rect(0, height // 2 - 40, width, 80)
+            surface.fill((*AWS_DARK_BLUE, 200), banner)
+            pygame.draw.line(surface, AWS_ORANGE, banner.topleft, banner.topright, 2)
+            pygame.draw.line(surface, AWS_ORANGE, banner.bottomleft, banner.bottomright, 2)
+            text = self.font.render(f"Level {key[1]}", True, AWS_ORANGE)
+            surface.blit(text, text.get_rect(center=banner.center))
+        else:
+            raise KeyError(f"Unknown overlay: {key!r}")
+        
+        return _prepare_sprite(surface, scale=self.size[0] / SCREEN_WIDTH)
+
+class QualityController:
+    """Adapts the quality tier to frame time, unless a tier is pinned.
+
+    Frame times are collected in windows of QUALITY_WINDOW frames at the
+    current tier. A window whose QUALITY_PERCENTILE exceeds the downgrade
+    threshold steps quality down at once; stepping up needs
+    QUALITY_UPGRADE_WINDOWS consecutive windows under the much lower upgrade
+    threshold, so the tier does not flap around the budget.
+    """
+    
+    def __init__(self, tier: QualityTier = QualityTier.ULTRA, pinned: Optional[QualityTier] = None,
+                 window: int = QUALITY_WINDOW):
+        self.pinned = pinned
+        self.tier = pinned or tier
+        self._samples: deque = deque(maxlen=window)
+        self._calm_windows = 0
+        self.changes: List[Tuple[QualityTier, QualityTier, float]] = []
+    
+    def percentile(self) -> float:
+        """QUALITY_PERCENTILE of the frame times in the current window."""
+        ordered = sorted(self._samples)
+        if not ordered:
+            return 0.0
+        return ordered[max(0, math.ceil(len(ordered) * QUALITY_PERCENTILE / 100) - 1)]
+    
+    def record(self, frame_ms: float) -> Optional[QualityTier]:
+        """Add a frame time. Returns the new tier if this frame changed it."""
+        if self.pinned:
+            return None
+        self._samples.append(frame_ms)
+        if len(self._samples) < self._samples.maxlen:
+            return None
+        
+        frame_time = self.percentile()
+        self._samples.clear()
+        tiers = sorted(QualityTier, key=lambda tier: tier.rank)
+        rank = self.tier.rank
+        if frame_time > QUALITY_DOWNGRADE_MS and rank > 0:
+            return self._change(tiers[rank - 1], frame_time)
+        if frame_time < QUALITY_UPGRADE_MS and rank < len(tiers) - 1:
+            self._calm_windows += 1
+            if self._calm_windows >= QUALITY_UPGRADE_WINDOWS:
+                return self._change(tiers[rank + 1], frame_time)
+        else:
+            self._calm_windows = 0
+        return None
+    
+    def _change(self, tier: QualityTier, frame_time: float) -> QualityTier:
+        print(f"Quality {self.tier.name.lower()} -> {tier.name.lower()} "
+              f"(p{QUALITY_PERCENTILE} frame time {frame_time:.1f} ms)")
+        self.changes.append((self.tier, tier, frame_time))
+        self.tier = tier
+        self._calm_windows = 0
+        return tier
+
+SCALING_MODES = ("scaled", "integer")
+
+@dataclass
+class DisplayConfig:
+    """Internal render resolution and how frames reach the window.
+
+    Everything is drawn at internal_resolution and scaled on presentation;
+    gameplay keeps SCREEN_WIDTH x SCREEN_HEIGHT coordinates, so the internal
+    resolution must share that aspect ratio. "scaled" hands scaling to SDL
+    (pygame.SCALED, which sizes the window itself, or the renderer's logical
+    size); "integer" enlarges frames by the largest whole factor that fits
+    window_size, or the desktop when fullscreen, and letterboxes the rest.
+    A quality tier pins cosmetic detail; None adapts it to frame time.
+    """
+    internal_resolution: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    window_size: Optional[Tuple[int, int]] = None
+    scaling: str = "scaled"
+    fullscreen: bool = False
+    quality: Optional[QualityTier] = None
+    
+    def __post_init__(self):
+        width, height = self.internal_resolution
+        if width <= 0 or height <= 0 or width * SCREEN_HEIGHT != height * SCREEN_WIDTH:
+            raise ValueError(f"Internal resolution {width}x{height} must be positive and "
+                             f"{SCREEN_WIDTH}:{SCREEN_HEIGHT} in aspect")
+        if self.scaling not in SCALING_MODES:
+            raise ValueError(f"Unknown scaling mode: {self.scaling!r}")
+    
+    @property
+    def render_scale(self) -> float:
+        """Internal pixels per gameplay unit."""
+        return self.internal_resolution[0] / SCREEN_WIDTH
+    
+    @property
+    def output_size(self) -> Tuple[int, int]:
+        """Requested window size; defaults to the gameplay resolution."""
+        return self.window_size or (SCREEN_WIDTH, SCREEN_HEIGHT)
+    
+    @property
+    def is_scaled(self) -> bool:
+        """Whether presenting a frame involves any scaling."""
+        return self.fullscreen or self.output_size != self.internal_resolution
+
+def integer_scale_rect(frame_size: Tuple[int, int], window_size: Tuple[int, int]) -> pygame.Rect:
+    """Where a frame lands in a window when enlarged by a whole factor and centered."""
+    factor = max(1, min(window_size[0] // frame_size[0], window_size[1] // frame_size[1]))
+    rect = pygame.Rect(0, 0, frame_size[0] * factor, frame_size[1] * factor)
+    rect.center = (window_size[0] // 2, window_size[1] // 2)
+    return rect
+
+class SoftwareRenderer:
+    """Default backend: everything is blitted onto the display surface.
+
+    With integer scaling, frames are drawn on an internal-resolution surface
+    instead and enlarged onto the display surface when presented.
+    """
+    
+    name = "software"
+    
+    def __init__(self, display: DisplayConfig):
+        self._frame: Optional[pygame.Surface] = None
+        fullscreen = pygame.FULLSCREEN if display.fullscreen else 0
+        if display.scaling == "scaled":
+            pygame.display.set_mode(display.internal_resolution,
+                                    pygame.SCALED | fullscreen if display.is_scaled else 0)
+        else:
+            window = pygame.display.set_mode((0, 0) if display.fullscreen else display.output_size, fullscreen)
+            if window.get_size() != display.internal_resolution:
+                self._frame = pygame.Surface(display.internal_resolution).convert()
+                self._frame_rect = integer_scale_rect(display.internal_resolution, window.get_size())
+                self._scaled = pygame.Surface(self._frame_rect.size).convert()
+                window.fill((0, 0, 0))
+    
+    @property
+    def screen(self) -> pygame.Surface:
+        return self._frame if self._frame is not None else pygame.display.get_surface()
+    
+    @property
+    def target(self) -> pygame.Surface:
+        """Where gameplay frames are drawn."""
+        return self.screen
+    
+    def present(self, frame: pygame.Surface) -> None:
+        """Show the finished frame."""
+        if self._frame is not None:
+            pygame.transform.scale(self._frame, self._frame_rect.size, self._scaled)
+            pygame.display.get_surface().blit(self._scaled, self._frame_rect)
+        pygame.display.flip()
+    
+    def close(self) -> None:
+        pass
+
+class TextureRenderer:
+    """SDL2 Renderer backend built on pygame._sdl2.video.
+
+    Gameplay sprites are uploaded once as textures, cached per source
+    surface and released with it, and drawn as texture copies that SDL
+    batches. Full-screen pages such as menus are still composed in software
+    on screen and uploaded when presented. Passing accelerated=False selects
+    SDL's software renderer, which works without a GPU. Both scaling modes
+    use the renderer's logical size, so SDL letterboxes but may scale by a
+    fractional factor.
+    """
+    
+    def __init__(self, display: DisplayConfig, accelerated: bool = True):
+        from pygame._sdl2 import video
+        
+        self._texture_class = video.Texture
+        if display.fullscreen:
+            self.window = video.Window("AWS CloudBurst", fullscreen_desktop=True)
+        else:
+            self.window = video.Window("AWS CloudBurst", display.output_size)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1 if accelerated else 0)
+        except RuntimeError:  # pygame.error and the _sdl2 error both derive from it
+            self.window.destroy()
+            raise
+        if display.is_scaled:
+            self.renderer.logical_size = display.internal_resolution
+        self.name = "texture" if accelerated else "texture-software"
+        self.screen = pygame.Surface(display.internal_resolution)
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, Any]" = weakref.WeakKeyDictionary()
+        self._scene_drawn = False
+    
+    @property
+    def target(self) -> "TextureRenderer":
+        """Gameplay frames are drawn straight onto the renderer."""
+        return self
+    
+    def get_size(self) -> Tuple[int, int]:
+        return self.screen.get_size()
+    
+    def get_width(self) -> int:
+        return self.screen.get_width()
+    
+    def get_height(self) -> int:
+        return self.screen.get_height()
+    
+    def blit(self, surface: pygame.Surface, dest: Any, area: Optional[pygame.Rect] = None,
+             special_flags: int = 0) -> pygame.Rect:
+        """Surface.blit lookalike that copies the surface's cached texture."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._textures[surface] = self._texture_class.from_surface(self.renderer, surface)
+        width, height = area.size if area else surface.get_size()
+        dest_rect = pygame.Rect(dest[0], dest[1], width, height)
+        texture.draw(srcrect=area, dstrect=dest_rect)
+        self._scene_drawn = True
+        return dest_rect
+    
+    def present(self, frame: pygame.Surface) -> None:
+        """Show the finished frame, uploading frame if nothing was drawn as textures."""
+        if not self._scene_drawn:
+            self._texture_class.from_surface(self.renderer, frame).draw()
+        self.renderer.present()
+        self._scene_drawn = False
+    
+    def close(self) -> None:
+        self._textures.clear()
+        self.window.destroy()
+
+RENDERERS = ("software", "texture", "texture-software")
+
+def create_renderer(name: str, display: DisplayConfig) -> Any:
+    """Create a render backend, falling back toward plain software rendering.
+
+    "texture" tries an accelerated SDL renderer, then SDL's software
+    renderer; "texture-software" starts at the latter. Either ends at the
+    display-surface SoftwareRenderer if SDL2 rendering is unavailable.
+    """
+    attempts = {"texture": [True, False], "texture-software": [False]}.get(name, [])
+    for accelerated in attempts:
+        try:
+            return TextureRenderer(display, accelerated)
+        except (ImportError, RuntimeError) as e:
+            print(f"Warning: {'accelerated' if accelerated else 'software'} SDL renderer unavailable ({e})")
+    return SoftwareRenderer(display)
+
 class AudioManager:
     """Sound effects and music management."""
     
@@ -1126,11 +3443,643 @@ class AudioManager:
         if self.sounds_enabled and hasattr(self, 'level_complete_sound') and self.level_complete_sound:
             self.level_complete_sound.play()
 
+class SaveStateError(ValueError):
+    """A save state is truncated, corrupt or from an unsupported version."""
+
+class _StateWriter:
+    """Little-endian struct and array packing for save states."""
+    
+    def __init__(self):
+        self._parts: List[bytes] = []
+    
+    def pack(self, fmt: str, *values: Any) -> None:
+        self._parts.append(struct.pack("<" + fmt, *values))
+    
+    def array(self, typecode: str, values: Any) -> None:
+        packed = array.array(typecode, values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        self.pack("I", len(packed))
+        self._parts.append(packed.tobytes())
+    
+    def string(self, text: str) -> None:
+        encoded = text.encode("utf-8")
+        self.pack("H", len(encoded))
+        self._parts.append(encoded)
+    
+    def getvalue(self) -> bytes:
+        return b"".join(self._parts)
+
+class _StateReader:
+    """Reads what _StateWriter wrote, raising SaveStateError on truncation."""
+    
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+    
+    def _take(self, size: int) -> memoryview:
+        if self._offset + size > len(self._data):
+            raise SaveStateError("Save state is truncated")
+        chunk = self._data[self._offset:self._offset + size]
+        self._offset += size
+        return chunk
+    
+    def unpack(self, fmt: str) -> Tuple[Any, ...]:
+        fmt = "<" + fmt
+        return struct.unpack(fmt, self._take(struct.calcsize(fmt)))
+    
+    def array(self, typecode: str) -> array.array:
+        (count,) = self.unpack("I")
+        values = array.array(typecode)
+        values.frombytes(self._take(count * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+    
+    def string(self) -> str:
+        (size,) = self.unpack("H")
+        return bytes(self._take(size)).decode("utf-8")
+    
+    def at_end(self) -> bool:
+        return self._offset == len(self._data)
+
+class AutosaveWriter:
+    """Writes save states to disk on a background thread.
+
+    submit() returns immediately; only the newest pending state is written,
+    via a temporary file and an atomic rename so a crash mid-write never
+    leaves a torn save behind. A path of None discards saves, for headless
+    runs.
+    """
+    
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.writes = 0
+        self._pending: Optional[bytes] = None
+        self._condition = threading.Condition()
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(self, data: bytes) -> None:
+        if self.path is None:
+            return
+        with self._condition:
+            self._pending = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted state is on disk. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+    
+    def exists(self) -> bool:
+        if self.path is None:
+            return False
+        with self._condition:
+            return self._pending is not None or os.path.exists(self.path)
+    
+    def read(self) -> bytes:
+        if self.path is None:
+            raise FileNotFoundError("Autosave is disabled")
+        self.flush()
+        with open(self.path, "rb") as f:
+            return f.read()
+    
+    def delete(self) -> None:
+        """Drop any pending save and remove the file."""
+        if self.path is None:
+            return
+        self.flush()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+    
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                data, self._pending = self._pending, None
+                self._busy = True
+            try:
+                temporary = self.path + ".tmp"
+                with open(temporary, "wb") as f:
+                    f.write(data)
+                os.replace(temporary, self.path)
+                self.writes += 1
+            except OSError as e:
+                print(f"Warning: Could not write autosave: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+class _RewindSegment:
+    """A key frame save state and the packed deltas recorded after it."""
+    
+    def __init__(self, key: bytes):
+        self.key = key
+        self.data = bytearray()
+        self.ends = array.array("I")  # End offset of each delta in data
+    
+    @property
+    def frames(self) -> int:
+        return 1 + len(self.ends)
+    
+    @property
+    def size(self) -> int:
+        return len(self.key) + len(self.data) + self.ends.itemsize * len(self.ends)
+    
+    def append(self, delta: bytes) -> None:
+        self.data += delta
+        self.ends.append(len(self.data))
+    
+    def pop(self) -> None:
+        self.ends.pop()
+        del self.data[self.ends[-1] if self.ends else 0:]
+    
+    def delta(self, index: int) -> bytes:
+        start = self.ends[index - 1] if index else 0
+        return bytes(self.data[start:self.ends[index]])
+
+class RewindBuffer:
+    """The last few seconds of gameplay, for rewinding and scrubbing.
+
+    Every key_interval frames a full save state is kept as a key frame. The
+    frames between hold only what changed since the previous frame: score,
+    lives and descent scroll, paddle fields, per-ball fields behind a change
+    mask, the brick alive mask as a bitset plus any multi-hit brick damage,
+    and the step moving bricks took. Moving bricks are re-derived from that
+    step; only those that turned back or were knocked out carry their state.
+    Descent rows refilling also start a new key frame. Whole segments (a key
+    frame and its deltas) are dropped from the old end to stay within both
+    the time window and budget_kb; the newest segment is always kept.
+    Restoring a frame loads its key frame and replays at most
+    key_interval - 1 deltas. Power-ups, lasers, the shield, timers and
+    pending chain reactions come back as of the key frame.
+    """
+    
+    # Delta flags
+    _GAME, _PADDLE, _BALLS, _ALIVE, _HITS, _MOVERS = 1, 2, 4, 8, 16, 32
+    # Per-ball change mask
+    _POSITION, _VELOCITY, _SPEED, _RADIUS = 1, 2, 4, 8
+    
+    def __init__(self, seconds: float = REWIND_SECONDS, budget_kb: int = REWIND_BUDGET_KB, rate: int = FPS):
+        self.max_frames = int(seconds * rate)
+        self.budget = budget_kb * 1024
+        self.key_interval = rate  # One key frame per second
+        self.frames = 0
+        self.size = 0
+        self._segments: deque = deque()
+        self._last: Optional[Tuple[Any, ...]] = None
+        self._level: Optional[Level] = None
+        self._newest_row = -1  # Descent rows refilled since a key frame need a new one
+    
+    def clear(self) -> None:
+        self._segments.clear()
+        self.frames = self.size = 0
+        self._last = self._level = None
+        self._newest_row = -1
+    
+    @staticmethod
+    def _capture(game: "Game") -> Tuple[Any, ...]:
+        """The delta-encoded fields of the current frame."""
+        paddle = game.paddle
+        blocks = game.level.blocks
+        return ((game.score, game.lives, game.level.scroll),
+                (paddle.position.x, paddle.width, paddle.display_width, paddle.extended),
+                tuple((ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y, ball.speed, ball.radius)
+                      for ball in game.balls),
+                bytes(0 if block.destroyed else block.hits_remaining for block in blocks),
+                tuple((block.position.x, block.position.y, block.velocity.x, block.velocity.y)
+                      for block in (blocks[i] for i in game.level.movers)))
+    
+    def record(self, game: "Game", step: float = 0.0) -> None:
+        """Append the game's current frame, step seconds after the previous one."""
+        frame = self._capture(game)
+        segment = self._segments[-1] if self._segments else None
+        if (segment is None or segment.frames >= self.key_interval or game.level is not self._level
+                or len(frame[3]) != len(self._last[3]) or game.level.newest_row != self._newest_row):
+            segment = _RewindSegment(game.save_state())
+            self._segments.append(segment)
+            self.size += segment.size
+        else:
+            delta = self._encode(self._last, frame, step, game.level.movers)
+            segment.append(delta)
+            self.size += len(delta) + segment.ends.itemsize
+        self.frames += 1
+        self._last, self._level, self._newest_row = frame, game.level, game.level.newest_row
+        
+        segments = self._segments
+        while len(segments) > 1 and (self.size > self.budget
+                                     or self.frames - segments[0].frames >= self.max_frames):
+            oldest = segments.popleft()
+            self.frames -= oldest.frames
+            self.size -= oldest.size
+    
+    def restore(self, game: "Game", index: int) -> None:
+        """Put the game back at frame index, 0 being the oldest held."""
+        if not 0 <= index < self.frames:
+            raise IndexError(f"Rewind frame {index} out of range 0..{self.frames - 1}")
+        for segment in self._segments:
+            if index < segment.frames:
+                break
+            index -= segment.frames
+        
+        game.load_state(segment.key)
+        frame = self._capture(game)
+        trails = [deque(ball.trail_positions, maxlen=BALL_TRAIL_LENGTH) for ball in game.balls]
+        for i in range(index):
+            for trail, ball in zip(trails, frame[2]):
+                trail.append(ball[:2])
+            frame = self._decode(frame, segment.delta(i), game.level.movers)
+            trails.extend(deque(maxlen=BALL_TRAIL_LENGTH) for _ in range(len(frame[2]) - len(trails)))
+        self._apply(game, frame, trails)
+    
+    def step_back(self, game: "Game", frames: int = 1) -> bool:
+        """Drop the newest frames and resume from the newest one left.
+
+        Returns False once only a single frame remains.
+        """
+        if self.frames <= 1:
+            return False
+        keep = max(1, self.frames - frames)
+        while self.frames > keep:
+            segment = self._segments[-1]
+            if segment.ends:
+                self.size -= segment.size
+                segment.pop()
+                self.size += segment.size
+            else:
+                self._segments.pop()
+                self.size -= segment.size
+            self.frames -= 1
+        self.restore(game, self.frames - 1)
+        self._last, self._level, self._newest_row = self._capture(game), game.level, game.level.newest_row
+        return True
+    
+    @staticmethod
+    def _step_movers(frame: Tuple[Any, ...], indices: Sequence[int], step: float) -> Tuple[Any, ...]:
+        """Where the moving bricks of frame are step seconds on, if none turns back or breaks.
+
+        The same arithmetic as Block.move, so bricks that did neither
+        match exactly.
+        """
+        hits = frame[3]
+        return tuple((x + vx * step, y + vy * step, vx, vy) if hits[index] else (x, y, vx, vy)
+                     for index, (x, y, vx, vy) in zip(indices, frame[4]))
+    
+    def _encode(self, previous: Tuple[Any, ...], frame: Tuple[Any, ...], step: float = 0.0,
+                indices: Sequence[int] = ()) -> bytes:
+        """Pack the fields of frame that differ from previous, step seconds before it.
+
+        indices are the level's movers, whose bricks' alive flags decide which
+        of them stepped.
+        """
+        score, paddle, balls, hits, movers = frame
+        ball_masks = []
+        for i, ball in enumerate(balls):
+            before = previous[2][i] if i < len(previous[2]) else None
+            if before is None:
+                mask = self._POSITION | self._VELOCITY | self._SPEED | self._RADIUS
+            else:
+                mask = ((ball[0:2] != before[0:2]) * self._POSITION | (ball[2:4] != before[2:4]) * self._VELOCITY
+                        | (ball[4] != before[4]) * self._SPEED | (ball[5] != before[5]) * self._RADIUS)
+            ball_masks.append(mask)
+        
+        flags = ((score != previous[0]) * self._GAME | (paddle != previous[1]) * self._PADDLE
+                 | (len(balls) != len(previous[2]) or any(ball_masks)) * self._BALLS
+                 | (movers != previous[4]) * self._MOVERS)
+        hit_changes = []
+        if hits != previous[3]:
+            hit_changes = [i for i, (before, after) in enumerate(zip(previous[3], hits)) if before != after]
+            if any(not hits[i] for i in hit_changes):
+                flags |= self._ALIVE
+            hit_changes = [i for i in hit_changes if hits[i]]
+            if hit_changes:
+                flags |= self._HITS
+        
+        writer = _StateWriter()
+        writer.pack("B", flags)
+        if flags & self._GAME:
+            writer.pack("qid", *score)
+        if flags & self._PADDLE:
+            writer.pack("dddB", *paddle)
+        if flags & self._BALLS:
+            writer.pack("H", len(balls))
+            for ball, mask in zip(balls, ball_masks):
+                writer.pack("B", mask)
+                if mask & self._POSITION:
+                    writer.pack("dd", *ball[0:2])
+                if mask & self._VELOCITY:
+                    writer.pack("dd", *ball[2:4])
+                if mask & self._SPEED:
+                    writer.pack("d", ball[4])
+                if mask & self._RADIUS:
+                    writer.pack("H", ball[5])
+        if flags & self._ALIVE:
+            bits = bytearray((len(hits) + 7) // 8)
+            for i, remaining in enumerate(hits):
+                if remaining:
+                    bits[i >> 3] |= 1 << (i & 7)
+            writer.array("B", bits)
+        if flags & self._HITS:
+            writer.array("H", hit_changes)
+            writer.array("B", (hits[i] for i in hit_changes))
+        if flags & self._MOVERS:
+            expected = self._step_movers(previous, indices, step)
+            turned = [i for i, (want, got) in enumerate(zip(expected, movers)) if want != got]
+            writer.pack("d", step)
+            writer.array("H", turned)
+            writer.array("d", (value for i in turned for value in movers[i]))
+        return writer.getvalue()
+    
+    def _decode(self, previous: Tuple[Any, ...], delta: bytes, indices: Sequence[int] = ()) -> Tuple[Any, ...]:
+        """Apply one packed delta to the fields of the frame before it, movers being indices."""
+        reader = _StateReader(delta)
+        score, paddle, balls, hits, movers = previous
+        (flags,) = reader.unpack("B")
+        if flags & self._GAME:
+            score = reader.unpack("qid")
+        if flags & self._PADDLE:
+            x, width, display_width, extended = reader.unpack("dddB")
+            paddle = (x, width, display_width, bool(extended))
+        if flags & self._BALLS:
+            decoded = []
+            for i in range(reader.unpack("H")[0]):
+                ball = list(previous[2][i]) if i < len(previous[2]) else [0.0] * 6
+                (mask,) = reader.unpack("B")
+                if mask & self._POSITION:
+                    ball[0:2] = reader.unpack("dd")
+                if mask & self._VELOCITY:
+                    ball[2:4] = reader.unpack("dd")
+                if mask & self._SPEED:
+                    ball[4] = reader.unpack("d")[0]
+                if mask & self._RADIUS:
+                    ball[5] = reader.unpack("H")[0]
+                decoded.append(tuple(ball))
+            balls = tuple(decoded)
+        if flags & (self._ALIVE | self._HITS):
+            hits = bytearray(hits)
+            if flags & self._ALIVE:
+                bits = reader.array("B")
+                for i in range(len(hits)):
+                    if not bits[i >> 3] & (1 << (i & 7)):
+                        hits[i] = 0
+            if flags & self._HITS:
+                for i, remaining in zip(reader.array("H"), reader.array("B")):
+                    hits[i] = remaining
+            hits = bytes(hits)
+        if flags & self._MOVERS:
+            (step,) = reader.unpack("d")
+            stepped = list(self._step_movers(previous, indices, step))
+            turned, values = reader.array("H"), reader.array("d")
+            for n, i in enumerate(turned):
+                stepped[i] = tuple(values[4 * n:4 * n + 4])
+            movers = tuple(stepped)
+        return score, paddle, balls, hits, movers
+    
+    @staticmethod
+    def _apply(game: "Game", frame: Tuple[Any, ...], trails: List[deque]) -> None:
+        """Write decoded frame fields back into the game."""
+        (game.score, game.lives, scroll), paddle_fields, ball_fields, hits, movers = frame
+        game.level.scroll_to(scroll)
+        game.level.place_movers(movers)
+        paddle = game.paddle
+        paddle.position.x, paddle.width, paddle.display_width, paddle.extended = paddle_fields
+        
+        balls = game.balls
+        while len(balls) > len(ball_fields):
+            game.entities.release("balls", balls[-1])
+        while len(balls) < len(ball_fields):
+            game.entities.spawn("balls", Ball(0.0, 0.0))
+        for ball, (x, y, vx, vy, speed, radius), trail in zip(balls, ball_fields, trails):
+            ball.position = ball.previous_position = Vector2D(x, y)
+            ball.velocity = Vector2D(vx, vy)
+            ball.speed, ball.radius = speed, radius
+            ball._trail_count = ball._trail_next = 0
+            for position in trail:
+                ball._trail[ball._trail_next] = position
+                ball._trail_next = (ball._trail_next + 1) % BALL_TRAIL_LENGTH
+                ball._trail_count += 1
+        
+        for block, remaining in zip(game.level.blocks, hits):
+            block.destroyed = remaining == 0
+            if remaining:
+                block.hits_remaining = remaining
+
+@dataclass(frozen=True)
+class RenderSnapshot:
+    """Immutable copy of everything a gameplay frame draws.
+
+    Published by the simulation thread after each step and drawn by the
+    main thread. Positions are the values the entities' own draw methods
+    would use, with the previous step's alongside for moving entities; the
+    block layout tuple is shared by every snapshot of a level until one of
+    its blocks moves, with per-block state packed into block_hits.
+    """
+    sequence: int
+    published_at: float  # time.perf_counter() when taken
+    input_time: float  # Timestamp of the newest input applied, 0 if none
+    paddle: Tuple[float, float, int, bool]  # left, top, drawn width, extended
+    balls: Tuple[Tuple[float, float, float, float, int, Tuple[Tuple[float, float], ...]], ...]
+    # ^ previous x, previous y, x, y, radius, trail
+    blocks: Tuple[Tuple[BlockType, float, float, int, int], ...]  # type, left, top, width, height
+    block_hits: bytes  # Hits remaining per layout entry, 0 once destroyed
+    powerups: Tuple[Tuple[PowerUpType, float, float, float, float], ...]  # type, previous left/top, left, top
+    lasers: Tuple[Tuple[float, float, float, float], ...]  # previous left/top, left, top
+    shield: Optional[Tuple[int, int, int, int]]  # left, top, width, hits remaining
+    score: int
+    lives: int
+    level: int
+    active_powerups: Tuple[Tuple[PowerUpType, float], ...]
+    level_banner: bool
+    danger_line: bool  # Endless descent boards show their danger line
+    aim_paths: Tuple[Tuple[Tuple[float, float], ...], ...] = ()  # Aim assist: predicted ball paths
+
+class SnapshotBuffer:
+    """Triple buffer of render snapshots between the simulation and main threads.
+
+    The writer publishes into the slot after the newest and the reader takes
+    the newest, so neither waits on the other for more than a pointer swap.
+    Snapshots are immutable, so a frame being drawn is never written to.
+    """
+    
+    def __init__(self, slots: int = 3):
+        self._slots: List[Optional[RenderSnapshot]] = [None] * slots
+        self._newest = -1
+        self._lock = threading.Lock()
+        self.published = 0
+    
+    def publish(self, snapshot: RenderSnapshot) -> None:
+        with self._lock:
+            self._newest = (self._newest + 1) % len(self._slots)
+            self._slots[self._newest] = snapshot
+            self.published += 1
+    
+    def latest(self) -> Optional[RenderSnapshot]:
+        with self._lock:
+            return self._slots[self._newest] if self._newest >= 0 else None
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._slots = [None] * len(self._slots)
+            self._newest = -1
+
+@dataclass(frozen=True)
+class InputEvent:
+    """A key change sampled on the main thread, forwarded to the simulation."""
+    timestamp: float  # time.perf_counter() when sampled
+    key: int
+    pressed: bool
+    gameplay: bool  # Sampled while playing, so the simulation handles the key press
+
+class HeldKeys:
+    """Key-state lookup in the shape of pygame.key.get_pressed(), fed by input events."""
+    
+    def __init__(self):
+        self._down: Set[int] = set()
+    
+    def apply(self, event: InputEvent) -> None:
+        if event.pressed:
+            self._down.add(event.key)
+        else:
+            self._down.discard(event.key)
+    
+    def __getitem__(self, key: int) -> bool:
+        return key in self._down
+
+class Autopilot:
+    """Plays the paddle: steers toward where the next ball will land.
+
+    With predict, the target is the landing point of the soonest ball the
+    paddle can still reach, from the game's LandingPredictor; otherwise it
+    simply chases the mean ball x, the old demo behaviour. Lasers fire
+    whenever the paddle has them. steer() returns the keys to play the
+    frame with, in the shape of pygame.key.get_pressed().
+    """
+    
+    def __init__(self, predict: bool = True):
+        self.predict = predict
+        self.keys = HeldKeys()
+        self.keys.apply(InputEvent(0.0, pygame.K_SPACE, True, True))
+    
+    def target(self, game: "Game") -> float:
+        """The paddle x to head for."""
+        paddle = game.paddle
+        balls = game.balls
+        if not balls:
+            return paddle.position.x
+        if self.predict:
+            line_y = paddle.get_rect().top
+            landings = sorted((landing.time, landing.x) for landing in
+                              (game.predictor.predict(ball, game.level, line_y) for ball in balls) if landing)
+            for time_left, x in landings:
+                if abs(x - paddle.position.x) - paddle.width / 2 <= paddle.speed * time_left:
+                    return x
+            if landings:
+                return landings[0][1]
+        return sum(ball.position.x for ball in balls) / len(balls)
+    
+    def steer(self, game: "Game", dt: float) -> HeldKeys:
+        offset = self.target(game) - game.paddle.position.x
+        reach = game.paddle.speed * dt / 2  # Stay put rather than overshoot back and forth
+        self.keys.apply(InputEvent(0.0, pygame.K_LEFT, offset < -reach, True))
+        self.keys.apply(InputEvent(0.0, pygame.K_RIGHT, offset > reach, True))
+        return self.keys
+
+class SimulationThread(threading.Thread):
+    """Steps gameplay at a fixed rate off the main thread.
+
+    Each step applies the forwarded input events, advances the game by one
+    fixed step while playing and publishes a RenderSnapshot. The main thread
+    takes lock around anything that touches game state directly (menus,
+    pause, drawing non-gameplay screens).
+    """
+    
+    MAX_BACKLOG = 0.25  # Seconds of missed steps to drop rather than catch up on
+    
+    def __init__(self, game: "Game", rate: int = FPS, slots: int = 3):
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.step = 1.0 / rate
+        self.buffer = SnapshotBuffer(slots)
+        self.lock = threading.Lock()
+        self.keys = HeldKeys()
+        self.steps = 0
+        self.input_latencies: deque = deque(maxlen=1000)  # Sampled -> applied, seconds
+        self._inputs: "queue.SimpleQueue[InputEvent]" = queue.SimpleQueue()
+        self._stopping = threading.Event()
+        self._input_time = 0.0
+    
+    def send(self, event: InputEvent) -> None:
+        """Forward an input event; thread-safe."""
+        self._inputs.put(event)
+    
+    def stop(self) -> None:
+        self._stopping.set()
+        if self.is_alive():
+            self.join()
+    
+    def run(self) -> None:
+        next_step = time.perf_counter()
+        while not self._stopping.is_set():
+            now = time.perf_counter()
+            if now < next_step:
+                self._stopping.wait(next_step - now)
+                continue
+            next_step = max(next_step + self.step, now - self.MAX_BACKLOG)
+            with self.lock:
+                self.tick()
+    
+    def tick(self) -> None:
+        """Run one fixed step. Callers on other threads must hold lock."""
+        game = self.game
+        while True:
+            try:
+                event = self._inputs.get_nowait()
+            except queue.Empty:
+                break
+            self.keys.apply(event)
+            if event.pressed and event.gameplay and game.state == GameState.PLAYING:
+                game._handle_game_input(event.key)
+            self.input_latencies.append(time.perf_counter() - event.timestamp)
+            self._input_time = max(self._input_time, event.timestamp)
+        
+        if game.state == GameState.PLAYING:
+            game._update_game(self.step, self.keys)
+            self.steps += 1
+            self.buffer.publish(game.snapshot(self.steps, self._input_time))
+
 class Game:
     """Main game class handling game loop and state management."""
     
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, renderer: str = "software", display: Optional[DisplayConfig] = None,
+                 threaded: bool = False, physics_rate: Optional[int] = None, interpolate: bool = True,
+                 level_seed: Optional[int] = None, mode: str = "levels", stress: Optional[StressConfig] = None,
+                 ball_collisions: bool = False, ddos: bool = False, batched_balls: bool = False,
+                 autopilot: bool = False, aim_assist: bool = False):
+        if mode not in GAME_MODES:
+            raise ValueError(f"Unknown game mode: {mode}")
+        if mode == "stress" and threaded:
+            raise ValueError("The stress mode draws through a camera, which threaded rendering does not support")
+        self.mode = mode
+        self.stress = stress or StressConfig()
+        self.display = display or DisplayConfig()
+        self.threaded = threaded
+        self.simulation: Optional[SimulationThread] = None
+        
+        # Physics stepping: one variable step per frame, or fixed steps at physics_rate
+        self.physics_rate = physics_rate
+        self.interpolate = interpolate
+        self._accumulator = 0.0
+        self.render_scale = self.display.render_scale
+        self.quality = QualityController(pinned=self.display.quality)
+        self.backend = create_renderer(renderer, self.display)
+        self.screen = self.backend.screen
         pygame.display.set_caption("AWS CloudBurst")
         self.clock = pygame.time.Clock()
         
@@ -1142,33 +4091,129 @@ class Game:
         self.current_level = 1
         self.high_score = self._load_high_score()
         
+        # Seed for generated levels: fixed if given, otherwise new every game
+        self.seed = level_seed
+        self.level_seed = level_seed or 0
+        
         # Game objects
-        self.paddle = Paddle(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
-        self.balls: List[Ball] = []
-        self.level = Level(1)
-        self.powerups: List[PowerUp] = []
-        self.lasers: List[Laser] = []
-        self.shield: Optional[Shield] = None
+        self.entities = EntityRegistry()
+        self.entities.spawn("paddles", Paddle(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+        self.level = Level(1, self.level_seed)
+        self.camera: Optional[Camera] = None  # Set while the level world is larger than the screen
+        self.phases: Optional[PhaseTimer] = None  # Set to time the phases of each update
+        
+        # DDoS mode: storms of balls that bounce off each other
+        self.ddos = ddos
+        self.ball_collisions = ball_collisions or ddos
+        self.collider = BallCollider()
+        
+        # Optional NumPy ball physics for huge ball counts
+        self.ball_batch: Optional[BallBatch] = None
+        if batched_balls:
+            try:
+                self.ball_batch = BallBatch()
+            except ImportError as e:
+                print(f"Warning: Batched ball physics unavailable ({e}), using per-ball physics")
+        
+        # Landing prediction: the autopilot plays from it, the aim assist draws it
+        self.predictor = LandingPredictor()
+        self.autopilot: Optional[Autopilot] = Autopilot() if autopilot else None
+        self.aim_assist = aim_assist
         
         # Power-up tracking
-        self.active_powerups: Dict[PowerUpType, float] = {
-            powerup_type: 0 for powerup_type in PowerUpType
-        }
+        self.scheduler = GameScheduler()
+        for powerup_type in PowerUpType:
+            self.scheduler.register(
+                PowerUpTimers.key(powerup_type),
+                on_expire=lambda powerup_type=powerup_type: self._deactivate_powerup(powerup_type),
+                on_activate=lambda powerup_type=powerup_type: self._apply_powerup(powerup_type),
+            )
+        self.scheduler.register("laser_cooldown")
+        self.scheduler.register("level_banner")
+        self.scheduler.register("ddos_wave", on_expire=self._ddos_wave)
+        self.active_powerups = PowerUpTimers(self.scheduler)
         self.score_multiplier = 1
-        self.laser_cooldown = 0.0
         self.slow_motion_active = False
         
         # UI and audio
-        self.ui = UI()
+        self.ui = UI(self.render_scale)
         self.audio = AudioManager()
         
+        # Cached render layers
+        self._background = self._render_background(self.screen.get_size())
+        self.overlays = OverlayCache(self.screen.get_size(), self.ui.font_large)
+        self._paused_frame: Optional[pygame.Surface] = None
+        self._danger_line: Optional[pygame.Surface] = None
+        self._aim_ring: Optional[Tuple[int, int, pygame.Surface]] = None  # (radius, width, sprite)
+        self._block_layout: Optional[Tuple[Level, Tuple[Tuple[BlockType, float, float, int, int], ...]]] = None
+        self.present_latencies: deque = deque(maxlen=1000)  # Input sampled -> frame presented, seconds
+        
+        # Gameplay events: rules first, then presentation
+        self.events = GameEventBus()
+        self.events.subscribe(BlockDestroyed, self._on_blocks_destroyed)
+        self.events.subscribe(PowerUpCollected, self._on_powerups_collected)
+        self.events.subscribe(BallLost, self._on_balls_lost)
+        self.events.subscribe(RowBreached, self._on_rows_breached)
+        self.events.subscribe(LevelComplete, self._on_level_complete)
+        self._presentation_handlers = [
+            (PaddleBounce, lambda batch: self.audio.play_bounce()),
+            (BlockDestroyed, lambda batch: self.audio.play_block_hit()),
+            (PowerUpCollected, lambda batch: self.audio.play_powerup()),
+            (LevelComplete, lambda batch: self.audio.play_level_complete()),
+        ]
+        for event_type, handler in self._presentation_handlers:
+            self.events.subscribe(event_type, handler)
+        
         # Menu state
-        self.menu_options = ["Play", "High Scores", "Controls", "Quit"]
+        self.autosave = AutosaveWriter(AUTOSAVE_FILE)
+        self.rewind = RewindBuffer(rate=physics_rate or FPS)
+        self.preloader = LevelPreloader(self._bake_level)
+        self.chains = ChainReactions()
+        self.menu_options = self._menu_options()
         self.selected_menu_option = 0
         
         # Initialize first ball
         self._spawn_ball()
     
+    @property
+    def laser_cooldown(self) -> float:
+        return self.scheduler.remaining("laser_cooldown")
+    
+    @laser_cooldown.setter
+    def laser_cooldown(self, remaining: float) -> None:
+        self.scheduler.set_remaining("laser_cooldown", remaining)
+    
+    @property
+    def paddle(self) -> Paddle:
+        return self.entities.paddles[0]
+    
+    @paddle.setter
+    def paddle(self, paddle: Paddle) -> None:
+        self.entities.spawn("paddles", paddle)
+    
+    @property
+    def balls(self) -> List[Ball]:
+        return self.entities.balls
+    
+    @property
+    def powerups(self) -> List[PowerUp]:
+        return self.entities.powerups
+    
+    @property
+    def lasers(self) -> List[Laser]:
+        return self.entities.lasers
+    
+    @property
+    def shield(self) -> Optional[Shield]:
+        return self.entities.shields[0] if self.entities.shields else None
+    
+    @shield.setter
+    def shield(self, shield: Optional[Shield]) -> None:
+        if shield is None:
+            self.entities.shields.clear()
+        else:
+            self.entities.spawn("shields", shield)
+    
     def _load_high_score(self) -> int:
         """Load high score from file."""
         try:
@@ -1191,15 +4236,42 @@ class Game:
         ball_speed = BALL_INITIAL_SPEED * (1 + (self.current_level - 1) * BALL_SPEED_INCREASE)
         ball_speed = min(ball_speed, BALL_MAX_SPEED)
         
-        ball = Ball(self.paddle.position.x, self.paddle.position.y - 30, ball_speed)
-        self.balls.append(ball)
+        self.entities.spawn("balls", Ball(self.paddle.position.x, self.paddle.position.y - 30, ball_speed))
+    
+    def _ddos_wave(self) -> None:
+        """Flood the open space below the bricks with a storm of balls, then schedule the next."""
+        level = self.level
+        speed = min(BALL_INITIAL_SPEED * (1 + (self.current_level - 1) * BALL_SPEED_INCREASE), BALL_MAX_SPEED)
+        top = level.height - SCREEN_HEIGHT // 2 + 20
+        for _ in range(min(DDOS_WAVE_BALLS, DDOS_MAX_BALLS - len(self.balls))):
+            ball = Ball(random.uniform(20, level.width - 20), random.uniform(top, level.height - 120), speed)
+            angle = random.uniform(-math.pi / 3, math.pi / 3)
+            ball.velocity = Vector2D(math.sin(angle) * speed, -math.cos(angle) * speed)
+            self.entities.spawn("balls", ball)
+        self.scheduler.start("ddos_wave", DDOS_WAVE_INTERVAL)
+    
+    def _is_idle_state(self) -> bool:
+        """Check whether the current screen only changes on input."""
+        return self.state != GameState.PLAYING
     
-    def _handle_events(self) -> None:
+    def _wait_for_events(self) -> List[pygame.event.Event]:
+        """Block until input arrives or IDLE_WAIT_MS passes, then drain the queue."""
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+    
+    def _handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> None:
         """Handle pygame events."""
-        for event in pygame.event.get():
+        for event in (pygame.event.get() if events is None else events):
             if event.type == pygame.QUIT:
+                if self.state in (GameState.PLAYING, GameState.PAUSED):
+                    self._autosave()
                 self.running = False
             
+            elif event.type == pygame.VIDEORESIZE:
+                self._invalidate_render_caches()
+            
             elif event.type == pygame.KEYDOWN:
                 if self.state == GameState.MENU:
                     self._handle_menu_input(event.key)
@@ -1210,6 +4282,7 @@ class Game:
                 elif self.state == GameState.PAUSED:
                     if event.key == pygame.K_p or event.key == pygame.K_ESCAPE:
                         self.state = GameState.PLAYING
+                        self.scheduler.paused = False
                 elif self.state == GameState.HIGH_SCORE:
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_SPACE:
                         self.state = GameState.MENU
@@ -1224,19 +4297,27 @@ class Game:
         elif key == pygame.K_DOWN:
             self.selected_menu_option = (self.selected_menu_option + 1) % len(self.menu_options)
         elif key == pygame.K_RETURN or key == pygame.K_SPACE:
-            if self.selected_menu_option == 0:  # Play
+            option = self.menu_options[self.selected_menu_option]
+            if option == "Resume":
+                self._resume_autosave()
+            elif option == "Play":
                 self._start_new_game()
-            elif self.selected_menu_option == 1:  # High Scores
+            elif option == "High Scores":
                 self.state = GameState.HIGH_SCORE
-            elif self.selected_menu_option == 2:  # Controls
+            elif option == "Controls":
                 self.state = GameState.CONTROLS
-            elif self.selected_menu_option == 3:  # Quit
+            elif option == "Quit":
                 self.running = False
     
     def _handle_game_input(self, key: int) -> None:
         """Handle in-game input."""
         if key == pygame.K_p or key == pygame.K_ESCAPE:
             self.state = GameState.PAUSED
+            self.scheduler.paused = True
+            self._paused_frame = None  # Recompose the frozen frame once
+            self._autosave()
+        elif key == pygame.K_i:
+            self.interpolate = not self.interpolate
     
     def _handle_game_over_input(self, key: int) -> None:
         """Handle game over screen input."""
@@ -1248,140 +4329,181 @@ class Game:
     def _start_new_game(self) -> None:
         """Initialize a new game."""
         self.state = GameState.PLAYING
+        self._accumulator = 0.0
         self.score = 0
         self.lives = 3
         self.current_level = 1
-        self.score_multiplier = 1
         
         # Reset game objects
-        self.paddle = Paddle(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
-        self.balls.clear()
-        self.powerups.clear()
-        self.level = Level(1)
-        
-        # Reset power-ups
-        for powerup_type in PowerUpType:
-            self.active_powerups[powerup_type] = 0
+        self.entities.teardown(EntityScope.GAME)
+        self._reset_timed_effects()
+        if self.ddos:
+            self.scheduler.start("ddos_wave", DDOS_WAVE_INTERVAL)
+        self.chains.clear()
+        self.level_seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        if self.mode == "descent":
+            self.level = DescentLevel(self.level_seed)
+        elif self.mode == "stress":
+            self.level = StressLevel(self.stress.bricks, self.level_seed)
+        else:
+            self.level = Level(1, self.level_seed)
+        self.entities.spawn("paddles", Paddle(self.level.width // 2, self.level.height - 50))
+        self._fit_camera()
+        self.rewind.clear()
         
         self._spawn_ball()
+        if self.mode == "stress":
+            # The rest of the balls start anywhere in the open space, heading up into the bricks
+            open_top = self.level.height - STRESS_OPEN_HEIGHT
+            for _ in range(self.stress.balls - 1):
+                self.entities.spawn("balls", Ball(random.uniform(20, self.level.width - 20),
+                                                  random.uniform(open_top + 20, self.level.height - 100)))
+    
+    def _fit_camera(self) -> None:
+        """Give levels with a world larger than the screen a camera, and drop it otherwise."""
+        level = self.level
+        if level.width > SCREEN_WIDTH or level.height > SCREEN_HEIGHT:
+            self.camera = Camera(level.width, level.height)
+        else:
+            self.camera = None
     
-    def _update_game(self, dt: float) -> None:
-        """Update game logic."""
-        keys_pressed = pygame.key.get_pressed()
+    def detach_presentation(self) -> None:
+        """Unsubscribe audio and other presentation handlers for headless runs."""
+        for event_type, handler in self._presentation_handlers:
+            self.events.unsubscribe(event_type, handler)
+        self._presentation_handlers = []
+    
+    def _reset_timed_effects(self) -> None:
+        """Cancel every active power-up effect and cooldown."""
+        self.scheduler.clear()
+        self.scheduler.time_scale = 1.0
+        self.scheduler.paused = False
+        self.score_multiplier = 1
+        self.slow_motion_active = False
+        if self.entities.paddles:
+            self.paddle.reset_extension()
+    
+    def _update_game(self, dt: float, keys_pressed: Optional[Any] = None) -> None:
+        """Update game logic. keys_pressed defaults to the live keyboard state."""
+        if keys_pressed is None:
+            keys_pressed = pygame.key.get_pressed()
+        if self.autopilot:
+            keys_pressed = self.autopilot.steer(self, dt)
+        
+        # Practice rewind: holding Backspace steps back instead of forward
+        if keys_pressed[pygame.K_BACKSPACE] and self.rewind.step_back(self):
+            return
+        
+        phases = self.phases
+        if phases:
+            phases.start()
+        level = self.level
         
         # Handle laser firing
         if keys_pressed[pygame.K_SPACE] and self.active_powerups[PowerUpType.LASER_PADDLE] > 0:
-            if self.laser_cooldown <= 0:
+            if not self.scheduler.is_active("laser_cooldown"):
                 paddle_rect = self.paddle.get_rect()
-                laser = Laser(paddle_rect.centerx, paddle_rect.top)
-                self.lasers.append(laser)
-                self.laser_cooldown = LASER_COOLDOWN
+                self.entities.spawn("lasers", Laser(paddle_rect.centerx, paddle_rect.top))
+                self.scheduler.start("laser_cooldown", LASER_COOLDOWN)
         
         # Update paddle
-        self.paddle.update(dt, keys_pressed)
+        self.paddle.update(dt, keys_pressed, level.width)
+        if self.camera:
+            self.camera.update(dt, keys_pressed, self.paddle.position.x)
         
         # Update balls
-        for ball in self.balls[:]:
-            ball.update(dt, self.slow_motion_active)
-            
-            # Check if ball fell off screen
-            if ball.position.y > SCREEN_HEIGHT:
-                self.balls.remove(ball)
-                if not self.balls:  # No balls left
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self._game_over()
-                    else:
-                        self._spawn_ball()
+        batch = self.ball_batch if self.balls else None
+        if batch:
+            balls = self.balls
+            for ball in [balls[i] for i in batch.move(balls, dt, self.slow_motion_active, level.width, level.height)]:
+                self.entities.release("balls", ball)
+                self.events.emit(BallLost(ball))
+        else:
+            for ball in self.balls[:]:
+                ball.update(dt, self.slow_motion_active, level.width)
+                
+                # Check if ball fell off the bottom of the world
+                if ball.position.y > level.height:
+                    self.entities.release("balls", ball)
+                    self.events.emit(BallLost(ball))
+        
+        # Move patrolling bricks and slide endless boards down
+        for bricks in level.update(dt):
+            self.events.emit(RowBreached(bricks))
+        if level.endless:
+            self.current_level = level.level_number
+        if phases:
+            phases.lap("movement")
+        
+        # Ball-ball collisions
+        if self.ball_collisions and len(self.balls) > 1:
+            self.collider.resolve(self.balls)
         
         # Get paddle rect for collision checks
         paddle_rect = self.paddle.get_rect()
         
-        # Ball-paddle collision
-        for ball in self.balls:
-            ball_rect = pygame.Rect(ball.position.x - ball.radius, ball.position.y - ball.radius,
-                                  ball.radius * 2, ball.radius * 2)
-            
-            if ball_rect.colliderect(paddle_rect) and ball.velocity.y > 0:
-                ball.bounce_off_paddle(self.paddle.position.x, self.paddle.width)
-                self.audio.play_bounce()
-        
-        # Ball-block collision
-        for ball in self.balls:
-            ball_rect = pygame.Rect(ball.position.x - ball.radius, ball.position.y - ball.radius,
-                                  ball.radius * 2, ball.radius * 2)
+        if batch and self.balls:
+            # Array overlap tests for every ball, then the scalar responses in ball order
+            balls, blocks = self.balls, level.blocks
+            bounced, touching = batch.contacts(balls, paddle_rect, level)
+            for i in bounced:
+                balls[i].bounce_off_paddle(self.paddle.position.x, self.paddle.width)
+                self.events.emit(PaddleBounce(balls[i]))
+            for i, candidates in touching:
+                block = next((blocks[j] for j in candidates if not blocks[j].destroyed), None)
+                if block:
+                    balls[i].bounce_off_block(block.get_rect(), block.velocity)
+                    self._hit_block(block, "ball")
+        else:
+            # Ball-paddle collision
+            for ball in self.balls:
+                ball_rect = pygame.Rect(ball.position.x - ball.radius, ball.position.y - ball.radius,
+                                      ball.radius * 2, ball.radius * 2)
+                
+                if ball_rect.colliderect(paddle_rect) and ball.velocity.y > 0:
+                    ball.bounce_off_paddle(self.paddle.position.x, self.paddle.width)
+                    self.events.emit(PaddleBounce(ball))
             
-            for block in self.level.blocks:
-                if not block.destroyed and ball_rect.colliderect(block.get_rect()):
-                    # Determine collision side and bounce accordingly
-                    block_rect = block.get_rect()
-                    
-                    # Simple collision response
-                    if abs(ball.position.x - block_rect.centerx) > abs(ball.position.y - block_rect.centery):
-                        ball.velocity.x = -ball.velocity.x
-                    else:
-                        ball.velocity.y = -ball.velocity.y
-                    
-                    # Handle block hit
-                    points, destroyed = block.hit()
-                    if points > 0:
-                        self.score += points * self.score_multiplier
-                        self.audio.play_block_hit()
-                        
-                        # Chance to spawn power-up
-                        if destroyed and block.block_type.value[1] >= 2 and random.random() < POWERUP_DROP_CHANCE:
-                            powerup_type = random.choice(list(PowerUpType))
-                            powerup = PowerUp(block.position.x, block.position.y, powerup_type)
-                            self.powerups.append(powerup)
-                    
-                    break
+            # Ball-block collision
+            for ball in self.balls:
+                ball_rect = pygame.Rect(ball.position.x - ball.radius, ball.position.y - ball.radius,
+                                      ball.radius * 2, ball.radius * 2)
+                
+                hit = level.blocks_in(ball_rect)
+                if hit:
+                    # Bounce off the side hit, relative to the block if it is moving
+                    block = hit[0]
+                    ball.bounce_off_block(block.get_rect(), block.velocity)
+                    self._hit_block(block, "ball")
         
         # Update power-ups
         for powerup in self.powerups[:]:
-            powerup.update(dt)
+            powerup.update(dt, level.height)
             
             if powerup.collected:
-                self.powerups.remove(powerup)
+                self.entities.release("powerups", powerup)
                 continue
             
             # Check collision with paddle
             if powerup.get_rect().colliderect(paddle_rect):
-                self._activate_powerup(powerup.powerup_type)
-                self.powerups.remove(powerup)
-                self.audio.play_powerup()
+                self.entities.release("powerups", powerup)
+                self.events.emit(PowerUpCollected(powerup.powerup_type))
         
-        # Update active power-ups
-        for powerup_type in PowerUpType:
-            if self.active_powerups[powerup_type] > 0:
-                self.active_powerups[powerup_type] -= dt
-                
-                if self.active_powerups[powerup_type] <= 0:
-                    self._deactivate_powerup(powerup_type)
+        # Fire power-up expiry and cooldown timers
+        self.scheduler.advance(dt)
         
         # Update lasers
         for laser in self.lasers[:]:
             laser.update(dt)
             if not laser.active:
-                self.lasers.remove(laser)
+                self.entities.release("lasers", laser)
                 continue
             
             # Check laser-block collisions
-            laser_rect = laser.get_rect()
-            for block in self.level.blocks[:]:
-                if laser_rect.colliderect(block.get_rect()):
-                    points, destroyed = block.hit()
-                    if points > 0:
-                        self.score += points * self.score_multiplier
-                        self.audio.play_block_hit()
-                        
-                        # Chance to spawn power-up
-                        if destroyed and block.block_type.value[1] >= 2 and random.random() < POWERUP_DROP_CHANCE:
-                            powerup_type = random.choice(list(PowerUpType))
-                            powerup = PowerUp(block.position.x, block.position.y, powerup_type)
-                            self.powerups.append(powerup)
-                    
-                    laser.active = False
-                    break
+            hit = level.blocks_in(laser.get_rect())
+            if hit:
+                self._hit_block(hit[0], "laser")
+                laser.active = False
 
         # Update shield
         if self.shield and self.shield.active:
@@ -1396,28 +4518,367 @@ class Game:
                     if self.shield.hit():
                         self.shield = None
                     break
-
-        # Update laser cooldown
-        if self.laser_cooldown > 0:
-            self.laser_cooldown -= dt
         
+        # Spread chain reactions, a bounded amount per frame
+        if self.chains.pending:
+            self.chains.advance(level, self._chain_hit)
+        if phases:
+            phases.lap("collision")
+
         # Check level completion
-        if self.level.is_complete():
-            self._complete_level()
+        if level.is_complete():
+            self.events.emit(LevelComplete(self.current_level))
+        
+        self.events.dispatch()
+        if phases:
+            phases.lap("events")
+        if self.state == GameState.PLAYING:
+            self.rewind.record(self, dt)
+        if phases:
+            phases.lap("rewind")
     
-    def _activate_powerup(self, powerup_type: PowerUpType) -> None:
-        """Activate a power-up effect."""
-        duration = powerup_type.value[1]
-        self.active_powerups[powerup_type] = duration
+    # Enum orders used by save states; only ever append to these
+    _SAVED_STATES = tuple(GameState)
+    _SAVED_BLOCK_TYPES = tuple(BlockType)
+    _SAVED_POWERUP_TYPES = tuple(PowerUpType)
+    _SAVED_LEVEL_TYPES = (Level, DescentLevel, StressLevel)  # One per GAME_MODES entry, same order
+    
+    def save_state(self) -> bytes:
+        """Serialize the whole simulation into the versioned binary save format.
+
+        Covers score, lives, level bricks as packed arrays, paddle, balls,
+        power-ups, lasers, shield, scheduler timers and the RNG state;
+        per-entity fields are stored column-wise as typed arrays.
+        """
+        writer = _StateWriter()
+        writer.pack("4sH", SAVE_MAGIC, SAVE_VERSION)
+        writer.pack("BqiiiBd", self._SAVED_STATES.index(self.state), self.score, self.lives,
+                    self.current_level, self.score_multiplier, self.slow_motion_active, self._accumulator)
+        writer.pack("Q", self.level_seed)
+        
+        # Level bricks
+        blocks = self.level.blocks
+        writer.pack("iB", self.level.level_number, self.level.completed)
+        writer.pack("Bd", self._SAVED_LEVEL_TYPES.index(type(self.level)), self.level.scroll)
+        writer.array("B", (self._SAVED_BLOCK_TYPES.index(block.block_type) for block in blocks))
+        writer.array("B", (0 if block.destroyed else block.hits_remaining for block in blocks))
+        writer.array("d", (value for block in blocks for value in (block.position.x, block.position.y)))
+        writer.array("H", (value for block in blocks for value in (block.width, block.height)))
+        writer.array("I", self.chains.pending)
+        movers = [blocks[i] for i in self.level.movers]
+        writer.array("I", self.level.movers)
+        writer.array("d", (value for block in movers for value in (block.velocity.x, block.velocity.y) + block.bounds))
+        
+        # Paddle
+        paddle = self.paddle
+        writer.pack("dddddB", paddle.position.x, paddle.position.y, paddle.width, paddle.original_width,
+                    paddle.display_width, paddle.extended)
+        
+        # Balls, trails oldest first
+        balls = self.balls
+        writer.array("d", (value for ball in balls for value in (
+            ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y,
+            ball.previous_position.x, ball.previous_position.y, ball.speed)))
+        writer.array("H", (ball.radius for ball in balls))
+        writer.array("B", (len(ball.trail_positions) for ball in balls))
+        writer.array("d", (value for ball in balls for position in ball.trail_positions for value in position))
+        
+        # Power-ups and lasers
+        powerups = self.powerups
+        writer.array("B", (self._SAVED_POWERUP_TYPES.index(powerup.powerup_type) for powerup in powerups))
+        writer.array("d", (value for powerup in powerups for value in (
+            powerup.position.x, powerup.position.y, powerup.previous_position.x, powerup.previous_position.y)))
+        writer.array("d", (value for laser in self.lasers for value in (
+            laser.position.x, laser.position.y, laser.previous_position.x, laser.previous_position.y)))
+        
+        # Shield
+        shield = self.shield
+        if shield and shield.active:
+            writer.pack("BdddB", True, shield.position.x, shield.position.y, shield.width, shield.hits_remaining)
+        else:
+            writer.pack("BdddB", False, 0.0, 0.0, 0.0, 0)
+        
+        # Timers
+        scheduler = self.scheduler.to_dict()
+        writer.pack("ddB", scheduler["time"], scheduler["time_scale"], scheduler["paused"])
+        writer.pack("H", len(scheduler["timers"]))
+        for key, remaining in scheduler["timers"].items():
+            writer.string(key)
+            writer.pack("d", remaining)
+        
+        # RNG: (version, 625-word Mersenne Twister state, cached gaussian)
+        version, words, gauss_next = random.getstate()
+        writer.pack("B", version)
+        writer.array("I", words)
+        writer.pack("Bd", gauss_next is not None, gauss_next or 0.0)
+        return writer.getvalue()
+    
+    def load_state(self, data: bytes) -> None:
+        """Restore a state written by save_state, replacing the current game."""
+        reader = _StateReader(data)
+        magic, version = reader.unpack("4sH")
+        if magic != SAVE_MAGIC:
+            raise SaveStateError("Not an AWS CloudBurst save state")
+        if not 1 <= version <= SAVE_VERSION:
+            raise SaveStateError(f"Unsupported save state version {version}")
+        
+        try:
+            state, score, lives, current_level, score_multiplier, slow_motion, accumulator = reader.unpack("BqiiiBd")
+            (level_seed,) = reader.unpack("Q") if version >= 2 else (0,)
+            
+            # Level bricks
+            level_number, completed = reader.unpack("iB")
+            level_kind, scroll = reader.unpack("Bd") if version >= 3 else (0, 0.0)
+            types, hits, positions, sizes = reader.array("B"), reader.array("B"), reader.array("d"), reader.array("H")
+            chains = reader.array("I") if version >= 4 else []
+            movers, motions = (reader.array("I"), reader.array("d")) if version >= 5 else ([], [])
+            if len(hits) != len(types) or len(positions) != 2 * len(types) or len(sizes) != 2 * len(types):
+                raise SaveStateError("Corrupt save state: brick arrays disagree")
+            blocks = []
+            for i, type_index in enumerate(types):
+                block = Block(positions[2 * i], positions[2 * i + 1], self._SAVED_BLOCK_TYPES[type_index])
+                block.width, block.height = sizes[2 * i], sizes[2 * i + 1]
+                block.hits_remaining = hits[i]
+                block.destroyed = hits[i] == 0
+                blocks.append(block)
+            
+            paddle_values = reader.unpack("dddddB")
+            ball_values, radii, trail_lengths, trails = (reader.array("d"), reader.array("H"),
+                                                         reader.array("B"), reader.array("d"))
+            powerup_types, powerup_values = reader.array("B"), reader.array("d")
+            laser_values = reader.array("d")
+            shield_values = reader.unpack("BdddB")
+            
+            scheduler_time, time_scale, scheduler_paused = reader.unpack("ddB")
+            timers = {}
+            for _ in range(reader.unpack("H")[0]):
+                key = reader.string()
+                timers[key] = reader.unpack("d")[0]
+            
+            rng_version = reader.unpack("B")[0]
+            rng_words = reader.array("I")
+            has_gauss, gauss_next = reader.unpack("Bd")
+            rng_state = (rng_version, tuple(rng_words), gauss_next if has_gauss else None)
+            
+            # Every array must agree with the counts the rebuild below relies on
+            if len(ball_values) != 7 * len(radii) or len(trail_lengths) != len(radii):
+                raise SaveStateError("Corrupt save state: ball arrays disagree")
+            if any(length > BALL_TRAIL_LENGTH for length in trail_lengths) or len(trails) != 2 * sum(trail_lengths):
+                raise SaveStateError("Corrupt save state: ball trails disagree")
+            if len(powerup_values) != 4 * len(powerup_types):
+                raise SaveStateError("Corrupt save state: power-up arrays disagree")
+            if len(laser_values) % 4:
+                raise SaveStateError("Corrupt save state: laser array is not whole lasers")
+            if len(rng_words) != 625:
+                raise SaveStateError(f"Corrupt save state: {len(rng_words)} RNG words")
+            random.Random().setstate(rng_state)  # Rejects a state the real generator would
+            
+            game_state = self._SAVED_STATES[state]
+            powerup_kinds = [self._SAVED_POWERUP_TYPES[i] for i in powerup_types]
+            unknown = [key for key in timers if not self.scheduler.is_registered(key)]
+            if unknown:
+                raise SaveStateError(f"Corrupt save state: unknown timers {unknown}")
+            level_type = self._SAVED_LEVEL_TYPES[level_kind]
+            if level_type is DescentLevel and len(types) != DESCENT_POOL_ROWS * LEVEL_GRID_COLUMNS:
+                raise SaveStateError(f"Corrupt save state: {len(types)} descent bricks")
+            if level_type is StressLevel and not 1 <= len(types) <= STRESS_MAX_BRICKS:
+                raise SaveStateError(f"Corrupt save state: {len(types)} stress bricks")
+            if level_type is StressLevel and self.threaded:
+                raise SaveStateError("A stress board cannot be loaded into a threaded game")
+            if any(index >= len(types) for index in chains):
+                raise SaveStateError("Corrupt save state: chain reaction outside the level")
+            if any(index >= len(types) for index in movers) or len(motions) != 6 * len(movers):
+                raise SaveStateError("Corrupt save state: moving bricks outside the level")
+            for i, index in enumerate(movers):
+                vx, vy, *bounds = motions[6 * i:6 * i + 6]
+                blocks[index].patrol(Vector2D(vx, vy), tuple(bounds))
+            if not reader.at_end():
+                raise SaveStateError("Corrupt save state: trailing data")
+            
+            if level_type is DescentLevel:
+                level = DescentLevel(level_seed, blocks, scroll)
+            elif level_type is StressLevel:
+                level = StressLevel(seed=level_seed, blocks=blocks)
+            else:
+                level = Level(level_number, level_seed, blocks)
+        except SaveStateError:
+            raise
+        except (IndexError, struct.error, ValueError, TypeError) as e:
+            raise SaveStateError(f"Corrupt save state: {e}") from e
+        
+        # Everything decoded: replace the running game
+        self.entities.teardown(EntityScope.GAME)
+        self.state = game_state
+        self.score, self.lives, self.current_level = score, lives, current_level
+        self.level_seed = level_seed
+        self.score_multiplier, self.slow_motion_active = score_multiplier, bool(slow_motion)
+        self._accumulator = accumulator
+        self._paused_frame = None
+        
+        # The saved level kind applies to this level only; new games keep self.mode
+        self.level = level
+        self.level.completed = bool(completed)
+        self.chains.pending = deque(chains)
+        self._fit_camera()
+        
+        x, y, width, original_width, display_width, extended = paddle_values
+        paddle = Paddle(x, y)
+        paddle.width, paddle.original_width, paddle.display_width = width, original_width, display_width
+        paddle.extended = bool(extended)
+        self.paddle = paddle
+        
+        trail_offset = 0
+        for i, radius in enumerate(radii):
+            x, y, vx, vy, previous_x, previous_y, speed = ball_values[7 * i:7 * i + 7]
+            ball = Ball(x, y, speed)
+            ball.velocity = Vector2D(vx, vy)
+            ball.previous_position = Vector2D(previous_x, previous_y)
+            ball.radius = radius
+            for _ in range(trail_lengths[i]):
+                ball._trail[ball._trail_next] = (trails[trail_offset], trails[trail_offset + 1])
+                ball._trail_next = (ball._trail_next + 1) % BALL_TRAIL_LENGTH
+                ball._trail_count += 1
+                trail_offset += 2
+            self.entities.spawn("balls", ball)
+        
+        for i, powerup_type in enumerate(powerup_kinds):
+            x, y, previous_x, previous_y = powerup_values[4 * i:4 * i + 4]
+            powerup = PowerUp(x, y, powerup_type)
+            powerup.previous_position = Vector2D(previous_x, previous_y)
+            self.entities.spawn("powerups", powerup)
+        
+        for i in range(len(laser_values) // 4):
+            x, y, previous_x, previous_y = laser_values[4 * i:4 * i + 4]
+            laser = Laser(x, y)
+            laser.previous_position = Vector2D(previous_x, previous_y)
+            self.entities.spawn("lasers", laser)
+        
+        active, x, y, width, shield_hits = shield_values
+        if active:
+            shield = Shield(x, 0, width)
+            shield.position = Vector2D(x, y)
+            shield.hits_remaining = shield_hits
+            self.shield = shield
         
+        self.scheduler.load_dict({"time": scheduler_time, "time_scale": time_scale,
+                                  "paused": bool(scheduler_paused), "timers": timers})
+        
+        # Last, since rebuilding entities draws random numbers
+        random.setstate(rng_state)
+    
+    def _autosave(self) -> None:
+        """Save the run in the background so it can be resumed from the menu."""
+        self.autosave.submit(self.save_state())
+        self.menu_options = self._menu_options()
+    
+    def _resume_autosave(self) -> None:
+        """Load the autosaved run, paused so the player can get ready."""
+        try:
+            self.load_state(self.autosave.read())
+        except (OSError, SaveStateError) as e:
+            print(f"Warning: Could not resume autosave: {e}")
+            self.autosave.delete()
+            self.menu_options = self._menu_options()
+            return
+        self.rewind.clear()
+        self.state = GameState.PAUSED
+        self.scheduler.paused = True
+    
+    def _menu_options(self) -> List[str]:
+        """Main menu entries, with Resume first when there is a run to resume."""
+        options = ["Play", "High Scores", "Controls", "Quit"]
+        return (["Resume"] + options) if self.autosave.exists() else options
+    
+    def _step_physics(self, dt: float) -> float:
+        """Advance gameplay by dt and return the interpolation alpha to draw with.
+
+        Without a physics rate this is one variable step. With one, whole
+        fixed steps are taken from an accumulator and the leftover fraction
+        of a step is returned, or 1.0 when interpolation is off.
+        """
+        if not self.physics_rate:
+            self._update_game(dt)
+            return 1.0
+        
+        step = 1.0 / self.physics_rate
+        self._accumulator = min(self._accumulator + dt, MAX_FRAME_TIME)
+        while self._accumulator >= step and self.state == GameState.PLAYING:
+            self._update_game(step)
+            self._accumulator -= step
+        return self._accumulator / step if self.interpolate else 1.0
+    
+    def _hit_block(self, block: Block, source: str, damage: int = 1) -> None:
+        """Damage a block and queue the resulting events."""
+        _, destroyed = block.hit(damage)
+        self.events.emit(BlockHit(block, source))
+        if destroyed:
+            self.events.emit(BlockDestroyed(block, source, self.score_multiplier))
+    
+    def _chain_hit(self, block: Block, damage: int) -> None:
+        self._hit_block(block, "chain", damage)
+    
+    def _on_blocks_destroyed(self, events: List[BlockDestroyed]) -> None:
+        """Score destroyed blocks in one go, roll their power-up drops and queue chain bricks."""
+        level = self.level
+        self.score += sum(event.block.points * event.multiplier for event in events)
+        chain_drops = 0
+        for event in events:
+            block = event.block
+            self.chains.trigger(level, block)
+            
+            # Chance to spawn power-up; a chain only drops a few however far it spreads
+            if block.max_hits < 2 or event.source == "chain" and chain_drops >= CHAIN_MAX_DROPS:
+                continue
+            if random.random() < POWERUP_DROP_CHANCE:
+                chain_drops += event.source == "chain"
+                powerup_type = random.choice(list(PowerUpType))
+                self.entities.spawn("powerups", PowerUp(block.position.x, block.position.y, powerup_type))
+        
+        # Get the next level ready before this one is cleared
+        if level.advances and level.get_remaining_blocks() <= len(level.blocks) * (1 - LEVEL_PRELOAD_CLEARED):
+            self.preloader.prepare(self.current_level + 1, self.level_seed)
+    
+    def _on_powerups_collected(self, events: List[PowerUpCollected]) -> None:
+        """Activate collected power-ups."""
+        for event in events:
+            self._activate_powerup(event.powerup_type)
+    
+    def _on_rows_breached(self, events: List[RowBreached]) -> None:
+        """Take a life for every descent row that got past the danger line."""
+        if self.state != GameState.PLAYING:
+            return
+        self.lives -= len(events)
+        if self.lives <= 0:
+            self._game_over()
+    
+    def _on_balls_lost(self, events: List[BallLost]) -> None:
+        """Take a life once the last ball is gone."""
+        if not self.balls:
+            self.lives -= 1
+            if self.lives <= 0:
+                self._game_over()
+            else:
+                self._spawn_ball()
+    
+    def _on_level_complete(self, events: List[LevelComplete]) -> None:
+        """Advance to the next level."""
+        self._complete_level()
+    
+    def _activate_powerup(self, powerup_type: PowerUpType) -> None:
+        """Activate a power-up and schedule its expiry."""
+        self.scheduler.start(PowerUpTimers.key(powerup_type), powerup_type.value[1])
+    
+    def _apply_powerup(self, powerup_type: PowerUpType) -> None:
+        """Apply a power-up effect. Called when its timer starts."""
         if powerup_type == PowerUpType.MULTI_BALL:
             # Spawn additional balls
             for _ in range(2):
                 self._spawn_ball()
         elif powerup_type == PowerUpType.PADDLE_EXTEND:
-            self.paddle.extend_paddle(duration)
+            self.paddle.extend_paddle()
         elif powerup_type == PowerUpType.SLOW_MOTION:
             self.slow_motion_active = True
+            self.scheduler.time_scale = SLOW_MOTION_FACTOR  # Timed effects slow down with the balls
         elif powerup_type == PowerUpType.LASER_PADDLE:
             # Laser activation is handled in input processing
             pass
@@ -1433,104 +4894,1047 @@ class Game:
             self.score_multiplier = 1
         elif powerup_type == PowerUpType.SLOW_MOTION:
             self.slow_motion_active = False
+            self.scheduler.time_scale = 1.0
+        elif powerup_type == PowerUpType.PADDLE_EXTEND:
+            self.paddle.reset_extension()
     
     def _complete_level(self) -> None:
         """Handle level completion."""
-        self.audio.play_level_complete()
         self.current_level += 1
-        self.level = Level(self.current_level)
+        self.level = self.preloader.take(self.current_level, self.level_seed)
+        self.chains.clear()
         
         # Bonus points for remaining lives
         self.score += self.lives * 100
         
-        # Clear power-ups and spawn new ball
-        self.powerups.clear()
-        self.balls.clear()
+        # Tear down everything from the finished level and spawn new ball
+        self.entities.teardown(EntityScope.LEVEL)
+        self._reset_timed_effects()
+        if self.ddos:
+            self.scheduler.start("ddos_wave", DDOS_WAVE_INTERVAL)
         self._spawn_ball()
+        self.scheduler.start("level_banner", LEVEL_BANNER_DURATION)
+        self._autosave()
+    
+    def _bake_level(self, level: Level) -> None:
+        """Render a level's block sprites and banner ahead of time. Runs on the preload worker."""
+        scale, quality = self.render_scale, self.quality.tier
+        for block_type, width, height in {(block.block_type, block.width, block.height) for block in level.blocks}:
+            for hits in range(1, block_type.value[1] + 1):
+                Block.sprite(block_type, hits, width, height, scale, quality)
+        self.overlays.get(("level", level.level_number))
     
     def _game_over(self) -> None:
         """Handle game over."""
         self.state = GameState.GAME_OVER
+        self.autosave.delete()  # Nothing left to resume
+        self.menu_options = self._menu_options()
         
         if self.score > self.high_score:
             self.high_score = self.score
             self._save_high_score()
     
-    def _draw_background(self) -> None:
-        """Draw the game background with AWS cloud pattern."""
-        self.screen.fill(AWS_DARK_BLUE)
+    @staticmethod
+    def _render_background(size: Tuple[int, int]) -> pygame.Surface:
+        """Render the AWS cloud pattern background once, scaled to size."""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(AWS_DARK_BLUE)
         
         # Draw subtle cloud pattern
         for i in range(0, SCREEN_WIDTH, 100):
             for j in range(0, SCREEN_HEIGHT, 100):
                 if (i + j) % 200 == 0:
-                    pygame.draw.circle(self.screen, (40, 55, 70), (i, j), 30, 1)
+                    pygame.draw.circle(background, (40, 55, 70), (i, j), 30, 1)
+        
+        return _prepare_sprite(background, alpha=False, scale=size[0] / SCREEN_WIDTH)
     
-    def _draw_game(self) -> None:
-        """Draw the game screen."""
-        self._draw_background()
+    def _invalidate_render_caches(self) -> None:
+        """Rebuild cached layers after the display surface changes."""
+        self.screen = self.backend.screen
+        size = self.screen.get_size()
+        self._background = self._render_background(size)
+        self.overlays.invalidate(size)
+        self.ui.invalidate_screens()
+        self._paused_frame = self._danger_line = self._aim_ring = None
+    
+    def _draw_background(self, target: Optional[pygame.Surface] = None) -> None:
+        """Draw the game background with AWS cloud pattern."""
+        (target or self.screen).blit(self._background, (0, 0))
+    
+    def _draw_game(self, target: Optional[pygame.Surface] = None, alpha: float = 1.0) -> None:
+        """Draw the game screen onto target (the screen surface by default).
+
+        Balls, power-ups and lasers are drawn alpha of the way from their
+        previous to their latest physics step. The paddle and shield always
+        show their latest position so input feels immediate.
+        """
+        target = target or self.screen
+        if self.camera:
+            self._draw_camera_view(target, alpha)
+            return
+        scale = self.render_scale
+        quality = self.quality.tier
+        self._draw_background(target)
         
         # Draw game objects
-        self.paddle.draw(self.screen)
+        self.paddle.draw(target, scale, quality)
         
         for ball in self.balls:
-            ball.draw(self.screen)
+            ball.draw(target, scale, quality, alpha)
         
         for block in self.level.blocks:
-            block.draw(self.screen)
+            block.draw(target, scale, quality)
+        
+        if self.level.endless:
+            self._draw_danger_line(target)
+        
+        if self.aim_assist:
+            self._draw_aim_paths(target, self._aim_paths())
         
         for powerup in self.powerups:
-            powerup.draw(self.screen)
+            powerup.draw(target, scale, alpha)
         
         # Draw lasers
         for laser in self.lasers:
-            laser.draw(self.screen)
+            laser.draw(target, scale, alpha)
 
         # Draw shield
         if self.shield and self.shield.active:
-            self.shield.draw(self.screen)
+            self.shield.draw(target, scale)
         
         # Draw UI
-        self.ui.draw_hud(self.screen, self.score, self.lives, self.current_level, self.active_powerups)
+        self.ui.draw_hud(target, self.score, self.lives, self.current_level, self.active_powerups)
+        
+        if self.scheduler.is_active("level_banner"):
+            target.blit(self.overlays.get(("level", self.current_level)), (0, 0))
+    
+    def _draw_camera_view(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw the part of a large level world in the camera's view; matches _draw_game otherwise.
+
+        Only blocks in view are looked at, through the level's broadphase.
+        """
+        scale = self.render_scale
+        quality = self.quality.tier
+        view = self.camera.rect
+        left, top = view.left, view.top
+        self._draw_background(target)
+        
+        paddle = self.paddle
+        width = paddle.drawn_width
+        target.blit(PaddleSprites.get(width, paddle.extended, scale, quality),
+                    (int((paddle.position.x - width / 2 - left) * scale),
+                     int((paddle.position.y - paddle.height / 2 - top) * scale)))
+        
+        for ball in self.balls:
+            x, y = ball.render_position(alpha)
+            if view.collidepoint(x, y):
+                trail = [(trail_x - left, trail_y - top) for trail_x, trail_y in ball.trail_positions]
+                Ball.draw_at(target, x - left, y - top, ball.radius, trail, scale, quality)
+        
+        for block in self.level.blocks_in(view):
+            target.blit(Block.sprite(block.block_type, block.hits_remaining, block.width, block.height, scale, quality),
+                        (int((block.position.x - block.width / 2 - left) * scale),
+                         int((block.position.y - block.height / 2 - top) * scale)))
+        
+        if self.aim_assist:
+            self._draw_aim_paths(target, self._aim_paths(), left, top)
+        
+        for powerup in self.powerups:
+            if powerup.collected:
+                continue
+            x, y = powerup.render_position(alpha)
+            target.blit(PowerUp.sprite(powerup.powerup_type, scale),
+                        (int((x - powerup.width / 2 - left) * scale), int((y - powerup.height / 2 - top) * scale)))
+        
+        for laser in self.lasers:
+            if not laser.active:
+                continue
+            x, y = laser.render_position(alpha)
+            target.blit(Laser.sprite(scale),
+                        (int((x - laser.width / 2 - left) * scale), int((y - laser.height / 2 - top) * scale)))
+        
+        if self.shield and self.shield.active:
+            rect = self.shield.get_rect()
+            target.blit(Shield.sprite(rect.width, self.shield.hits_remaining, scale),
+                        (int((rect.x - left) * scale), int((rect.y - top) * scale)))
+        
+        self.ui.draw_hud(target, self.score, self.lives, self.current_level, self.active_powerups)
+        
+        if self.scheduler.is_active("level_banner"):
+            target.blit(self.overlays.get(("level", self.current_level)), (0, 0))
+    
+    def snapshot(self, sequence: int = 0, input_time: float = 0.0) -> RenderSnapshot:
+        """Capture the current gameplay frame as an immutable RenderSnapshot."""
+        level = self.level
+        if self._block_layout is None or self._block_layout[0] is not level or level.endless:
+            layout = tuple((block.block_type, block.position.x - block.width / 2,
+                            block.position.y - block.height / 2, block.width, block.height)
+                           for block in level.blocks)
+            self._block_layout = (level, layout)
+        elif level.movers:
+            moved = list(self._block_layout[1])
+            for index in level.movers:
+                block = level.blocks[index]
+                moved[index] = (block.block_type, block.position.x - block.width / 2,
+                                block.position.y - block.height / 2, block.width, block.height)
+            self._block_layout = (level, tuple(moved))
+        
+        paddle = self.paddle
+        width = paddle.drawn_width
+        shield = self.shield
+        shield_state = None
+        if shield and shield.active:
+            rect = shield.get_rect()
+            shield_state = (rect.x, rect.y, rect.width, shield.hits_remaining)
+        
+        return RenderSnapshot(
+            sequence=sequence,
+            published_at=time.perf_counter(),
+            input_time=input_time,
+            paddle=(paddle.position.x - width / 2, paddle.position.y - paddle.height / 2, width, paddle.extended),
+            balls=tuple((ball.previous_position.x, ball.previous_position.y, ball.position.x, ball.position.y,
+                         ball.radius, tuple(ball.trail_positions)) for ball in self.balls),
+            blocks=self._block_layout[1],
+            block_hits=bytes(0 if block.destroyed else block.hits_remaining for block in self.level.blocks),
+            powerups=tuple((powerup.powerup_type,
+                            powerup.previous_position.x - powerup.width / 2,
+                            powerup.previous_position.y - powerup.height / 2,
+                            powerup.position.x - powerup.width / 2, powerup.position.y - powerup.height / 2)
+                           for powerup in self.powerups if not powerup.collected),
+            lasers=tuple((laser.previous_position.x - laser.width / 2, laser.previous_position.y - laser.height / 2,
+                          laser.position.x - laser.width / 2, laser.position.y - laser.height / 2)
+                         for laser in self.lasers if laser.active),
+            shield=shield_state,
+            score=self.score,
+            lives=self.lives,
+            level=self.current_level,
+            active_powerups=tuple((powerup_type, remaining) for powerup_type, remaining
+                                  in self.active_powerups.items()),
+            level_banner=self.scheduler.is_active("level_banner"),
+            danger_line=self.level.endless,
+            aim_paths=self._aim_paths() if self.aim_assist else (),
+        )
+    
+    def _draw_snapshot(self, snapshot: RenderSnapshot, target: Optional[pygame.Surface] = None,
+                       alpha: float = 1.0) -> None:
+        """Draw a gameplay frame from a snapshot; matches _draw_game for the same state."""
+        target = target or self.screen
+        scale = self.render_scale
+        quality = self.quality.tier
+        self._draw_background(target)
+        
+        left, top, width, extended = snapshot.paddle
+        target.blit(PaddleSprites.get(width, extended, scale, quality), (int(left * scale), int(top * scale)))
+        
+        for previous_x, previous_y, x, y, radius, trail in snapshot.balls:
+            Ball.draw_at(target, _interpolate(previous_x, x, alpha), _interpolate(previous_y, y, alpha),
+                         radius, trail, scale, quality)
+        
+        for (block_type, left, top, width, height), hits in zip(snapshot.blocks, snapshot.block_hits):
+            if hits:
+                target.blit(Block.sprite(block_type, hits, width, height, scale, quality),
+                            (int(left * scale), int(top * scale)))
+        
+        if snapshot.danger_line:
+            self._draw_danger_line(target)
+        
+        if snapshot.aim_paths:
+            self._draw_aim_paths(target, snapshot.aim_paths)
+        
+        for powerup_type, previous_left, previous_top, left, top in snapshot.powerups:
+            left, top = int(_interpolate(previous_left, left, alpha)), int(_interpolate(previous_top, top, alpha))
+            target.blit(PowerUp.sprite(powerup_type, scale), (int(left * scale), int(top * scale)))
+        
+        for previous_left, previous_top, left, top in snapshot.lasers:
+            left, top = int(_interpolate(previous_left, left, alpha)), int(_interpolate(previous_top, top, alpha))
+            target.blit(Laser.sprite(scale), (int(left * scale), int(top * scale)))
+        
+        if snapshot.shield:
+            left, top, width, hits = snapshot.shield
+            target.blit(Shield.sprite(width, hits, scale), (int(left * scale), int(top * scale)))
+        
+        self.ui.draw_hud(target, snapshot.score, snapshot.lives, snapshot.level, dict(snapshot.active_powerups))
+        
+        if snapshot.level_banner:
+            target.blit(self.overlays.get(("level", snapshot.level)), (0, 0))
+    
+    def _aim_paths(self) -> Tuple[Tuple[Tuple[float, float], ...], ...]:
+        """Predicted paths of the AIM_ASSIST_BALLS balls that reach the paddle soonest."""
+        line_y = self.paddle.get_rect().top
+        landings = [self.predictor.predict(ball, self.level, line_y) for ball in self.balls]
+        soonest = sorted((landing for landing in landings if landing), key=lambda landing: landing.time)
+        return tuple(landing.path for landing in soonest[:AIM_ASSIST_BALLS])
+    
+    def _draw_aim_paths(self, target: pygame.Surface, paths: Tuple[Tuple[Tuple[float, float], ...], ...],
+                        left: float = 0, top: float = 0) -> None:
+        """Draw predicted ball paths, ending in a ring where each ball will meet the paddle.
+
+        Each path is drawn onto a surface just big enough for it and the
+        ring is a cached sprite, so both are blits that any backend can draw.
+        """
+        scale = self.render_scale
+        width = max(1, int(scale))
+        radius = max(3, int(6 * scale))
+        if self._aim_ring is None or self._aim_ring[:2] != (radius, width):
+            ring = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(ring, AWS_GREEN, (radius, radius), radius, width)
+            self._aim_ring = (radius, width, _prepare_sprite(ring))
+        ring = self._aim_ring[2]
+        for path in paths:
+            points = [(int((x - left) * scale), int((y - top) * scale)) for x, y in path]
+            if len(points) > 1:
+                xs, ys = [x for x, _ in points], [y for _, y in points]
+                bounds = pygame.Rect(min(xs) - width, min(ys) - width,
+                                     max(xs) - min(xs) + 2 * width + 1, max(ys) - min(ys) + 2 * width + 1)
+                surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+                pygame.draw.lines(surface, AWS_GREEN, False, [(x - bounds.x, y - bounds.y) for x, y in points], width)
+                target.blit(surface, bounds.topleft)
+            end_x, end_y = points[-1]
+            target.blit(ring, (end_x - radius, end_y - radius))
+    
+    def _draw_danger_line(self, target: pygame.Surface) -> None:
+        """Mark the line a descent row must not cross with bricks left.
+
+        The line is a strip rendered once per target width and blitted, so
+        it draws on any backend.
+        """
+        thickness = max(1, int(self.render_scale))
+        line = self._danger_line
+        if line is None or line.get_size() != (target.get_width(), thickness):
+            line = pygame.Surface((target.get_width(), thickness))
+            line.fill(AWS_RED)
+            line = self._danger_line = _prepare_sprite(line, alpha=False)
+        target.blit(line, (0, int(DESCENT_DANGER_Y * self.render_scale) - thickness // 2))
+    
+    def _draw_paused(self) -> None:
+        """Draw the paused screen: the frozen game frame under the pause overlay.
+
+        Nothing moves while paused, so the composed frame is kept and
+        re-blitted until the game is paused again.
+        """
+        if self._paused_frame is None:
+            self._draw_game()
+            self.screen.blit(self.overlays.get("pause"), (0, 0))
+            self._paused_frame = self.screen.copy()
+        else:
+            self.screen.blit(self._paused_frame, (0, 0))
+    
+    def _draw_idle_screen(self) -> None:
+        """Draw the menu, pause or other non-gameplay screen for the current state."""
+        if self.state == GameState.MENU:
+            self.ui.draw_menu(self.screen, "AWS CloudBurst", self.menu_options, self.selected_menu_option)
+        elif self.state == GameState.PAUSED:
+            self._draw_paused()
+        elif self.state == GameState.GAME_OVER:
+            self.ui.draw_game_over(self.screen, self.score, self.high_score)
+        elif self.state == GameState.HIGH_SCORE:
+            self.ui.draw_high_scores(self.screen, self.high_score)
+        elif self.state == GameState.CONTROLS:
+            self.ui.draw_controls(self.screen)
+    
+    def _forward_input(self, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Send key events to the simulation thread; return the events left for this thread.
+
+        Every key change is forwarded so the simulation's held-key state stays
+        right; presses made while playing are handled only by the simulation.
+        """
+        now = time.perf_counter()
+        remaining = []
+        for event in events:
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                playing = self.state == GameState.PLAYING
+                self.simulation.send(InputEvent(now, event.key, event.type == pygame.KEYDOWN, playing))
+                if playing:
+                    continue
+            remaining.append(event)
+        return remaining
+    
+    def _run_threaded(self) -> None:
+        """Main loop with the simulation on its own thread.
+
+        This thread samples input, forwards it, and renders the newest
+        snapshot at up to FPS; menus and pause are handled here under the
+        simulation lock.
+        """
+        simulation = self.simulation = SimulationThread(self, self.physics_rate or FPS)
+        simulation.start()
+        drawn_state = None
+        presented_input = 0.0
+        try:
+            while self.running:
+                if self._is_idle_state() and self.state == drawn_state:
+                    events = self._wait_for_events()
+                else:
+                    self.clock.tick(FPS)
+                    events = pygame.event.get()
+                
+                events = self._forward_input(events)
+                with simulation.lock:
+                    self._handle_events(events)
+                    state = self.state
+                    if state != GameState.PLAYING:
+                        self._draw_idle_screen()
+                    elif drawn_state != GameState.PLAYING:
+                        # Don't show a frame from before the menu or pause
+                        simulation.buffer.publish(self.snapshot(simulation.steps))
+                
+                frame_start = time.perf_counter()
+                snapshot = simulation.buffer.latest() if state == GameState.PLAYING else None
+                if snapshot:
+                    alpha = 1.0
+                    if self.interpolate:
+                        alpha = min(1.0, (frame_start - snapshot.published_at) / simulation.step)
+                    self._draw_snapshot(snapshot, self.backend.target, alpha)
+                self.backend.present(self.screen)
+                if snapshot:
+                    self.quality.record((time.perf_counter() - frame_start) * 1000)
+                    if snapshot.input_time > presented_input:
+                        presented_input = snapshot.input_time
+                        self.present_latencies.append(time.perf_counter() - presented_input)
+                drawn_state = state
+        finally:
+            simulation.stop()
+        self.autosave.flush(timeout=2.0)
+        pygame.quit()
     
     def run(self) -> None:
         """Main game loop."""
+        if self.threaded:
+            self._run_threaded()
+            return
+        drawn_state = None
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
-            
-            self._handle_events()
+            if self._is_idle_state() and self.state == drawn_state:
+                # Menus and pause only change on input: sleep instead of spinning at FPS
+                self._handle_events(self._wait_for_events())
+                self.clock.tick()  # Keep the first gameplay frame's dt small
+                dt = 0.0
+            else:
+                dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+                self._handle_events()
             
+            frame_start = time.perf_counter()
             if self.state == GameState.PLAYING:
-                self._update_game(dt)
-                self._draw_game()
-            elif self.state == GameState.MENU:
-                self.ui.draw_menu(self.screen, "AWS CloudBurst", self.menu_options, self.selected_menu_option)
-            elif self.state == GameState.PAUSED:
-                self._draw_game()
-                # Draw pause overlay
-                pause_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                pause_surface.set_alpha(128)
-                pause_surface.fill(AWS_DARK_BLUE)
-                self.screen.blit(pause_surface, (0, 0))
-                
-                pause_text = self.ui.font_large.render("PAUSED", True, AWS_WHITE)
-                pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(pause_text, pause_rect)
-            elif self.state == GameState.GAME_OVER:
-                self.ui.draw_game_over(self.screen, self.score, self.high_score)
-            elif self.state == GameState.HIGH_SCORE:
-                self.ui.draw_high_scores(self.screen, self.high_score)
-            elif self.state == GameState.CONTROLS:
-                self.ui.draw_controls(self.screen)
+                alpha = self._step_physics(dt)
+                self._draw_game(self.backend.target, alpha)
+            else:
+                self._draw_idle_screen()
             
-            pygame.display.flip()
+            self.backend.present(self.screen)
+            if self.state == GameState.PLAYING and drawn_state == GameState.PLAYING:
+                self.quality.record((time.perf_counter() - frame_start) * 1000)
+            drawn_state = self.state
         
+        self.autosave.flush(timeout=2.0)
         pygame.quit()
 
+def use_headless_display() -> None:
+    """Switch SDL to the dummy video driver for windowless runs."""
+    if os.environ.get("SDL_VIDEODRIVER") != "dummy":
+        pygame.display.quit()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+
+def _headless_game(seed: int = 0, balls: int = 0,
+                   area: Tuple[float, float, float, float] = (20, SCREEN_HEIGHT // 2, SCREEN_WIDTH - 20,
+                                                               SCREEN_HEIGHT - 80),
+                   speed: float = BALL_INITIAL_SPEED, start: bool = True, **options: Any) -> "Game":
+    """A seeded game for headless runs: silent, never autosaving and with lives to spare.
+
+    options go to Game. With balls, the level's ball is replaced by that
+    many scattered across area (left, top, right, bottom) at speed. Pass
+    start=False to start the game yourself, e.g. while measuring it.
+    """
+    random.seed(seed)
+    game = Game(level_seed=seed, **options)
+    game.detach_presentation()
+    game.autosave = AutosaveWriter(None)
+    if start:
+        game._start_new_game()
+        game.lives = 10 ** 6  # Keep playing for the whole run
+        if balls:
+            game.entities.teardown(EntityScope.LEVEL)
+            left, top, right, bottom = area
+            for _ in range(balls):
+                game.entities.spawn("balls", Ball(random.uniform(left, right), random.uniform(top, bottom), speed))
+    return game
+
+def run_soak_test(levels: int = 1000, frames_per_level: int = 30, seed: int = 0,
+                  memory_slack: int = 64 * 1024) -> Dict[str, Any]:
+    """Play many headless levels and check that nothing outlives its level.
+
+    Each level is flooded with power-ups, lasers, shields and extra balls and
+    then force-completed. Afterwards the entity counts and timed effects must
+    match a freshly started level, and traced memory must stay within
+    memory_slack bytes of the level 1 baseline.
+    """
+    game = _headless_game(seed)
+    baseline_counts = game.entities.counts()
+    dt = 1.0 / FPS
+    
+    tracemalloc.start()
+    baseline_memory = None
+    peak_growth = 0
+    try:
+        for _ in range(levels):
+            game.lives = 3
+            for frame in range(frames_per_level):
+                if frame % 10 == 0:
+                    game._activate_powerup(random.choice(list(PowerUpType)))
+                    game.entities.spawn("powerups", PowerUp(random.uniform(50, SCREEN_WIDTH - 50), 200,
+                                                            random.choice(list(PowerUpType))))
+                    game.entities.spawn("lasers", Laser(game.paddle.position.x, game.paddle.position.y - 20))
+                game._update_game(dt)
+            
+            for block in game.level.blocks:
+                block.destroyed = True
+            game._update_game(dt)
+            
+            game.entities.assert_consistent()
+            counts = game.entities.counts()
+            assert counts == baseline_counts, f"Level {game.current_level - 1} leaked entities: {counts}"
+            assert not any(remaining > 0 for remaining in game.active_powerups.values())
+            assert game.laser_cooldown <= 0 and not game.slow_motion_active
+            assert not game.paddle.extended and game.score_multiplier == 1
+            
+            game.rewind.clear()  # Bounded by its own budget, not a leak
+            Level.generator.clear()  # Likewise bounded by its cache size
+            gc.collect()
+            current_memory, _ = tracemalloc.get_traced_memory()
+            if baseline_memory is None:
+                baseline_memory = current_memory
+            growth = current_memory - baseline_memory
+            peak_growth = max(peak_growth, growth)
+            assert growth <= memory_slack, f"Memory grew by {growth} bytes after level {game.current_level - 1}"
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        "levels": levels,
+        "entities_created": game.entities.created,
+        "baseline_memory": baseline_memory,
+        "peak_memory_growth": peak_growth,
+    }
+
+def benchmark_paused_frame(frames: int = 600) -> Dict[str, float]:
+    """Measure the cost of one paused frame, cached versus recomposed.
+
+    The uncached figure drops the frozen frame, overlays and background
+    every frame, which is what the paused loop used to pay.
+    """
+    game = _headless_game()
+    game._handle_game_input(pygame.K_p)
+    
+    def time_frames(invalidate: bool) -> float:
+        start = time.perf_counter()
+        for _ in range(frames):
+            if invalidate:
+                game._invalidate_render_caches()
+            game._draw_paused()
+        return (time.perf_counter() - start) * 1000 / frames
+    
+    uncached_ms = time_frames(invalidate=True)
+    game._paused_frame = None
+    cached_ms = time_frames(invalidate=False)
+    return {"frames": frames, "cached_ms": cached_ms, "uncached_ms": uncached_ms}
+
+def benchmark_ball_draw(ball_counts: Tuple[int, ...] = (1, 100, 500), frames: int = 120) -> Dict[str, float]:
+    """Measure per-frame cost of updating and drawing many balls with trails."""
+    game = _headless_game(start=False)
+    results: Dict[str, float] = {}
+    for count in ball_counts:
+        balls = [Ball(random.uniform(50, SCREEN_WIDTH - 50), random.uniform(50, SCREEN_HEIGHT - 50))
+                 for _ in range(count)]
+        start = time.perf_counter()
+        for _ in range(frames):
+            game._draw_background()
+            for ball in balls:
+                ball.update(1.0 / FPS)
+                ball.draw(game.screen)
+        results[f"balls_{count}_ms"] = (time.perf_counter() - start) * 1000 / frames
+    return results
+
+# Level numbers, balls and where they start (left, top, right, bottom) for the render benchmarks
+BENCHMARK_LEVELS = (1, 4, 6)
+BENCHMARK_BALLS = 20
+BENCHMARK_AREA = (50, 300, SCREEN_WIDTH - 50, SCREEN_HEIGHT - 100)
+
+def benchmark_renderers(frames: int = 300) -> Dict[str, float]:
+    """Compare gameplay frame cost of every render backend on the benchmark levels.
+
+    A backend that falls back is reported under the name it fell back to.
+    """
+    results: Dict[str, float] = {}
+    measured = set()
+    for renderer in RENDERERS:
+        game = _headless_game(start=False, renderer=renderer)
+        if game.backend.name in measured:
+            game.backend.close()
+            continue
+        measured.add(game.backend.name)
+        game._start_new_game()
+        left, top, right, bottom = BENCHMARK_AREA
+        for level_number in BENCHMARK_LEVELS:
+            random.seed(level_number)
+            game.level = Level(level_number)
+            game.entities.teardown(EntityScope.LEVEL)
+            for _ in range(BENCHMARK_BALLS):
+                game.entities.spawn("balls", Ball(random.uniform(left, right), random.uniform(top, bottom)))
+            
+            start = time.perf_counter()
+            for _ in range(frames):
+                for ball in game.balls:
+                    ball.update(1.0 / FPS)
+                game._draw_game(game.backend.target)
+                game.backend.present(game.screen)
+            results[f"{game.backend.name}_level_{level_number}_ms"] = (time.perf_counter() - start) * 1000 / frames
+        game.backend.close()
+    return results
+
+BENCHMARK_RESOLUTIONS = ((SCREEN_WIDTH, SCREEN_HEIGHT), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+
+def benchmark_internal_resolution(frames: int = 300) -> Dict[str, float]:
+    """Compare gameplay draw and integer-scaled present cost per internal resolution."""
+    results: Dict[str, float] = {}
+    for resolution in BENCHMARK_RESOLUTIONS:
+        game = _headless_game(balls=BENCHMARK_BALLS, area=BENCHMARK_AREA,
+                              display=DisplayConfig(resolution, scaling="integer"))
+        
+        draw_time = present_time = 0.0
+        for _ in range(frames):
+            for ball in game.balls:
+                ball.update(1.0 / FPS)
+            start = time.perf_counter()
+            game._draw_game(game.backend.target)
+            draw_time += time.perf_counter() - start
+            start = time.perf_counter()
+            game.backend.present(game.screen)
+            present_time += time.perf_counter() - start
+        name = f"{resolution[0]}x{resolution[1]}"
+        results[f"{name}_draw_ms"] = draw_time * 1000 / frames
+        results[f"{name}_present_ms"] = present_time * 1000 / frames
+    return results
+
+def benchmark_quality_tiers(frames: int = 300) -> Dict[str, float]:
+    """Compare gameplay draw cost at each quality tier on the busiest benchmark level."""
+    results: Dict[str, float] = {}
+    game = _headless_game(balls=BENCHMARK_BALLS, area=BENCHMARK_AREA)
+    game.level = Level(BENCHMARK_LEVELS[-1])
+    for tier in sorted(QualityTier, key=lambda tier: -tier.rank):
+        game.quality = QualityController(pinned=tier)
+        game._draw_game()  # Render this tier's sprites outside the timing
+        start = time.perf_counter()
+        for _ in range(frames):
+            for ball in game.balls:
+                ball.update(1.0 / FPS)
+            game._draw_game()
+        results[f"{tier.name.lower()}_ms"] = (time.perf_counter() - start) * 1000 / frames
+    return results
+
+def benchmark_threading(seconds: float = 2.0, present_delay_ms: float = 25.0,
+                        input_interval: float = 0.05) -> Dict[str, float]:
+    """Compare the serial loop with the simulation-thread split under a slow present.
+
+    present_delay_ms stands in for a slow flip or vsync wait. Synthetic
+    key presses arrive every input_interval; latency runs from arrival to
+    the simulation step that applies it and to the first frame showing it.
+    """
+    results: Dict[str, float] = {}
+    for mode in ("serial", "threaded"):
+        game = _headless_game(balls=BENCHMARK_BALLS, area=BENCHMARK_AREA)
+        
+        keys = HeldKeys()
+        sim_latencies: List[float] = []
+        present_latencies: List[float] = []
+        pending: List[float] = []  # Arrived inputs not yet on screen
+        frames = 0
+        simulation = None
+        if mode == "threaded":
+            simulation = game.simulation = SimulationThread(game)
+            simulation.buffer.publish(game.snapshot())
+            simulation.start()
+        
+        start = last = next_input = time.perf_counter()
+        pressed = False
+        while last - start < seconds:
+            # Sample every input that has arrived
+            arrived = []
+            while next_input <= time.perf_counter():
+                pressed = not pressed
+                arrived.append(InputEvent(next_input, pygame.K_RIGHT, pressed, True))
+                next_input += input_interval
+            
+            if simulation:
+                for event in arrived:
+                    simulation.send(event)
+                snapshot = simulation.buffer.latest()
+                game._draw_snapshot(snapshot)
+            else:
+                now = time.perf_counter()
+                for event in arrived:
+                    keys.apply(event)
+                    sim_latencies.append(now - event.timestamp)
+                game._update_game(now - last, keys)
+                game._draw_game()
+            game.backend.present(game.screen)
+            time.sleep(present_delay_ms / 1000)
+            frames += 1
+            
+            now = time.perf_counter()
+            pending.extend(event.timestamp for event in arrived)
+            shown_until = snapshot.input_time if simulation else now
+            present_latencies.extend(now - timestamp for timestamp in pending if timestamp <= shown_until)
+            pending = [timestamp for timestamp in pending if timestamp > shown_until]
+            last = now
+        
+        elapsed = last - start
+        if simulation:
+            simulation.stop()
+            steps = simulation.steps
+            sim_latencies = list(simulation.input_latencies)
+        else:
+            steps = frames
+        results[f"{mode}_sim_steps_per_s"] = steps / elapsed
+        results[f"{mode}_frames_per_s"] = frames / elapsed
+        results[f"{mode}_input_to_sim_ms"] = 1000 * sum(sim_latencies) / max(1, len(sim_latencies))
+        results[f"{mode}_input_to_present_ms"] = 1000 * sum(present_latencies) / max(1, len(present_latencies))
+    return results
+
+def benchmark_rewind(seconds: float = REWIND_SECONDS, samples: int = 200) -> Dict[str, float]:
+    """Measure rewind recording cost, buffer size and restore (scrub) time.
+
+    Plays seconds of a Multi-Ball game at the fixed frame rate, recording
+    every frame, then restores random frames from the buffer.
+    """
+    game = _headless_game(balls=BENCHMARK_BALLS, area=BENCHMARK_AREA)
+    
+    keys = HeldKeys()
+    record_time = 0.0
+    frames = int(seconds * FPS)
+    for _ in range(frames):
+        start = time.perf_counter()
+        game._update_game(1.0 / FPS, keys)
+        record_time += time.perf_counter() - start
+    
+    restore_times = []
+    for _ in range(samples):
+        index = random.randrange(game.rewind.frames)
+        start = time.perf_counter()
+        game.rewind.restore(game, index)
+        restore_times.append(time.perf_counter() - start)
+    
+    return {
+        "frames_held": game.rewind.frames,
+        "buffer_kb": game.rewind.size / 1024,
+        "update_with_record_ms": 1000 * record_time / frames,
+        "restore_avg_ms": 1000 * sum(restore_times) / samples,
+        "restore_max_ms": 1000 * max(restore_times),
+    }
+
+STRESS_PHASES = ("movement", "collision", "events", "rewind")
+
+def run_stress_test(bricks: int = STRESS_DEFAULT_BRICKS, balls: int = STRESS_DEFAULT_BALLS,
+                    frames: int = 120, seed: int = 0) -> Dict[str, Any]:
+    """Play the stress board headless and report where frame time and memory go.
+
+    The board is built under tracemalloc to measure what it and its
+    broadphase hold, then tracing stops so it does not slow the timed
+    frames. update_ms is split into the PhaseTimer phases of the update;
+    draw_ms is one camera view of the board.
+    """
+    game = _headless_game(seed, start=False, mode="stress", stress=StressConfig(bricks, balls))
+    
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    game._start_new_game()
+    game.level.blocks_in(game.camera.rect)  # Builds the broadphase
+    build_time = time.perf_counter() - start
+    board_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    game.lives = 10 ** 6  # Keep playing for the whole run
+    game.phases = PhaseTimer()
+    keys = HeldKeys()
+    update_time = draw_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        game._update_game(1.0 / FPS, keys)
+        drawn = time.perf_counter()
+        game._draw_game()
+        update_time += drawn - start
+        draw_time += time.perf_counter() - drawn
+    
+    report: Dict[str, Any] = {
+        "bricks": bricks,
+        "balls": balls,
+        "build_ms": 1000 * build_time,
+        "board_kb": board_bytes / 1024,
+        "update_ms": 1000 * update_time / frames,
+    }
+    for phase in STRESS_PHASES:
+        report[f"{phase}_ms"] = 1000 * game.phases.totals.get(phase, 0.0) / frames
+    report.update({
+        "draw_ms": 1000 * draw_time / frames,
+        "visible_bricks": len(game.level.blocks_in(game.camera.rect)),
+        "bricks_left": game.level.get_remaining_blocks(),
+        "rewind_kb": game.rewind.size / 1024,
+    })
+    return report
+
+def benchmark_stress(frames: int = 60) -> Dict[str, Any]:
+    """Run the stress board at each of STRESS_SIZES and report update, draw and memory."""
+    names = ("build_ms", "board_kb", "update_ms", *(f"{phase}_ms" for phase in STRESS_PHASES), "draw_ms")
+    results: Dict[str, Any] = {}
+    for bricks, balls in STRESS_SIZES:
+        report = run_stress_test(bricks, balls, frames)
+        for name in names:
+            results[f"{bricks}x{balls}_{name}"] = report[name]
+    return results
+
+def benchmark_ball_collisions(ball_counts: Tuple[int, ...] = BALL_COLLISION_COUNTS,
+                              frames: int = 30) -> Dict[str, Any]:
+    """Time finding touching balls through the spatial hash and by testing
+    every pair, and a whole DDoS-mode update, at each of ball_counts balls in
+    the open space below the bricks."""
+    results: Dict[str, Any] = {}
+    for count in ball_counts:
+        game = _headless_game(count, balls=count, ddos=True)
+        balls = game.balls
+        
+        start = time.perf_counter()
+        for _ in range(frames):
+            game.collider.pairs(balls)
+        results[f"{count}_hash_ms"] = 1000 * (time.perf_counter() - start) / frames
+        results[f"{count}_hash_tests"] = game.collider.pairs_tested
+        repeats = max(1, frames * 10 // count)  # Every pair is slow enough to time a few frames
+        start = time.perf_counter()
+        for _ in range(repeats):
+            BallCollider.all_pairs(balls)
+        results[f"{count}_all_pairs_ms"] = 1000 * (time.perf_counter() - start) / repeats
+        
+        start = time.perf_counter()
+        for _ in range(frames):
+            game._update_game(1.0 / FPS, HeldKeys())
+        results[f"{count}_update_ms"] = 1000 * (time.perf_counter() - start) / frames
+    return results
+
+def benchmark_batched_balls(ball_counts: Tuple[int, ...] = BALL_BATCH_COUNTS, frames: int = 30) -> Dict[str, Any]:
+    """Time ball movement and collision per frame with per-ball and with
+    batched NumPy physics, at each of ball_counts balls in the open space
+    below the bricks, and the whole update for both."""
+    results: Dict[str, Any] = {}
+    for count in ball_counts:
+        for path, batched in (("scalar", False), ("batched", True)):
+            game = _headless_game(count, balls=count, batched_balls=batched)
+            game.phases = PhaseTimer()
+            
+            start = time.perf_counter()
+            for _ in range(frames):
+                game._update_game(1.0 / FPS, HeldKeys())
+            results[f"{count}_{path}_update_ms"] = 1000 * (time.perf_counter() - start) / frames
+            results[f"{count}_{path}_physics_ms"] = 1000 * (game.phases.totals["movement"]
+                                                            + game.phases.totals["collision"]) / frames
+        results[f"{count}_speedup"] = results[f"{count}_scalar_physics_ms"] / results[f"{count}_batched_physics_ms"]
+    return results
+
+def run_autopilot_games(games: int = AUTOPILOT_GAMES, seconds: float = AUTOPILOT_SECONDS, predict: bool = True,
+                        seed: int = 0, balls: int = AUTOPILOT_BALLS) -> Dict[str, Any]:
+    """Play seeded headless games with the autopilot at the wheel and report how it did.
+
+    Each game starts with balls balls at top speed below the bricks and
+    runs seconds of fixed frames with lives to spare. The
+    predicting policy only traces a path when a ball's velocity changes,
+    reported as predictions per ball-frame; chasing the mean ball x needs
+    none but misses more.
+    """
+    lost = bounces = bricks = frames = ball_frames = 0
+    predictions = 0
+    steer_time = 0.0
+    for game_number in range(games):
+        game = _headless_game(seed + game_number, balls,
+                              (50, SCREEN_HEIGHT // 2, SCREEN_WIDTH - 50, SCREEN_HEIGHT - 150), BALL_MAX_SPEED)
+        counts = {BallLost: 0, PaddleBounce: 0, BlockDestroyed: 0}
+        
+        def tally(batch: List[Any]) -> None:
+            counts[type(batch[0])] += len(batch)
+        
+        for event_type in counts:
+            game.events.subscribe(event_type, tally)
+        autopilot = Autopilot(predict)  # Steered here rather than by the game so steering is timed alone
+        for _ in range(int(seconds * FPS)):
+            start = time.perf_counter()
+            keys = autopilot.steer(game, 1.0 / FPS)
+            steer_time += time.perf_counter() - start
+            ball_frames += len(game.balls)
+            game._update_game(1.0 / FPS, keys)
+            frames += 1
+        lost += counts[BallLost]
+        bounces += counts[PaddleBounce]
+        bricks += counts[BlockDestroyed]
+        predictions += game.predictor.computed
+    return {
+        "games": games,
+        "balls_lost_per_minute": lost / (frames / FPS / 60),
+        "paddle_bounces": bounces,
+        "bricks_destroyed": bricks,
+        "steer_ms": 1000 * steer_time / frames,
+        "predictions_per_ball_frame": predictions / max(1, ball_frames),
+    }
+
+def benchmark_autopilot() -> Dict[str, Any]:
+    """Compare the predicting autopilot with chasing the mean ball x over the same seeded games."""
+    results: Dict[str, Any] = {}
+    for policy, predict in (("chase", False), ("predict", True)):
+        for name, value in run_autopilot_games(predict=predict).items():
+            results[f"{policy}_{name}"] = value
+    return results
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "paused": benchmark_paused_frame,
+    "balls": benchmark_ball_draw,
+    "renderers": benchmark_renderers,
+    "resolution": benchmark_internal_resolution,
+    "quality": benchmark_quality_tiers,
+    "threading": benchmark_threading,
+    "rewind": benchmark_rewind,
+    "stress": benchmark_stress,
+    "collisions": benchmark_ball_collisions,
+    "batched": benchmark_batched_balls,
+    "autopilot": benchmark_autopilot,
+}
+
+INTERPOLATION_SCENARIO_SPEEDS = (120, 240, 480)
+
+def run_interpolation_scenario(physics_rate: int = 10, renderer: str = "software") -> None:
+    """Visual check for render interpolation.
+
+    Balls sweep horizontally at a few speeds while physics runs at only
+    physics_rate steps per second. Press I to toggle interpolation: off,
+    the balls jump once per step; on, they glide at the display rate.
+    """
+    game = Game(renderer=renderer, physics_rate=physics_rate)
+    game.autosave = AutosaveWriter(None)
+    game._start_new_game()
+    game.lives = 10 ** 6
+    game.entities.teardown(EntityScope.LEVEL)
+    for row, speed in enumerate(INTERPOLATION_SCENARIO_SPEEDS):
+        ball = game.entities.spawn("balls", Ball(SCREEN_WIDTH // 2, 480 + row * 60, speed))
+        ball.velocity = Vector2D(speed, 0)
+    print(f"Physics at {physics_rate} Hz, drawing at up to {FPS} FPS. Press I to toggle interpolation.")
+    game.run()
+
+SCENARIOS: Dict[str, Callable[..., None]] = {
+    "interpolation": run_interpolation_scenario,
+}
+
+def parse_resolution(text: str) -> Tuple[int, int]:
+    """Parse a WIDTHxHEIGHT command-line value."""
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
 def main():
     """Main function to start the game."""
+    parser = argparse.ArgumentParser(description="AWS CloudBurst")
+    parser.add_argument("--soak", type=int, metavar="LEVELS",
+                        help="run a headless entity soak test over LEVELS levels and exit")
+    parser.add_argument("--benchmark", choices=sorted(BENCHMARKS),
+                        help="run a headless benchmark and print its results")
+    parser.add_argument("--renderer", choices=RENDERERS, default="software",
+                        help="render backend; texture backends fall back to software if unavailable")
+    parser.add_argument("--internal-resolution", type=parse_resolution, metavar="WxH",
+                        default=(SCREEN_WIDTH, SCREEN_HEIGHT),
+                        help=f"resolution frames are drawn at, {SCREEN_WIDTH}:{SCREEN_HEIGHT} aspect (e.g. 512x384)")
+    parser.add_argument("--scaling", choices=SCALING_MODES, default="scaled",
+                        help="scale frames with SDL, or by whole factors with letterboxing")
+    parser.add_argument("--window", type=parse_resolution, metavar="WxH",
+                        help="window size for integer scaling")
+    parser.add_argument("--fullscreen", action="store_true", help="run fullscreen")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run the simulation on its own thread at a fixed rate")
+    parser.add_argument("--physics-rate", type=int, metavar="HZ",
+                        help=f"step physics at a fixed rate (default: once per frame, or {FPS} Hz threaded)")
+    parser.add_argument("--no-interpolation", action="store_true",
+                        help="draw at the last physics step instead of interpolating (toggle in game with I)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), help="run a visual test scenario")
+    parser.add_argument("--seed", type=int, metavar="SEED",
+                        help=f"seed for levels past {len(LEVEL_FILES)} (default: new every game)")
+    parser.add_argument("--mode", choices=GAME_MODES, default="levels",
+                        help="levels one after another, an endless descent of brick rows, "
+                             "or a giant stress board of micro-bricks")
+    parser.add_argument("--stress-bricks", type=int, default=STRESS_DEFAULT_BRICKS, metavar="N",
+                        help=f"micro-bricks on the stress board (up to {STRESS_MAX_BRICKS})")
+    parser.add_argument("--stress-balls", type=int, default=STRESS_DEFAULT_BALLS, metavar="N",
+                        help=f"balls on the stress board (up to {STRESS_MAX_BALLS})")
+    parser.add_argument("--stress-report", action="store_true",
+                        help="play the stress board headless and print update ms, draw ms and memory")
+    parser.add_argument("--ball-collisions", action="store_true", help="make balls bounce off each other")
+    parser.add_argument("--ddos", action="store_true",
+                        help=f"chaos mode: storms of {DDOS_WAVE_BALLS} colliding balls every "
+                             f"{DDOS_WAVE_INTERVAL:g} s, up to {DDOS_MAX_BALLS}")
+    parser.add_argument("--batched-balls", action="store_true",
+                        help="move and collide all balls at once with NumPy (needs numpy)")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="demo mode: the paddle plays itself, heading for where the balls will land")
+    parser.add_argument("--aim-assist", action="store_true",
+                        help="draw where the next balls will bounce and reach the paddle")
+    parser.add_argument("--pregenerate", type=int, metavar="LEVELS",
+                        help="generate and validate LEVELS procedural levels in parallel and exit")
+    parser.add_argument("--quality", choices=["auto"] + [tier.name.lower() for tier in QualityTier],
+                        default="auto", help="pin a cosmetic quality tier instead of adapting to frame time")
+    args = parser.parse_args()
+    
+    try:
+        quality = None if args.quality == "auto" else QualityTier[args.quality.upper()]
+        display = DisplayConfig(args.internal_resolution, args.window, args.scaling, args.fullscreen, quality)
+        stress = StressConfig(args.stress_bricks, args.stress_balls)
+        if args.pregenerate is not None and args.pregenerate < 1:
+            raise ValueError(f"--pregenerate needs at least 1 level, got {args.pregenerate}")
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.benchmark:
+        use_headless_display()
+        for name, value in BENCHMARKS[args.benchmark]().items():
+            print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+        return
+    
+    if args.stress_report:
+        use_headless_display()
+        for name, value in run_stress_test(stress.bricks, stress.balls).items():
+            print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+        return
+    
+    if args.pregenerate is not None:
+        report = pregenerate_levels(args.pregenerate, args.seed or 0)
+        for name, value in report.items():
+            print(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+        if report["invalid"]:
+            sys.exit(1)
+        return
+    
+    if args.soak:
+        use_headless_display()
+        report = run_soak_test(args.soak)
+        print(f"Soak test passed: {report['levels']} levels, {report['entities_created']} entities created, "
+              f"peak memory growth {report['peak_memory_growth']} bytes")
+        return
+    
+    if args.scenario:
+        options = {"renderer": args.renderer}
+        if args.physics_rate:
+            options["physics_rate"] = args.physics_rate
+        SCENARIOS[args.scenario](**options)
+        return
+    
     try:
-        game = Game()
+        game = Game(renderer=args.renderer, display=display, threaded=args.threaded,
+                    physics_rate=args.physics_rate, interpolate=not args.no_interpolation, level_seed=args.seed,
+                    mode=args.mode, stress=stress, ball_collisions=args.ball_collisions, ddos=args.ddos,
+                    batched_balls=args.batched_balls, autopilot=args.autopilot, aim_assist=args.aim_assist)
         game.run()
     except Exception as e:
         print(f"Error running AWS CloudBurst: {e}")
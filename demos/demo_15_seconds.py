@@ -91,6 +91,7 @@ def demo_15_seconds():
     
     start_time = time.time()
     frames = 0
+    autopilot = aws_cloudburst.Autopilot()
     demo_phase = 0
     
     while time.time() - start_time < 15.0:
@@ -119,15 +120,9 @@ def demo_15_seconds():
         # Update game elements
         keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_a: False, pygame.K_d: False}
         
-        # Automated paddle movement for demo
+        # Autopilot paddle for demo: head for where the balls will land
         if demo_phase == 1 or demo_phase == 3:
-            # Follow the balls
-            if game.balls:
-                target_x = game.balls[0].position.x
-                if game.paddle.position.x < target_x - 20:
-                    keys[pygame.K_RIGHT] = True
-                elif game.paddle.position.x > target_x + 20:
-                    keys[pygame.K_LEFT] = True
+            keys = autopilot.steer(game, dt)
         
         game.paddle.update(dt, keys)
         
@@ -98,6 +98,7 @@ def demo_30_seconds_improved():
     start_time = time.time()
     frames = 0
     last_block_hit_time = 0
+    autopilot = aws_cloudburst.Autopilot()
     
     while time.time() - start_time < 30.0:
         current_time = time.time() - start_time
@@ -130,22 +131,8 @@ def demo_30_seconds_improved():
             phase = "FINALE"
             phase_color = aws_cloudburst.AWS_WHITE
         
-        # Smart paddle movement for optimal demo
-        keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_a: False, pygame.K_d: False}
-        
-        if game.balls:
-            # Intelligent paddle AI
-            target_x = sum(ball.position.x for ball in game.balls) / len(game.balls)
-            
-            # Add some prediction for better ball catching
-            avg_velocity_x = sum(ball.velocity.x for ball in game.balls) / len(game.balls)
-            predicted_x = target_x + avg_velocity_x * 0.3
-            
-            if game.paddle.position.x < predicted_x - 40:
-                keys[pygame.K_RIGHT] = True
-            elif game.paddle.position.x > predicted_x + 40:
-                keys[pygame.K_LEFT] = True
-        
+        # Autopilot paddle: head for where the balls will land
+        keys = autopilot.steer(game, dt)
         game.paddle.update(dt, keys)
         
         # Update balls with enhanced collision
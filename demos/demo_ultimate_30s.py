@@ -115,6 +115,7 @@ def demo_ultimate_30s():
     start_time = time.time()
     frames = 0
     destruction_effects = []
+    autopilot = aws_cloudburst.Autopilot()
     
     while time.time() - start_time < 30.0:
         current_time = time.time() - start_time
@@ -192,27 +193,8 @@ def demo_ultimate_30s():
                         ball4.velocity.y = -180
                         game.balls.append(ball4)
         
-        # Intelligent paddle movement for perfect demo
-        keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_a: False, pygame.K_d: False}
-        
-        if game.balls:
-            # Advanced AI for optimal ball management
-            closest_ball = min(game.balls, key=lambda b: abs(b.position.y - game.paddle.position.y))
-            target_x = closest_ball.position.x
-            
-            # Predict ball position
-            if closest_ball.velocity.y > 0:  # Ball coming down
-                time_to_paddle = (game.paddle.position.y - closest_ball.position.y) / closest_ball.velocity.y
-                predicted_x = closest_ball.position.x + closest_ball.velocity.x * time_to_paddle
-                target_x = predicted_x
-            
-            # Move paddle with some smoothing
-            paddle_speed = 500 if current_time > 15.0 else 400
-            if game.paddle.position.x < target_x - 30:
-                keys[pygame.K_RIGHT] = True
-            elif game.paddle.position.x > target_x + 30:
-                keys[pygame.K_LEFT] = True
-        
+        # Autopilot paddle: head for where the balls will land
+        keys = autopilot.steer(game, dt)
         game.paddle.update(dt, keys)
         
         # Update balls with enhanced physics
@@ -117,6 +117,7 @@ def demo_video_ready():
     
     start_time = time.time()
     frames = 0
+    autopilot = aws_cloudburst.Autopilot()
     
     while time.time() - start_time < 15.0:
         current_time = time.time() - start_time
@@ -146,17 +147,8 @@ def demo_video_ready():
             segment = "COMPLETE"
             segment_color = aws_cloudburst.AWS_WHITE
         
-        # Automated paddle movement for perfect demo
-        keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_a: False, pygame.K_d: False}
-        
-        if game.balls:
-            # Smart paddle AI for demo
-            target_x = sum(ball.position.x for ball in game.balls) / len(game.balls)
-            if game.paddle.position.x < target_x - 30:
-                keys[pygame.K_RIGHT] = True
-            elif game.paddle.position.x > target_x + 30:
-                keys[pygame.K_LEFT] = True
-        
+        # Autopilot paddle: head for where the balls will land
+        keys = autopilot.steer(game, dt)
         game.paddle.update(dt, keys)
         
         # Update balls with perfect collision
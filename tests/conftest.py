@@ -0,0 +1,53 @@
+"""
+Shared pytest setup: run headless and keep pygame initialized between tests.
+Test scripts also import make_game and scan from here when run directly.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import aws_cloudburst
+
+
+def make_game(seed=0, balls=0, level_number=None, clear=False, **options):
+    """A seeded headless game with lives to spare; options go to aws_cloudburst.Game.
+
+    level_number swaps in that level, clear drops the starting ball and any
+    pickups, and balls extra balls are scattered below the bricks.
+    """
+    game = aws_cloudburst._headless_game(seed, **options)
+    if level_number is not None:
+        game.current_level = level_number
+        game.level = aws_cloudburst.Level(level_number, seed)
+        game.rewind.clear()
+    if clear:
+        game.entities.teardown(aws_cloudburst.EntityScope.LEVEL)
+    for _ in range(balls):
+        game.entities.spawn("balls", aws_cloudburst.Ball(random.uniform(50, 900), random.uniform(300, 600)))
+    return game
+
+
+def scan(blocks, rect):
+    """Standing blocks that overlap rect, by testing every block."""
+    return [block for block in blocks if not block.destroyed and rect.colliderect(block.get_rect())]
+
+
+@pytest.fixture(autouse=True)
+def isolated_autosave(tmp_path, monkeypatch):
+    """Keep autosaves written by pausing or finishing levels out of the repository."""
+    monkeypatch.setattr(aws_cloudburst, "AUTOSAVE_FILE", str(tmp_path / "autosave.bin"))
+
+
+@pytest.fixture(autouse=True)
+def pygame_initialized():
+    """Some test scripts call pygame.quit() at import time; re-init before each test."""
+    pygame.init()
+    yield
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script to verify ball-ball collisions and the DDoS chaos mode.
+"""
+
+import sys
+import os
+import random
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Ball, BallCollider, HeldKeys, Vector2D
+from conftest import make_game
+
+def storm(count, rng):
+    """count balls packed into the open space below the bricks."""
+    return [Ball(rng.uniform(20, aws_cloudburst.SCREEN_WIDTH - 20),
+                 rng.uniform(aws_cloudburst.SCREEN_HEIGHT // 2, aws_cloudburst.SCREEN_HEIGHT - 80))
+            for _ in range(count)]
+
+def momentum_and_energy(balls):
+    return (sum(ball.radius ** 2 * ball.velocity.x for ball in balls),
+            sum(ball.radius ** 2 * ball.velocity.y for ball in balls),
+            sum(ball.radius ** 2 * (ball.velocity.x ** 2 + ball.velocity.y ** 2) for ball in balls))
+
+def test_head_on_collision():
+    """Test that two equal balls meeting head on swap velocities and end up just touching."""
+    print("🎱 Testing ball collisions...")
+    a, b = Ball(100, 100), Ball(112, 100)
+    a.velocity, b.velocity = Vector2D(200.0, 0.0), Vector2D(-50.0, 0.0)
+    assert BallCollider().resolve([a, b]) == 1
+    assert (a.velocity.x, b.velocity.x) == (-50.0, 200.0)
+    assert abs((b.position.x - a.position.x) - (a.radius + b.radius)) < 1e-9
+
+    # Moving apart already: separated but not bounced back together
+    a.position, b.position = Vector2D(100, 100), Vector2D(110, 100)
+    assert BallCollider().resolve([a, b]) == 0 and (a.velocity.x, b.velocity.x) == (-50.0, 200.0)
+    print("   ✅ Head-on balls swap velocities")
+
+def test_hash_finds_every_pair():
+    """Test that the spatial hash finds exactly the pairs an all-pairs check finds, with far fewer tests."""
+    rng = random.Random(5)
+    collider = BallCollider()
+    for count in (2, 30, 300, 1000):
+        balls = storm(count, rng)
+        for ball in rng.sample(balls, count // 10):
+            ball.radius = rng.choice((4, 8, 20))
+        assert sorted(collider.pairs(balls)) == BallCollider.all_pairs(balls), f"{count} balls"
+    assert collider.pairs_tested < 1000 * 999 // 2 // 10
+    print(f"   ✅ Hash matches every-pair check; {collider.pairs_tested} tests for 1000 balls")
+
+def test_conservation():
+    """Test that a crowded storm of collisions conserves momentum and kinetic energy."""
+    balls = storm(400, random.Random(6))
+    before = momentum_and_energy(balls)
+    bounced = BallCollider().resolve(balls)
+    after = momentum_and_energy(balls)
+    assert bounced > 10
+    assert all(abs(x - y) <= 1e-6 * max(1.0, abs(x)) for x, y in zip(before, after)), (before, after)
+    print(f"   ✅ {bounced} bounces conserve momentum and energy")
+
+def test_optional_in_game():
+    """Test that balls only collide in game when asked to."""
+    for enabled in (False, True):
+        game = make_game(4, clear=True, ball_collisions=enabled)
+        a = game.entities.spawn("balls", Ball(400, 500))
+        b = game.entities.spawn("balls", Ball(440, 500))
+        a.velocity, b.velocity = Vector2D(300.0, 0.0), Vector2D(-300.0, 0.0)
+        for _ in range(12):
+            game._update_game(1.0 / 60, HeldKeys())
+        assert (a.velocity.x < 0) == enabled, f"Collisions {'on' if enabled else 'off'}"
+    print("   ✅ Collisions off by default, on with ball_collisions")
+
+def test_ddos_storms():
+    """Test that DDoS mode sends capped ball storms without the frame rate collapsing."""
+    game = make_game(4, clear=True, ddos=True)
+    assert game.ball_collisions
+    start = len(game.balls)
+    for _ in range(int(aws_cloudburst.DDOS_WAVE_INTERVAL * 60) + 1):
+        game._update_game(1.0 / 60, HeldKeys())
+    assert len(game.balls) >= start + aws_cloudburst.DDOS_WAVE_BALLS - 5  # A few may already be lost
+
+    while len(game.balls) < aws_cloudburst.DDOS_MAX_BALLS - 10:
+        game._spawn_ball()
+    game._ddos_wave()
+    game._ddos_wave()
+    assert len(game.balls) == aws_cloudburst.DDOS_MAX_BALLS
+
+    data = game.save_state()
+    restored = aws_cloudburst.Game(ddos=True)
+    restored.load_state(data)
+    assert restored.scheduler.is_active("ddos_wave")
+
+    report = aws_cloudburst.benchmark_ball_collisions((1000,), frames=5)
+    assert report["1000_hash_ms"] * 4 < report["1000_all_pairs_ms"], report
+    print(f"   ✅ Storm of {len(game.balls)} balls; 1000 balls hash {report['1000_hash_ms']:.2f} ms, "
+          f"every pair {report['1000_all_pairs_ms']:.2f} ms, update {report['1000_update_ms']:.2f} ms")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_head_on_collision()
+    test_hash_finds_every_pair()
+    test_conservation()
+    test_optional_in_game()
+    test_ddos_storms()
+    pygame.quit()
+    print("\n✅ All ball collision tests passed!")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batched NumPy ball physics against the per-ball path.
+"""
+
+import sys
+import os
+import random
+import pygame
+import pytest
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Ball, BallBatch, HeldKeys, InputEvent, Level, StressConfig, Vector2D
+from conftest import make_game
+
+pytest.importorskip("numpy")
+
+def play(batched, mode, frames, balls=200, seed=8):
+    """Play a game with the paddle sweeping left then right, saving its state every 10 frames."""
+    options = {"stress": StressConfig(3000, 1)} if mode == "stress" else {}
+    game = make_game(seed, level_number=4 if mode == "levels" else None, mode=mode, batched_balls=batched,
+                     **options)
+    level = game.level
+    for _ in range(balls):
+        ball = game.entities.spawn("balls", Ball(random.uniform(20, level.width - 20),
+                                                 random.uniform(level.height * 0.3, level.height - 60)))
+        ball.velocity = Vector2D(random.uniform(-400, 400), random.uniform(-400, 400))
+    assert (game.ball_batch is not None) == batched
+    random.seed(1)  # Power-up drops draw on the shared generator
+    keys = HeldKeys()
+    keys.apply(InputEvent(0.0, pygame.K_LEFT, True, True))
+    states = []
+    for frame in range(frames):
+        if frame == frames // 2:
+            keys.apply(InputEvent(0.0, pygame.K_LEFT, False, False))
+            keys.apply(InputEvent(0.0, pygame.K_RIGHT, True, True))
+        game._update_game(1.0 / 60, keys)
+        if frame % 10 == 0 or frame == frames - 1:
+            states.append(game.save_state())
+    return game, states
+
+def play_both(mode, frames, **options):
+    """Play a per-ball and a batched game, checking they never drift apart."""
+    scalar, expected = play(False, mode, frames, **options)
+    batched, states = play(True, mode, frames, **options)
+    for index, (want, got) in enumerate(zip(expected, states)):
+        assert want == got, f"{mode}: states differ by frame {index * 10}"
+    return scalar, batched
+
+def test_levels_match_scalar():
+    """Test that batched physics plays a level exactly as per-ball physics does."""
+    print("🧮 Testing batched ball physics...")
+    scalar, batched = play_both("levels", 400)
+    assert scalar.score > 0 and scalar.level.get_remaining_blocks() < len(scalar.level.blocks)
+    assert len(scalar.balls) < 200, "Some balls should have been lost"
+    print(f"   ✅ 400 frames identical on a level with moving bricks, score {scalar.score}")
+
+def test_other_boards_match_scalar():
+    """Test that the batched path also matches on the endless descent and the stress board."""
+    for mode in ("descent", "stress"):
+        scalar, _ = play_both(mode, 240, balls=120)
+        assert scalar.score > 0
+    print("   ✅ Descent and stress boards identical")
+
+def test_slow_motion_and_walls():
+    """Test that slow motion, wall clamps and losses match Ball.update ball by ball."""
+    rng = random.Random(3)
+    balls = [Ball(rng.uniform(-5, 1030), rng.uniform(-5, 780)) for _ in range(500)]
+    for ball in balls:
+        ball.velocity = Vector2D(rng.uniform(-900, 900), rng.uniform(-900, 900))
+    copies = [Ball(ball.position.x, ball.position.y) for ball in balls]
+    for copy, ball in zip(copies, balls):
+        copy.velocity = Vector2D(ball.velocity.x, ball.velocity.y)
+    batch = BallBatch()
+    for slow in (False, True, False):
+        lost = batch.move(balls, 1.0 / 30, slow, 1000, 700)
+        for copy in copies:
+            copy.update(1.0 / 30, slow, 1000)
+        assert lost == [i for i, copy in enumerate(copies) if copy.position.y > 700]
+        for copy, ball in zip(copies, balls):
+            assert (copy.position.x, copy.position.y) == (ball.position.x, ball.position.y)
+            assert (copy.velocity.x, copy.velocity.y) == (ball.velocity.x, ball.velocity.y)
+            assert copy.trail_positions == ball.trail_positions
+    print("   ✅ Movement, walls and slow motion match Ball.update")
+
+def test_contacts_match_rects():
+    """Test that array overlap tests find what pygame rects find, negative coordinates included."""
+    rng = random.Random(4)
+    level = Level(3)
+    balls = [Ball(rng.uniform(-10, 1030), rng.uniform(-10, 500)) for _ in range(2000)]
+    for ball in balls:
+        ball.radius = rng.choice((3, 8, 40))
+        ball.velocity = Vector2D(0.0, rng.choice((-1.0, 1.0)))
+    paddle = pygame.Rect(300, 200, 200, 20)
+    bounced, touching = BallBatch().contacts(balls, paddle, level)
+    rects = [pygame.Rect(b.position.x - b.radius, b.position.y - b.radius, b.radius * 2, b.radius * 2)
+             for b in balls]
+    assert bounced == [i for i, rect in enumerate(rects) if rect.colliderect(paddle) and balls[i].velocity.y > 0]
+    expected = [(i, hits) for i, hits in ((i, [j for j, block in enumerate(level.blocks)
+                                               if rect.colliderect(block.get_rect())])
+                                          for i, rect in enumerate(rects)) if hits]
+    assert touching == expected
+    print(f"   ✅ {len(touching)} ball-brick contacts match pygame")
+
+def test_moving_bricks_keep_packed_grid():
+    """Test that sliding bricks refresh their own rows without re-packing the level's grid."""
+    rng = random.Random(5)
+    level = Level(4)
+    assert level.movers, "Level 4 should have moving bricks"
+    balls = [Ball(rng.uniform(0, 1020), rng.uniform(0, 500)) for _ in range(1500)]
+    batch = BallBatch()
+    paddle = pygame.Rect(0, -100, 10, 10)
+    packed = None
+    for _ in range(90):
+        level.update(1.0 / 30)
+        _, touching = batch.contacts(balls, paddle, level)
+        if packed is None:
+            packed = batch._bricks[1]
+        assert batch._bricks[1] is packed, "The packed grid should be built once"
+        rects = [pygame.Rect(b.position.x - b.radius, b.position.y - b.radius, b.radius * 2, b.radius * 2)
+                 for b in balls]
+        expected = [(i, hits) for i, hits in ((i, [j for j, block in enumerate(level.blocks)
+                                                   if rect.colliderect(block.get_rect())])
+                                              for i, rect in enumerate(rects)) if hits]
+        assert touching == expected
+    print(f"   ✅ {len(level.movers)} moving bricks tracked over 3 s from one packed grid")
+
+def test_throughput():
+    """Report per-ball and batched physics time at 10 to 10,000 balls; timings are not asserted."""
+    report = aws_cloudburst.benchmark_batched_balls((10, 100, 10000), frames=5)
+    for count in (10, 100, 10000):
+        assert report[f"{count}_scalar_physics_ms"] > 0 and report[f"{count}_batched_physics_ms"] > 0
+        print(f"   ✅ {count} balls: per-ball {report[f'{count}_scalar_physics_ms']:.2f} ms, "
+              f"batched {report[f'{count}_batched_physics_ms']:.2f} ms ({report[f'{count}_speedup']:.1f}x)")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_levels_match_scalar()
+    test_other_boards_match_scalar()
+    test_slow_motion_and_walls()
+    test_contacts_match_rects()
+    test_moving_bricks_keep_packed_grid()
+    test_throughput()
+    pygame.quit()
+    print("\n✅ All batched ball physics tests passed!")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script to verify chain-reaction bricks.
+"""
+
+import sys
+import os
+import time
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import (AdjacencyIndex, BlockType, ChainReactions, DescentLevel, HeldKeys, Level,
+                            StressConfig, StressLevel)
+from conftest import make_game
+
+def chain_game(bricks=3000, block_type=BlockType.AUTO_SCALING):
+    """A stress game whose whole board is chain bricks, with no balls in play."""
+    game = make_game(2, clear=True, mode="stress", stress=StressConfig(bricks, 1))
+    for block in game.level.blocks:
+        block.reset(block_type)
+    return game
+
+def beside(a, b):
+    """Whether two block rects are within half a brick, by brute force."""
+    margin = max(1, min(a.width, a.height) // 2)
+    return a.inflate(2 * margin, 2 * margin).colliderect(b)
+
+def test_adjacency_matches_geometry():
+    """Test that the adjacency index finds every block beside each block, and only those."""
+    print("💥 Testing chain reactions...")
+    for level in (Level(1), Level(3), Level(5)):
+        rects = [block.get_rect() for block in level.blocks]
+        for i, rect in enumerate(rects):
+            expected = {j for j, other in enumerate(rects) if j != i and beside(rect, other)}
+            assert set(level.neighbours(i)) == expected, f"Level {level.level_number} block {i}"
+            assert set(level.neighbours(i, diagonal=False)) <= expected
+
+    # The stress board works its neighbours out arithmetically; it must agree with geometry
+    level = StressLevel(700)
+    adjacency = AdjacencyIndex(level.blocks)
+    for i in range(len(level.blocks)):
+        assert sorted(level.neighbours(i)) == sorted(adjacency.orthogonal[i] + adjacency.diagonal[i])
+        assert sorted(level.neighbours(i, diagonal=False)) == sorted(adjacency.orthogonal[i])
+    assert len(level.neighbours(level.COLUMNS + 5)) == 8 and len(level.neighbours(0, diagonal=False)) == 2
+    print("   ✅ Adjacency index agrees with block geometry")
+
+def test_descent_neighbours():
+    """Test that descent neighbours follow the rows as their pool slots are refilled."""
+    level = DescentLevel(4)
+    for _ in range(600):
+        level.update(1.0 / 60)
+    for i, block in enumerate(level.blocks):
+        if block.destroyed:
+            continue
+        rect = block.get_rect()
+        expected = {j for j, other in enumerate(level.blocks)
+                    if j != i and not other.destroyed and beside(rect, other.get_rect())}
+        found = {j for j in level.neighbours(i) if not level.blocks[j].destroyed}
+        assert found == expected, f"Descent block {i}"
+    print("   ✅ Descent neighbours follow the pool")
+
+def test_chain_is_bounded_per_frame():
+    """Test that one hit can clear a board of chain bricks without any frame doing more than the budget."""
+    game = chain_game()
+    level = game.level
+    standing = len(level.blocks)
+    game._hit_block(level.blocks[level.COLUMNS * 10 + 40], "ball")
+    frames, worst = 0, 0.0
+    while (level.get_remaining_blocks() or game.chains.pending) and frames < 1000:
+        start = time.perf_counter()
+        game._update_game(1.0 / 60, HeldKeys())
+        worst = max(worst, time.perf_counter() - start)
+        remaining = level.get_remaining_blocks()
+        assert standing - remaining <= game.chains.budget, f"{standing - remaining} bricks in one frame"
+        standing = remaining
+        frames += 1
+    assert level.get_remaining_blocks() == 0 and not game.chains.pending
+    assert frames > len(level.blocks) // game.chains.budget
+    print(f"   ✅ {len(level.blocks)} brick chain over {frames} frames, worst frame {worst * 1000:.2f} ms")
+
+def test_teardown_skips_diagonals():
+    """Test that a CloudFormation teardown destroys the four bricks beside it outright."""
+    level = StressLevel(500)
+    for block in level.blocks:
+        block.reset(BlockType.EKS)
+    centre = level.COLUMNS + 3
+    level.blocks[centre].reset(BlockType.CLOUDFORMATION)
+    level.blocks[centre].destroyed = True
+    chains = ChainReactions()
+    chains.trigger(level, level.blocks[centre])
+    hits = []
+    assert chains.advance(level, lambda block, damage: hits.append((level.index_of[block], damage))) == 4
+    assert sorted(hits) == sorted((i, 3) for i in level.neighbours(centre, diagonal=False))
+    print("   ✅ Teardown hits the four beside it for three")
+
+def test_batched_scoring_and_drops():
+    """Test that a chain scores as one batch and drops at most CHAIN_MAX_DROPS power-ups per frame."""
+    game = chain_game(bricks=2000, block_type=BlockType.CLOUDFORMATION)
+    level = game.level
+    block = level.blocks[level.COLUMNS * 5 + 20]
+    block.hit(block.hits_remaining - 1)
+    standing = level.get_remaining_blocks()
+    game._hit_block(block, "ball")
+    points = BlockType.CLOUDFORMATION.value[2]
+    for _ in range(40):
+        before_score, before_drops = game.score, len(game.powerups)
+        game._update_game(1.0 / 60, HeldKeys())
+        destroyed, standing = standing - level.get_remaining_blocks(), level.get_remaining_blocks()
+        assert game.score - before_score == destroyed * points
+        assert len(game.powerups) - before_drops <= aws_cloudburst.CHAIN_MAX_DROPS + 1  # One for the ball's hit
+    assert game.score > 50 * points
+    print(f"   ✅ Scored {game.score} in batches, {len(game.powerups)} power-ups dropped")
+
+def test_pending_chain_survives_save_state():
+    """Test that a save state taken mid-chain resumes the same chain."""
+    game = chain_game(bricks=2000)
+    game._hit_block(game.level.blocks[500], "ball")
+    for _ in range(3):
+        game._update_game(1.0 / 60, HeldKeys())
+    assert game.chains.pending
+    data = game.save_state()
+    restored = aws_cloudburst.Game()
+    restored.detach_presentation()
+    restored.load_state(data)
+    assert list(restored.chains.pending) == list(game.chains.pending)
+    assert restored.save_state() == data
+    for _ in range(5):
+        game._update_game(1.0 / 60, HeldKeys())
+        restored._update_game(1.0 / 60, HeldKeys())
+    assert [block.destroyed for block in restored.level.blocks] == [block.destroyed for block in game.level.blocks]
+    print(f"   ✅ {len(game.chains.pending)} pending chain bricks saved and resumed")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_adjacency_matches_geometry()
+    test_descent_neighbours()
+    test_chain_is_bounded_per_frame()
+    test_teardown_skips_diagonals()
+    test_batched_scoring_and_drops()
+    test_pending_chain_survives_save_state()
+    pygame.quit()
+    print("\n✅ All chain reaction tests passed!")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the endless descent mode.
+"""
+
+import sys
+import os
+import time
+import random
+import tracemalloc
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Ball, DescentLevel, GameState, HeldKeys, LevelGenerator, RewindBuffer
+from conftest import make_game
+
+POOL_SIZE = aws_cloudburst.DESCENT_POOL_ROWS * aws_cloudburst.LEVEL_GRID_COLUMNS
+
+def alive_rows(level):
+    """Bricks on the board keyed by run row, as (column position, type) pairs."""
+    rows = {}
+    for slot in range(aws_cloudburst.DESCENT_POOL_ROWS):
+        row = level._slot_row(slot)
+        bricks = tuple((block.position.x, block.block_type) for block in level._slot(slot) if not block.destroyed)
+        if row >= 0 and bricks:
+            rows[row] = bricks
+    return rows
+
+def test_rows_are_seeded():
+    """Test that the rows of a run depend only on the seed."""
+    print("⬇️  Testing endless descent...")
+    assert [LevelGenerator.row(3, i) for i in range(40)] == [LevelGenerator.row(3, i) for i in range(40)]
+    assert [LevelGenerator.row(3, i) for i in range(40)] != [LevelGenerator.row(4, i) for i in range(40)]
+    fortress = LevelGenerator.row(3, aws_cloudburst.DESCENT_FORTRESS_EVERY - 1)
+    assert sum(block_type is not None for block_type in fortress) >= aws_cloudburst.LEVEL_GRID_COLUMNS - 2
+    assert alive_rows(DescentLevel(3)) == alive_rows(DescentLevel(3))
+    print("   ✅ Rows generated from (seed, row)")
+
+def test_pool_is_reused():
+    """Test that a long descent refills one fixed pool of blocks in place."""
+    level = DescentLevel(8)
+    pool = [id(block) for block in level.blocks]
+    for _ in range(60 * 60 * 5):  # Five minutes
+        level.update(1.0 / 60)
+    assert [id(block) for block in level.blocks] == pool
+    assert level.newest_row > 150 and level.level_number > 15
+    assert aws_cloudburst.DESCENT_SPEED < level.speed <= aws_cloudburst.DESCENT_MAX_SPEED
+
+    rows = alive_rows(level)
+    for row, bricks in rows.items():
+        expected = [block_type for block_type in LevelGenerator.row(8, row) if block_type is not None]
+        assert [block_type for _, block_type in bricks] == expected, f"Row {row} not refilled from the seed"
+    top = aws_cloudburst.DESCENT_TOP
+    assert all(top - level.ROW_PITCH < block.position.y <= aws_cloudburst.DESCENT_DANGER_Y
+               for block in level.blocks if not block.destroyed)
+    print(f"   ✅ {len(pool)} blocks reused for {level.newest_row} rows")
+
+def test_breached_row_costs_a_life():
+    """Test that a row crossing the danger line with bricks left costs one life."""
+    game = make_game(5, mode="descent")
+    game.lives = 3
+    level = game.level
+    lowest = max((slot for slot in range(aws_cloudburst.DESCENT_POOL_ROWS)
+                  if any(not block.destroyed for block in level._slot(slot))),
+                 key=lambda slot: level._slot(slot)[0].position.y)
+    distance = aws_cloudburst.DESCENT_DANGER_Y - level._slot(lowest)[0].position.y
+    level.scroll_to(level.scroll + distance - 0.5)
+    game._update_game(1.0, HeldKeys())
+    assert game.lives == 2
+    assert all(block.destroyed for block in level._slot(lowest))
+
+    game.lives = 1
+    game.level.scroll_to(game.level.scroll + level.ROW_PITCH - 1)
+    while game.state == GameState.PLAYING:
+        game._update_game(1.0 / 60, HeldKeys())
+    assert game.lives == 0 and game.state == GameState.GAME_OVER
+    print("   ✅ Breached rows cost lives and end the game")
+
+def test_never_completes():
+    """Test that clearing the whole board does not end the level."""
+    game = make_game(5, mode="descent")
+    for block in game.level.blocks:
+        block.destroyed = True
+    game._update_game(1.0 / 60, HeldKeys())
+    assert game.state == GameState.PLAYING and game.level.level_number == 1
+    print("   ✅ No level complete in descent")
+
+def test_save_and_rewind():
+    """Test that save states and rewind keep the scroll and the rows on the board."""
+    game = make_game(5, balls=3, mode="descent")
+    for frame in range(600):
+        if frame % 20 == 0:
+            alive = [block for block in game.level.blocks if not block.destroyed]
+            game._hit_block(random.choice(alive), "ball")
+        game._update_game(1.0 / 30, HeldKeys())
+    data = game.save_state()
+
+    restored = aws_cloudburst.Game()
+    restored.load_state(data)
+    assert restored.save_state() == data
+    assert restored.level.endless and restored.level.newest_row == game.level.newest_row
+    assert alive_rows(restored.level) == alive_rows(game.level)
+
+    recorded = []
+    for _ in range(120):
+        game._update_game(1.0 / 30, HeldKeys())
+        recorded.append(RewindBuffer._capture(game))
+    for index in range(0, 120, 9):
+        game.rewind.restore(game, game.rewind.frames - 120 + index)
+        assert RewindBuffer._capture(game) == recorded[index], f"Frame {index} differs"
+    print(f"   ✅ {len(data)} byte save state and rewind across row refills")
+
+def test_flat_cost():
+    """Test that memory and frame cost stay flat as the run goes on."""
+    game = make_game(5, balls=5, mode="descent")
+    keys = HeldKeys()
+
+    def run(frames):
+        start = time.perf_counter()
+        for _ in range(frames):
+            game._update_game(1.0 / 60, keys)
+            if not game.balls:
+                game.entities.spawn("balls", Ball(500, 500))
+        return (time.perf_counter() - start) / frames
+
+    run(600)
+    game.rewind.clear()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    early = run(600)
+    game.rewind.clear()
+    for _ in range(10):
+        run(600)
+        game.rewind.clear()
+    late = run(600)
+    game.rewind.clear()
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    assert len(game.level.blocks) == POOL_SIZE
+    assert growth < 256 * 1024, f"Memory grew {growth} bytes"
+    assert late < early * 2 + 0.0005, f"Frame cost {early * 1000:.3f} -> {late * 1000:.3f} ms"
+    print(f"   ✅ Frame {early * 1000:.3f} -> {late * 1000:.3f} ms, memory growth {growth} bytes")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_rows_are_seeded()
+    test_pool_is_reused()
+    test_breached_row_costs_a_life()
+    test_never_completes()
+    test_save_and_rewind()
+    test_flat_cost()
+    pygame.quit()
+    print("\n✅ All descent tests passed!")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script to verify entity lifecycle management across levels and games.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_level_teardown():
+    """Test that lasers, shields and timed effects do not carry over."""
+    print("🎮 Testing entity teardown on level completion...")
+    
+    game = aws_cloudburst.Game()
+    game._start_new_game()
+    
+    # Fill the level with every kind of entity and effect
+    game._activate_powerup(aws_cloudburst.PowerUpType.LASER_PADDLE)
+    game._activate_powerup(aws_cloudburst.PowerUpType.SHIELD)
+    game._activate_powerup(aws_cloudburst.PowerUpType.SLOW_MOTION)
+    game._activate_powerup(aws_cloudburst.PowerUpType.PADDLE_EXTEND)
+    game._activate_powerup(aws_cloudburst.PowerUpType.MULTI_BALL)
+    game.entities.spawn("lasers", aws_cloudburst.Laser(500, 600))
+    game.laser_cooldown = aws_cloudburst.LASER_COOLDOWN
+    print(f"   • Entities before completion: {game.entities.counts()}")
+    
+    game._complete_level()
+    print(f"   • Entities after completion: {game.entities.counts()}")
+    
+    assert game.entities.counts() == {"paddles": 1, "balls": 1, "powerups": 0, "lasers": 0, "shields": 0}
+    assert game.shield is None
+    assert game.laser_cooldown == 0
+    assert not game.slow_motion_active
+    assert not game.paddle.extended
+    assert game.paddle.width == aws_cloudburst.PADDLE_WIDTH
+    assert all(remaining == 0 for remaining in game.active_powerups.values())
+    print("   ✅ Level teardown leaves only the fresh paddle and ball")
+
+def test_new_game_teardown():
+    """Test that starting a new game replaces the paddle and clears everything."""
+    game = aws_cloudburst.Game()
+    game._start_new_game()
+    old_paddle = game.paddle
+    game._activate_powerup(aws_cloudburst.PowerUpType.SHIELD)
+    game.entities.spawn("lasers", aws_cloudburst.Laser(500, 600))
+    
+    game._start_new_game()
+    
+    assert game.paddle is not old_paddle
+    assert game.entities.counts() == {"paddles": 1, "balls": 1, "powerups": 0, "lasers": 0, "shields": 0}
+    game.entities.assert_consistent()
+    print("   ✅ New game teardown resets all entity kinds")
+
+def test_registry_assertions():
+    """Test that the registry rejects misfiled entities."""
+    registry = aws_cloudburst.EntityRegistry()
+    try:
+        registry.spawn("balls", aws_cloudburst.Laser(0, 0))
+    except AssertionError:
+        print("   ✅ Registry rejects wrong entity kind")
+    else:
+        raise AssertionError("Registry accepted a laser as a ball")
+    
+    registry.spawn("lasers", aws_cloudburst.Laser(0, 0))
+    registry.teardown(aws_cloudburst.EntityScope.LEVEL)
+    registry.assert_torn_down(aws_cloudburst.EntityScope.LEVEL)
+
+def test_soak():
+    """Run a short headless soak and check entity counts and memory stay flat."""
+    report = aws_cloudburst.run_soak_test(levels=100, frames_per_level=20)
+    print(f"   • Soak report: {report}")
+    assert report["levels"] == 100
+
+if __name__ == "__main__":
+    pygame.init()
+    test_level_teardown()
+    test_new_game_teardown()
+    test_registry_assertions()
+    test_soak()
+    pygame.quit()
+    print("\n✅ All entity lifecycle tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the batched game-event bus.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_bus_batches_in_type_order():
+    """Test that subscribers get whole batches, rules before level completion."""
+    print("📬 Testing event bus batching...")
+    bus = aws_cloudburst.GameEventBus()
+    received = []
+    bus.subscribe(aws_cloudburst.LevelComplete, lambda batch: received.append(("level", len(batch))))
+    bus.subscribe(aws_cloudburst.BlockDestroyed, lambda batch: received.append(("destroyed", len(batch))))
+    
+    block = aws_cloudburst.Block(100, 100, aws_cloudburst.BlockType.S3)
+    bus.emit(aws_cloudburst.LevelComplete(1))
+    bus.emit(aws_cloudburst.BlockDestroyed(block))
+    bus.emit(aws_cloudburst.BlockDestroyed(block))
+    assert bus.pending() == 3
+    bus.dispatch()
+    
+    assert received == [("destroyed", 2), ("level", 1)]
+    assert bus.pending() == 0
+    print("   ✅ Events delivered once per frame in batches")
+
+def test_laser_and_ball_share_scoring():
+    """Test that laser hits score through the same path and skip destroyed blocks."""
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    block = game.level.blocks[0]
+    
+    game._hit_block(block, "laser")
+    assert game.score == 0, "Scoring must wait for dispatch"
+    game.events.dispatch()
+    assert game.score == block.points
+    
+    # A laser passing through the dead block must not score it again
+    laser = aws_cloudburst.Laser(block.position.x, block.position.y)
+    game.entities.spawn("lasers", laser)
+    game._update_game(0.0)
+    assert game.score == block.points
+    print("   ✅ Laser scoring goes through the event bus")
+
+def test_multiplier_taken_at_hit_time():
+    """Test that a block broken under Double Points scores double even if the timer ends before dispatch."""
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    block = game.level.blocks[0]
+    block.hits_remaining = 1
+    
+    game._activate_powerup(aws_cloudburst.PowerUpType.SCORE_MULTIPLIER)
+    game._hit_block(block, "ball")
+    game.scheduler.advance(60.0)  # Expires later in the same frame
+    assert game.score_multiplier == 1
+    game.events.dispatch()
+    assert game.score == 2 * block.points
+    print("   ✅ Multiplier captured when the block breaks")
+
+def test_level_complete_event():
+    """Test that clearing the board advances the level through the bus."""
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    completed = []
+    game.events.subscribe(aws_cloudburst.LevelComplete, lambda batch: completed.extend(batch))
+    
+    for block in game.level.blocks:
+        block.destroyed = True
+    game._update_game(1.0 / aws_cloudburst.FPS)
+    
+    assert [event.level_number for event in completed] == [1]
+    assert game.current_level == 2
+    print("   ✅ LevelComplete advances the level")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_bus_batches_in_type_order()
+    test_laser_and_ball_share_scoring()
+    test_multiplier_taken_at_hit_time()
+    test_level_complete_event()
+    pygame.quit()
+    print("\n✅ All event bus tests passed!")
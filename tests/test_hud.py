@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script to verify incremental HUD rendering.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_fields_rebuilt_only_on_change():
+    """Test that HUD fields are rebuilt only when their displayed text changes."""
+    print("📊 Testing incremental HUD...")
+    ui = aws_cloudburst.UI()
+    screen = pygame.Surface((1024, 768))
+    powerups = {powerup_type: 0 for powerup_type in aws_cloudburst.PowerUpType}
+    
+    ui.draw_hud(screen, 100, 3, 1, powerups)
+    initial = ui.hud.field_renders
+    assert initial == 3
+    
+    for _ in range(10):
+        ui.draw_hud(screen, 100, 3, 1, powerups)
+    assert ui.hud.field_renders == initial, "Unchanged HUD must not re-render"
+    
+    ui.draw_hud(screen, 150, 3, 1, powerups)
+    assert ui.hud.field_renders == initial + 1, "Only the score field should re-render"
+    
+    # Countdowns re-render at display precision, not every frame
+    powerups[aws_cloudburst.PowerUpType.SLOW_MOTION] = 5.04
+    ui.draw_hud(screen, 150, 3, 1, powerups)
+    powerups[aws_cloudburst.PowerUpType.SLOW_MOTION] = 5.02
+    ui.draw_hud(screen, 150, 3, 1, powerups)
+    assert ui.hud.field_renders == initial + 2
+    print("   ✅ HUD fields re-render only when their text changes")
+
+def test_glyph_strip_width():
+    """Test that glyph strip text width matches its glyphs."""
+    font = pygame.font.Font(None, 32)
+    strip = aws_cloudburst.GlyphStrip(font, "0123456789,", aws_cloudburst.AWS_WHITE)
+    assert strip.width("1,000") == sum(font.size(char)[0] for char in "1,000")
+    print("   ✅ Glyph strip measures text correctly")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_fields_rebuilt_only_on_change()
+    test_glyph_strip_width()
+    pygame.quit()
+    print("\n✅ All HUD tests passed!")
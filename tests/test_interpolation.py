@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script to verify fixed-step physics with render interpolation.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Ball, Vector2D
+
+def make_sweep_game(physics_rate=15, interpolate=True):
+    """The interpolation scenario: balls sweeping sideways, nothing else moving."""
+    game = aws_cloudburst.Game(physics_rate=physics_rate, interpolate=interpolate)
+    game.detach_presentation()
+    game._start_new_game()
+    game.entities.teardown(aws_cloudburst.EntityScope.LEVEL)
+    ball = game.entities.spawn("balls", Ball(200, 500, 240))
+    ball.velocity = Vector2D(240, 0)
+    return game, ball
+
+def test_render_position_blends_steps():
+    """Test that entities report positions between their last two updates."""
+    print("🎞️  Testing render interpolation...")
+    ball = Ball(100, 100)
+    ball.velocity = Vector2D(60, 0)
+    ball.update(1.0)
+    assert ball.render_position(0.0) == (100, 100)
+    assert ball.render_position(0.5) == (130, 100)
+    assert ball.render_position(1.0) == (ball.position.x, ball.position.y)
+    
+    powerup = aws_cloudburst.PowerUp(50, 50, aws_cloudburst.PowerUpType.SHIELD)
+    powerup.update(0.1)
+    assert powerup.render_position(0.5)[1] == 50 + aws_cloudburst.POWERUP_FALL_SPEED * 0.05
+    print("   ✅ Positions blend between physics steps")
+
+def test_fixed_step_accumulator():
+    """Test that physics advances in whole steps and reports the leftover fraction."""
+    game, ball = make_sweep_game(physics_rate=10)
+    alpha = game._step_physics(0.05)
+    assert ball.position.x == 200 and abs(alpha - 0.5) < 1e-9
+    alpha = game._step_physics(0.06)
+    assert abs(ball.position.x - 224) < 1e-9 and abs(alpha - 0.1) < 1e-9
+    
+    game._handle_game_input(pygame.K_i)
+    assert not game.interpolate
+    assert game._step_physics(0.05) == 1.0
+    print("   ✅ Fixed steps taken, leftover returned as alpha")
+
+def test_interpolated_motion_is_smooth():
+    """Test the visual scenario: 15 Hz physics drawn at 60 FPS moves evenly only when interpolated."""
+    for interpolate in (True, False):
+        game, ball = make_sweep_game(physics_rate=15, interpolate=interpolate)
+        for _ in range(4):
+            game._step_physics(1.0 / 60)  # Until the first step there is nothing to blend
+        drawn = []
+        for _ in range(16):
+            alpha = game._step_physics(1.0 / 60)
+            drawn.append(ball.render_position(alpha)[0])
+        moves = [round(b - a, 6) for a, b in zip(drawn, drawn[1:])]
+        if interpolate:
+            assert max(moves) - min(moves) < 1e-6  # 4 px every frame
+        else:
+            assert moves.count(0) >= 9 and max(moves) == 16  # Still, then a 16 px jump
+    print("   ✅ Interpolated motion even, raw motion steps")
+
+def test_snapshot_interpolates_like_live_draw():
+    """Test that the snapshot path draws interpolated balls where the live path does."""
+    game, ball = make_sweep_game(physics_rate=15)
+    game._step_physics(0.1)
+    game._draw_game(alpha=0.5)
+    expected = pygame.image.tostring(game.screen, "RGB")
+    game._draw_snapshot(game.snapshot(), alpha=0.5)
+    assert pygame.image.tostring(game.screen, "RGB") == expected
+    
+    x, y = ball.render_position(0.5)
+    assert game.screen.get_at((int(x), int(y)))[:3] != aws_cloudburst.AWS_DARK_BLUE
+    print("   ✅ Snapshot frames interpolate identically")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_render_position_blends_steps()
+    test_fixed_step_accumulator()
+    test_interpolated_motion_is_smooth()
+    test_snapshot_interpolates_like_live_draw()
+    pygame.quit()
+    print("\n✅ All interpolation tests passed!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script to verify ball landing prediction, the autopilot and the aim assist.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Autopilot, Ball, Level, LandingPredictor, Vector2D
+from conftest import make_game
+
+LINE_Y = 700
+
+def empty_level():
+    level = Level(1)
+    for block in level.blocks:
+        block.destroyed = True
+    return level
+
+def test_walls_in_closed_form():
+    """Test that a path bouncing between the walls lands where the unfolded straight line does."""
+    print("🎯 Testing landing prediction...")
+    level = empty_level()
+    predictor = LandingPredictor()
+    for vx, vy, bounces in ((900.0, 300.0, 1), (-2000.0, 250.0, 2), (0.0, 400.0, 0), (700.0, -300.0, 3)):
+        ball = Ball(500, 400)
+        ball.velocity = Vector2D(vx, vy)
+        landing = predictor.predict(ball, level, LINE_Y)
+        low, high = ball.radius, level.width - ball.radius
+        time = (LINE_Y - 400) / vy if vy > 0 else (400 - ball.radius) / -vy + (LINE_Y - ball.radius) / -vy
+        span = high - low
+        unfolded = (500 - low + vx * time) % (2 * span)
+        expected = low + (unfolded if unfolded <= span else 2 * span - unfolded)
+        assert abs(landing.x - expected) < 1e-6 and abs(landing.time - time) < 1e-9, (vx, vy, landing)
+        assert len(landing.path) == bounces + 2
+    ball = Ball(500, 400)
+    ball.velocity = Vector2D(300.0, 0.0)
+    assert predictor.predict(ball, level, LINE_Y) is None, "A level ball never lands"
+    print("   ✅ Wall bounces match the unfolded line")
+
+def test_matches_play():
+    """Test that predictions half a second ahead match where balls really meet the paddle."""
+    game = make_game(6, autopilot=True)
+    errors, history = [], {}
+    for frame in range(60 * 60):
+        line_y = game.paddle.get_rect().top
+        for ball in game.balls:
+            history.setdefault(ball, {})[frame] = (game.predictor.predict(ball, game.level, line_y),
+                                                   ball.velocity.y)
+        game._update_game(1.0 / 60)
+        for ball in game.balls:
+            falling = history.get(ball, {}).get(frame, (None, 0.0))[1] > 0
+            ahead = history.get(ball, {}).get(frame - 30, (None,))[0]
+            if falling and ball.velocity.y < 0 and ball.position.y > line_y - 40 and ahead:
+                errors.append(abs(ball.position.x - ahead.x))
+    errors.sort()
+    assert len(errors) >= 10 and errors[len(errors) // 2] < 1.0 and errors[-1] < 10.0, errors
+    print(f"   ✅ {len(errors)} paddle hits, median miss {errors[len(errors) // 2]:.2f} px, "
+          f"worst {errors[-1]:.2f} px")
+
+def test_bricks_reflect():
+    """Test that a ball aimed up into bricks is predicted to come back down, not through them."""
+    level = Level(1)
+    block = level.blocks[len(level.blocks) // 2]
+    rect = block.get_rect()
+    ball = Ball(rect.centerx, 600)
+    ball.velocity = Vector2D(0.0, -400.0)
+    landing = LandingPredictor().predict(ball, level, LINE_Y)
+    assert landing.path[1][1] == rect.bottom + ball.radius, landing.path
+    assert abs(landing.time - ((600 - landing.path[1][1]) + (LINE_Y - landing.path[1][1])) / 400) < 1e-9
+    print("   ✅ Bricks reflect the predicted path")
+
+def test_cached_until_velocity_changes():
+    """Test that a prediction is traced once per velocity and counts down as the ball flies."""
+    level = empty_level()
+    predictor = LandingPredictor()
+    ball = Ball(500, 400)
+    ball.velocity = Vector2D(120.0, 300.0)
+    first = predictor.predict(ball, level, LINE_Y)
+    for _ in range(30):
+        ball.update(1.0 / 60, width=level.width)
+        landing = predictor.predict(ball, level, LINE_Y)
+    assert predictor.computed == 1
+    assert landing.x == first.x and abs(landing.time - (first.time - 0.5)) < 1e-9
+    ball.velocity.x = -ball.velocity.x
+    assert predictor.predict(ball, level, LINE_Y).x != first.x and predictor.computed == 2
+    print("   ✅ Cached until the velocity changes")
+
+def test_autopilot_beats_chasing():
+    """Test that the predicting autopilot loses fewer balls than chasing the mean ball x."""
+    chase = aws_cloudburst.run_autopilot_games(games=2, seconds=30, predict=False)
+    predict = aws_cloudburst.run_autopilot_games(games=2, seconds=30, predict=True)
+    assert predict["balls_lost_per_minute"] < chase["balls_lost_per_minute"], (chase, predict)
+    assert predict["paddle_bounces"] > chase["paddle_bounces"]
+    assert predict["predictions_per_ball_frame"] < 0.1, "Should not search every frame"
+    game = make_game(6, autopilot=True)
+    game.paddle.position.x = 100
+    game.balls[0].position = Vector2D(900, 500)
+    game.balls[0].velocity = Vector2D(0.0, 300.0)
+    game._update_game(1.0 / 60, aws_cloudburst.HeldKeys())
+    assert game.paddle.position.x > 100, "The autopilot steers, whatever keys are held"
+    print(f"   ✅ Balls lost per minute: chasing {chase['balls_lost_per_minute']:.2f}, "
+          f"predicting {predict['balls_lost_per_minute']:.2f}")
+
+def test_aim_assist():
+    """Test that the aim assist draws predicted paths, directly and through render snapshots."""
+    game = make_game(6, aim_assist=True)
+    paths = game._aim_paths()
+    assert paths and paths[0][-1][1] == game.paddle.get_rect().top
+    game._draw_game()
+    snapshot = game.snapshot()
+    assert snapshot.aim_paths == paths
+    game._draw_snapshot(snapshot)
+    assert make_game(6).snapshot().aim_paths == ()
+    assert Autopilot(predict=False).target(game) == game.balls[0].position.x
+    print("   ✅ Aim assist paths drawn")
+
+def test_aim_assist_on_texture_renderer():
+    """Test that aim paths draw through the texture backend as they do in software."""
+    frames = []
+    for renderer in ("software", "texture-software"):
+        game = make_game(6, renderer=renderer, aim_assist=True)
+        paths = game._aim_paths()
+        game._draw_game(game.backend.target)
+        frames.append(game.backend.renderer.to_surface() if renderer != "software" else game.screen.copy())
+        game._draw_snapshot(game.snapshot(), game.backend.target)
+        game.backend.present(game.screen)
+    end_x, end_y = (int(value) for value in paths[0][-1])
+    probe = (end_x, end_y - 6)  # Top of the ring
+    assert frames[0].get_at(probe)[:3] == aws_cloudburst.AWS_GREEN
+    assert frames[1].get_at(probe) == frames[0].get_at(probe)
+    game.backend.close()
+    print("   ✅ Aim assist drawn by the texture backend")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_walls_in_closed_form()
+    test_matches_play()
+    test_bricks_reflect()
+    test_cached_until_velocity_changes()
+    test_autopilot_beats_chasing()
+    test_aim_assist()
+    test_aim_assist_on_texture_renderer()
+    pygame.quit()
+    print("\n✅ All landing prediction tests passed!")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script to verify level files and the compiled level cache.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import BlockType, Level, LevelFormatError, LevelGenerator, LevelLoader
+
+LEVEL_TEXT = """# Test level
+name: Test
+top: 100
+
+SL.
+.Q
+"""
+
+def write_level(directory, name, text):
+    with open(os.path.join(directory, name + ".level"), "w") as f:
+        f.write(text)
+
+def test_shipped_levels():
+    """Test that the five shipped architectures load as before."""
+    print("🧱 Testing level files...")
+    counts = {1: 16, 2: 18, 3: 22, 4: 25, 5: 42}
+    for level_number, count in counts.items():
+        assert len(Level(level_number).blocks) == count, f"Level {level_number}"
+
+    serverless = Level(3).blocks
+    assert (serverless[-2].block_type, serverless[-2].position.x, serverless[-2].position.y) == \
+        (BlockType.Q_DEVELOPER, 335, 190)
+    # The advanced level rotates its services by level number
+    assert Level(5).blocks[0].block_type == BlockType.API_GATEWAY
+    print("   ✅ Five architectures ship as level files")
+
+def test_compiled_cache(tmp_path):
+    """Test that levels compile once, then load from the cache until edited."""
+    directory = str(tmp_path)
+    write_level(directory, "test", LEVEL_TEXT)
+
+    loader = LevelLoader(directory)
+    level = loader.load("test")
+    assert loader.compiled == 1 and loader.load("test") is level
+    assert list(level.types) == [0, 1, 9] and list(level.xs) == [80, 165, 165]
+    assert list(level.ys) == [100, 100, 140] and level.name == "Test"
+    assert len(os.listdir(tmp_path / "__levelcache__")) == 1
+
+    cached = LevelLoader(directory)
+    assert cached.load("test") == level and cached.compiled == 0
+
+    write_level(directory, "test", LEVEL_TEXT + "EE\n")
+    edited = LevelLoader(directory)
+    assert len(edited.load("test").types) == 5 and edited.compiled == 1
+    assert len(os.listdir(tmp_path / "__levelcache__")) == 1, "Stale compiled level left behind"
+    print("   ✅ Compiled once, cached by content hash, recompiled on edit")
+
+def test_corrupt_cache_recompiles(tmp_path):
+    """Test that an unreadable compiled level is rebuilt from source."""
+    directory = str(tmp_path)
+    write_level(directory, "test", LEVEL_TEXT)
+    LevelLoader(directory).load("test")
+    cache_dir = tmp_path / "__levelcache__"
+    (cache_dir / os.listdir(cache_dir)[0]).write_bytes(b"ACBL\x01")
+
+    loader = LevelLoader(directory)
+    assert len(loader.load("test").types) == 3 and loader.compiled == 1
+    print("   ✅ Corrupt cache recompiled")
+
+def test_validation():
+    """Test that malformed level files are rejected with their line."""
+    bad_levels = {
+        "name: X\n\nSS\n": "missing 'top'",
+        "top: high\n\nSS\n": "'top' must be",
+        "top: 50\ncolour: red\n\nSS\n": ":2: unknown header 'colour'",
+        "top: 50\n\nSS\nSZ\n": ":4: unknown brick 'Z'",
+        "top: 50\n\n" + "S" * 12 + "\n": "off the play area",
+        "top: 50\n\n...\n": "no bricks",
+        "top: 50\nrotate: maybe\n\nS\n": "'rotate' must be",
+    }
+    for text, message in bad_levels.items():
+        try:
+            LevelLoader.parse(text, "bad.level")
+        except LevelFormatError as e:
+            assert message in str(e), f"{e} does not mention {message}"
+        else:
+            raise AssertionError(f"Accepted: {text!r}")
+    print("   ✅ Invalid level files rejected")
+
+def layout(level):
+    return list(zip(level.types, level.xs, level.ys))
+
+def test_generated_levels():
+    """Test that generated levels are seeded, symmetric, valid and get harder."""
+    first = len(aws_cloudburst.LEVEL_FILES) + 1
+    assert layout(LevelGenerator.generate(7, first)) == layout(LevelGenerator.generate(7, first))
+    assert any(layout(LevelGenerator.generate(7, n)) != layout(LevelGenerator.generate(8, n))
+               for n in range(first, first + 5))
+
+    middle = aws_cloudburst.level_cell_position(aws_cloudburst.LEVEL_GRID_COLUMNS // 2, 0, 0)[0]
+    patterns = set()
+    for level_number in range(first, first + 60):
+        level = LevelGenerator.generate(3, level_number)
+        assert level.validate() == [], f"Level {level_number}: {level.validate()}"
+        bricks = {(x, y): type_index for type_index, x, y in layout(level)}
+        assert all(bricks.get((2 * middle - x, y)) == type_index for (x, y), type_index in bricks.items())
+        patterns.add(level.name.split()[0])
+    assert patterns == {"Tiers", "Clusters", "Fortress"}
+
+    def toughness(level_numbers):
+        block_types = list(BlockType)
+        return sum(block_types[type_index].value[1] for n in level_numbers
+                   for type_index in LevelGenerator.generate(1, n).types) / len(level_numbers)
+    assert toughness(range(first + 30, first + 40)) > 1.5 * toughness(range(first, first + 10))
+    assert [block.block_type for block in Level(first, 3).blocks] == \
+        [list(BlockType)[type_index] for type_index in LevelGenerator.generate(3, first).types]
+    print("   ✅ Generated levels are seeded, symmetric, valid and scale in difficulty")
+
+def test_generator_cache():
+    """Test that replays of a (seed, level) hit the LRU cache and old layouts are evicted."""
+    generator = LevelGenerator(cache_size=3)
+    level = generator.get(5, 10)
+    assert generator.get(5, 10) is level and (generator.hits, generator.misses) == (1, 1)
+    for level_number in (11, 12, 13):
+        generator.get(5, level_number)
+    assert generator.get(5, 13) is not None and generator.hits == 2
+    generator.get(5, 10)
+    assert generator.misses == 5, "Least recently used layout should have been evicted"
+    print("   ✅ LRU cache of generated layouts")
+
+def test_seed_survives_save_state():
+    """Test that a resumed game keeps generating the same levels."""
+    game = aws_cloudburst.Game(level_seed=1234)
+    game._start_new_game()
+    restored = aws_cloudburst.Game()
+    restored.load_state(game.save_state())
+    assert restored.level_seed == 1234
+    print("   ✅ Level seed kept in save states")
+
+def test_parallel_pregeneration():
+    """Test the batch tool that generates and validates levels in worker processes."""
+    report = aws_cloudburst.pregenerate_levels(400, seed=9, workers=2)
+    assert report["levels"] == 400 and report["invalid"] == 0
+    assert report["bricks_min"] >= aws_cloudburst.LEVEL_MIN_BRICKS
+    for count in (0, -5):
+        try:
+            aws_cloudburst.pregenerate_levels(count)
+            assert False, f"Should reject {count} levels"
+        except ValueError:
+            pass
+    print(f"   ✅ Pre-generated {report['levels']} levels at {report['levels_per_s']:.0f}/s")
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    pygame.init()
+    test_shipped_levels()
+    with tempfile.TemporaryDirectory() as directory:
+        test_compiled_cache(pathlib.Path(directory))
+    with tempfile.TemporaryDirectory() as directory:
+        test_corrupt_cache_recompiles(pathlib.Path(directory))
+    test_validation()
+    test_generated_levels()
+    test_generator_cache()
+    test_seed_survives_save_state()
+    test_parallel_pregeneration()
+    pygame.quit()
+    print("\n✅ All level tests passed!")
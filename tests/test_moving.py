@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script to verify moving bricks and the incrementally updated broadphase.
+"""
+
+import sys
+import os
+import time
+import random
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import (AdjacencyIndex, Ball, BlockGrid, BlockType, HeldKeys, Level, LevelFormatError, LevelLoader,
+                            RewindBuffer, StressLevel, Vector2D)
+from conftest import make_game, scan
+
+def test_slide_header():
+    """Test that level files name their sliding rows and bad ones are rejected."""
+    print("↔️  Testing moving bricks...")
+    level = LevelLoader.parse("top: 50\nslide: 1, 3\n\nSS\nLL\n.W\n")
+    assert list(level.sliding) == [1, 1, 0, 0, 1]
+    assert LevelLoader.decode(LevelLoader.encode(level)) == level
+    assert len(LevelLoader.parse("top: 50\n\nSS\n").sliding) == 0
+    for text, message in {"top: 50\nslide: two\n\nSS\n": "'slide' must",
+                          "top: 50\nslide: 2\n\nSS\n": "row the level does not have"}.items():
+        try:
+            LevelLoader.parse(text, "bad.level")
+        except LevelFormatError as e:
+            assert message in str(e), f"{e} does not mention {message}"
+        else:
+            raise AssertionError(f"Accepted: {text!r}")
+    print("   ✅ slide header compiled and validated")
+
+def test_rows_slide_wall_to_wall():
+    """Test that a sliding row keeps its spacing and turns back at both walls."""
+    level = Level(2)
+    movers = [level.blocks[i] for i in level.movers]
+    assert len(movers) == 4 and all(block.block_type == BlockType.RDS for block in movers)
+    spacing = [b.position.x - a.position.x for a, b in zip(movers, movers[1:])]
+    left, right = aws_cloudburst.SCREEN_WIDTH, 0
+    for _ in range(60 * 30):
+        level.update(1.0 / 60)
+        left = min(left, movers[0].get_rect().left)
+        right = max(right, movers[-1].get_rect().right)
+        gaps = [b.position.x - a.position.x for a, b in zip(movers, movers[1:])]
+        assert all(abs(gap - expected) < 1e-6 for gap, expected in zip(gaps, spacing))
+    assert left == 0 and right == aws_cloudburst.SCREEN_WIDTH
+
+    pods = [block for block in Level(4).blocks if block.block_type == BlockType.EKS]
+    assert pods and all(block.velocity is not None for block in pods)
+    print("   ✅ Sliding rows reach both walls, EKS pods patrol")
+
+def test_incremental_broadphase_matches_scan():
+    """Test that the grid kept up to date by moves finds what a full scan finds."""
+    rng = random.Random(2)
+    level = Level(4)
+    grid = level._broadphase()
+    for frame in range(600):
+        level.update(1.0 / 60)
+        if frame % 20 == 0:
+            for _ in range(50):
+                rect = pygame.Rect(rng.uniform(-20, 1024), rng.uniform(-20, 400),
+                                   rng.choice((1, 16, 40, 300)), rng.choice((1, 16, 40, 300)))
+                assert level.blocks_in(rect) == scan(level.blocks, rect)
+    assert level._grid is grid, "Grid rebuilt instead of updated"
+    rebuilt = BlockGrid(level.blocks)
+    assert {cell: sorted(indices) for cell, indices in grid.cells.items()} == rebuilt.cells
+    print("   ✅ Incremental broadphase agrees with a full scan")
+
+def test_cost_follows_moving_bricks():
+    """Test that a frame's brick movement costs the same on a small and a giant board."""
+    def timed(bricks):
+        level = StressLevel(bricks)
+        for block in level.blocks[:50]:
+            x, y = block.position.x, block.position.y
+            block.patrol(Vector2D(60.0, 0.0), (x - 40, y, x + 40, y))
+        level = StressLevel(seed=0, blocks=level.blocks)
+        assert len(level.movers) == 50
+        level.blocks_in(pygame.Rect(0, 0, 1, 1))  # Build the grid before timing
+        start = time.perf_counter()
+        for _ in range(300):
+            level.update(1.0 / 60)
+        return (time.perf_counter() - start) / 300
+
+    small, large = timed(1000), timed(aws_cloudburst.STRESS_MAX_BRICKS)
+    assert large < small * 3 + 0.0002, f"{small * 1000:.3f} ms -> {large * 1000:.3f} ms"
+    print(f"   ✅ 50 moving bricks: {small * 1000:.3f} ms with 1000 bricks, {large * 1000:.3f} ms with 50000")
+
+def test_relative_velocity_bounce():
+    """Test that a brick moving into the ball knocks it away and a still one simply reflects it."""
+    rect = pygame.Rect(100, 100, 80, 30)
+    ball = Ball(185, 115)
+    ball.velocity = Vector2D(-100.0, 20.0)
+    ball.bounce_off_block(rect)
+    assert (ball.velocity.x, ball.velocity.y) == (100.0, 20.0)
+
+    ball = Ball(185, 115)
+    ball.velocity = Vector2D(10.0, 100.0)  # Drifting right, slower than the brick
+    speed = ball.velocity.magnitude()
+    ball.bounce_off_block(rect, Vector2D(70.0, 0.0))
+    assert ball.velocity.x > 70.0, "Ball should leave faster than the brick chasing it"
+    assert abs(ball.velocity.magnitude() - speed) < 1e-9
+    print("   ✅ Bounce relative to the brick's velocity")
+
+def test_save_and_rewind_with_moving_bricks():
+    """Test that save states and rewind put moving bricks back where they were."""
+    game = make_game(11, balls=6, level_number=4)
+    for _ in range(200):
+        game._update_game(1.0 / 60, HeldKeys())
+    data = game.save_state()
+    restored = aws_cloudburst.Game()
+    restored.load_state(data)
+    assert restored.save_state() == data
+    assert restored.level.movers == game.level.movers
+
+    recorded = []
+    for _ in range(90):
+        game._update_game(1.0 / 60, HeldKeys())
+        recorded.append(RewindBuffer._capture(game))
+    assert recorded[0][4] != recorded[-1][4]
+    for index in range(0, 90, 7):
+        game.rewind.restore(game, game.rewind.frames - 90 + index)
+        assert RewindBuffer._capture(game) == recorded[index], f"Frame {index} differs"
+        assert game.level.blocks_in(pygame.Rect(0, 0, 1024, 400)) == scan(game.level.blocks,
+                                                                          pygame.Rect(0, 0, 1024, 400))
+    print(f"   ✅ {len(game.level.movers)} moving bricks saved and rewound")
+
+def test_neighbours_follow_moving_bricks():
+    """Test that chain reaction neighbours are where bricks have slid to, not where they started."""
+    level = Level(20, 4)
+    for _ in range(4 * 60):
+        level.update(1.0 / 60)
+    fresh = AdjacencyIndex(level.blocks)
+    for index in range(len(level.blocks)):
+        assert level.neighbours(index) == fresh.orthogonal[index] + fresh.diagonal[index], index
+        assert level.neighbours(index, diagonal=False) == fresh.orthogonal[index], index
+    assert set(level.movers) < level.live_neighbours < set(range(len(level.blocks)))
+    print(f"   ✅ {len(level.live_neighbours)} of {len(level.blocks)} bricks look neighbours up live")
+
+def test_rewind_window_with_many_movers():
+    """Test that a level of mostly moving bricks still keeps the whole rewind window."""
+    game = make_game(113, balls=6, level_number=25)
+    movers = game.level.movers
+    assert len(movers) > 70
+    recorded = []
+    for frame in range(15 * 60):
+        if frame % 97 == 50:
+            game._hit_block(game.level.blocks[movers[frame % len(movers)]], "ball")  # Stops between frames
+        game._update_game(1.0 / 60, HeldKeys())
+        recorded.append(RewindBuffer._capture(game))
+    assert game.rewind.frames >= aws_cloudburst.REWIND_SECONDS * aws_cloudburst.FPS
+    assert game.rewind.size <= aws_cloudburst.REWIND_BUDGET_KB * 1024
+    for index in range(0, game.rewind.frames, 11):
+        game.rewind.restore(game, index)
+        assert RewindBuffer._capture(game) == recorded[index - game.rewind.frames], f"Frame {index} differs"
+    print(f"   ✅ {len(movers)} moving bricks: {game.rewind.frames / aws_cloudburst.FPS:.0f} s "
+          f"of rewind in {game.rewind.size / 1024:.0f} KB")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_slide_header()
+    test_rows_slide_wall_to_wall()
+    test_incremental_broadphase_matches_scan()
+    test_cost_follows_moving_bricks()
+    test_relative_velocity_bounce()
+    test_save_and_rewind_with_moving_bricks()
+    test_neighbours_follow_moving_bricks()
+    test_rewind_window_with_many_movers()
+    pygame.quit()
+    print("\n✅ All moving brick tests passed!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script to verify background preparation of the next level.
+"""
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import Block, Level, LevelLoader
+
+FRAME_BUDGET = 1.0 / aws_cloudburst.FPS
+
+def make_cold_game(directory):
+    """A game with nothing compiled or rendered yet for the levels ahead."""
+    for name in os.listdir(aws_cloudburst.LEVELS_DIR):
+        if name.endswith(".level"):
+            shutil.copy(os.path.join(aws_cloudburst.LEVELS_DIR, name), directory)
+    Level.loader = LevelLoader(directory)
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    game.lives = 3
+    Block._sprites.clear()
+    game.overlays.invalidate()
+    return game
+
+def destroy(game, blocks):
+    """Destroy blocks through the normal hit path, one frame per block."""
+    for block in blocks:
+        while not block.destroyed:
+            game._hit_block(block, "ball")
+        game.entities.teardown(aws_cloudburst.EntityScope.LEVEL)  # No ball to lose a life with
+        game._update_game(1.0 / 60, aws_cloudburst.HeldKeys())
+
+def timed_transition(game):
+    """Destroy the last block and time the frame that moves to the next level."""
+    last = [block for block in game.level.blocks if not block.destroyed]
+    assert len(last) == 1
+    while not last[0].destroyed:
+        game._hit_block(last[0], "ball")
+    start = time.perf_counter()
+    game._update_game(1.0 / 60, aws_cloudburst.HeldKeys())
+    game._draw_game()
+    return time.perf_counter() - start
+
+def test_preloads_at_eighty_percent():
+    """Test that the next level is built and baked once 80% of bricks are gone."""
+    print("⏭️  Testing level preloading...")
+    original_loader = Level.loader
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            game = make_cold_game(directory)
+            blocks = game.level.blocks
+            needed = -(-len(blocks) * 8 // 10)  # Ceiling of 80%
+            destroy(game, blocks[:needed - 1])
+            assert game.preloader._key is None, "Preloaded too early"
+
+            destroy(game, blocks[needed - 1:needed])
+            assert game.preloader._key == (2, game.level_seed)
+            game.preloader._thread.join()
+            next_types = {block.block_type for block in game.preloader._level.blocks}
+            assert all(any(key[0] == block_type for key in Block._sprites) for block_type in next_types)
+
+            destroy(game, blocks[needed:-1])
+            old_level = game.level
+            elapsed = timed_transition(game)
+            assert game.level is not old_level and game.level.level_number == 2
+            assert game.preloader.hits == 1 and game.preloader.misses == 0
+            assert elapsed < FRAME_BUDGET, f"Transition frame took {elapsed * 1000:.2f} ms"
+            print(f"   ✅ Preloaded transition frame {elapsed * 1000:.2f} ms")
+    finally:
+        Level.loader = original_loader
+
+def test_transition_without_preload():
+    """Test that a level cleared in one go still transitions, building the level on the spot."""
+    original_loader = Level.loader
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            game = make_cold_game(directory)
+            for block in game.level.blocks[:-1]:
+                block.destroyed = True  # Bypasses the events that start preloading
+            elapsed = timed_transition(game)
+            assert game.level.level_number == 2 and len(game.level.blocks) > 0
+            print(f"   ✅ Cold transition frame {elapsed * 1000:.2f} ms")
+    finally:
+        Level.loader = original_loader
+
+def test_take_without_prepare_builds_synchronously():
+    """Test the preloader's fallback and one build per level number."""
+    preloader = aws_cloudburst.LevelPreloader()
+    level = preloader.take(3)
+    assert level.level_number == 3 and preloader.misses == 1
+
+    preloader.prepare(4)
+    thread = preloader._thread
+    preloader.prepare(4)
+    assert preloader._thread is thread
+    assert preloader.take(4).level_number == 4 and preloader.hits == 1
+    print("   ✅ Fallback build and single preparation per level")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_preloads_at_eighty_percent()
+    test_transition_without_preload()
+    test_take_without_prepare_builds_synchronously()
+    pygame.quit()
+    print("\n✅ All level preloading tests passed!")
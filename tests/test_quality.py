@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script to verify quality tiers and the adaptive quality controller.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import QualityController, QualityTier
+
+SLOW_MS = aws_cloudburst.QUALITY_DOWNGRADE_MS * 1.5
+FAST_MS = aws_cloudburst.QUALITY_UPGRADE_MS * 0.5
+
+def feed(controller, frame_ms, windows=1):
+    changes = []
+    for _ in range(controller._samples.maxlen * windows):
+        tier = controller.record(frame_ms)
+        if tier:
+            changes.append(tier)
+    return changes
+
+def test_controller_steps_down_on_slow_frames():
+    """Test that a slow window steps quality down one tier at a time."""
+    print("🎚️  Testing adaptive quality downgrade...")
+    controller = QualityController(window=10)
+    for _ in range(9):
+        assert controller.record(SLOW_MS) is None  # No decision before a full window
+    assert controller.record(SLOW_MS) == QualityTier.HIGH
+    assert feed(controller, SLOW_MS, windows=5) == [QualityTier.LOW, QualityTier.MINIMAL]
+    assert controller.tier == QualityTier.MINIMAL
+    print("   ✅ Quality stepped down to minimal")
+
+def test_controller_upgrade_hysteresis():
+    """Test that stepping up needs several calm windows and ignores in-between frame times."""
+    controller = QualityController(QualityTier.LOW, window=10)
+    middle_ms = (aws_cloudburst.QUALITY_UPGRADE_MS + aws_cloudburst.QUALITY_DOWNGRADE_MS) / 2
+    assert feed(controller, middle_ms, windows=10) == []
+    assert feed(controller, FAST_MS, windows=aws_cloudburst.QUALITY_UPGRADE_WINDOWS - 1) == []
+    feed(controller, middle_ms)  # A busier window resets the calm streak
+    assert feed(controller, FAST_MS, windows=aws_cloudburst.QUALITY_UPGRADE_WINDOWS - 1) == []
+    assert feed(controller, FAST_MS) == [QualityTier.HIGH]
+    print("   ✅ Upgrades wait for consecutive calm windows")
+
+def test_controller_percentile_ignores_outliers():
+    """Test that a single hitch below the percentile does not drop quality."""
+    controller = QualityController(window=100)
+    for i in range(100):
+        assert controller.record(SLOW_MS * 10 if i == 50 else FAST_MS * 2) is None
+    assert controller.tier == QualityTier.ULTRA
+    print("   ✅ One-frame hitches ignored")
+
+def test_pinned_tier_and_logging(capsys):
+    """Test that a pinned tier never changes and that changes are logged."""
+    pinned = QualityController(pinned=QualityTier.LOW, window=10)
+    assert feed(pinned, SLOW_MS, windows=3) == [] and pinned.tier == QualityTier.LOW
+    
+    controller = QualityController(window=10)
+    feed(controller, SLOW_MS)
+    assert "Quality ultra -> high" in capsys.readouterr().out
+    assert controller.changes[0][:2] == (QualityTier.ULTRA, QualityTier.HIGH)
+    print("   ✅ Pinned tier held, tier change logged")
+
+def test_tiers_control_effects():
+    """Test that lower tiers drop gradients, labels and ball trails."""
+    block = aws_cloudburst.Block(100, 100, aws_cloudburst.BlockType.S3)
+    ultra = block._render(QualityTier.ULTRA)
+    minimal = block._render(QualityTier.MINIMAL)
+    assert ultra.get_at((10, 3)) != ultra.get_at((10, 26))  # Gradient
+    assert minimal.get_at((10, 3)) == minimal.get_at((10, 26))
+    assert minimal.get_at((40, 22)) == minimal.get_at((10, 22))  # No label
+    
+    surface = pygame.Surface((200, 200))
+    ball = aws_cloudburst.Ball(100, 100)
+    ball.velocity = aws_cloudburst.Vector2D(0, 300)
+    for _ in range(5):
+        ball.update(1.0 / 60)
+    surface.fill((0, 0, 0))
+    ball.draw(surface, quality=QualityTier.MINIMAL)
+    trail_point = (100, 100)
+    assert surface.get_at(trail_point)[:3] == (0, 0, 0)
+    ball.draw(surface, quality=QualityTier.ULTRA)
+    assert surface.get_at(trail_point)[:3] != (0, 0, 0)
+    print("   ✅ Tiers toggle gradients, labels and trails")
+
+def test_game_pins_quality_from_display_config():
+    """Test that the display config pins the game's quality tier."""
+    game = aws_cloudburst.Game(display=aws_cloudburst.DisplayConfig(quality=QualityTier.MINIMAL))
+    game._start_new_game()
+    game._draw_game()
+    assert game.quality.tier == QualityTier.MINIMAL
+    assert any(key[-1] == QualityTier.MINIMAL for key in aws_cloudburst.Block._sprites)
+    print("   ✅ Game draws at the pinned tier")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_controller_steps_down_on_slow_frames()
+    test_controller_upgrade_hysteresis()
+    test_controller_percentile_ignores_outliers()
+    test_tiers_control_effects()
+    test_game_pins_quality_from_display_config()
+    pygame.quit()
+    print("\n✅ All quality tests passed!")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the software and SDL2 texture render backends.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_texture_renderer_matches_software():
+    """Test that SDL's software renderer draws the same scene as plain blits."""
+    print("🖥️  Testing texture renderer backend...")
+    software = aws_cloudburst.Game()
+    software._start_new_game()
+    software._draw_game()
+    block = software.level.blocks[0]
+    probes = [(int(block.position.x), int(block.position.y)),
+              (int(software.paddle.position.x), int(software.paddle.position.y)),
+              (700, 500)]
+    expected = [software.screen.get_at(probe) for probe in probes]
+    
+    game = aws_cloudburst.Game(renderer="texture-software")
+    assert game.backend.name == "texture-software"
+    game._start_new_game()
+    game._draw_game(game.backend.target)
+    rendered = game.backend.renderer.to_surface()
+    game.backend.present(game.screen)
+    
+    assert [rendered.get_at(probe) for probe in probes] == expected
+    game.backend.close()
+    print("   ✅ Texture backend output matches software blits")
+
+def test_textures_uploaded_once():
+    """Test that each sprite surface is uploaded to a texture only once."""
+    game = aws_cloudburst.Game(renderer="texture-software")
+    game._start_new_game()
+    game._draw_game(game.backend.target)
+    uploaded = len(game.backend._textures)
+    game._draw_game(game.backend.target)
+    assert len(game.backend._textures) == uploaded
+    game.backend.close()
+    print(f"   ✅ {uploaded} textures reused across frames")
+
+def test_descent_on_texture_renderer():
+    """Test that a descent frame, danger line included, draws through the texture backend."""
+    software = aws_cloudburst.Game(mode="descent")
+    software._start_new_game()
+    software._draw_game()
+    probe = (700, int(aws_cloudburst.DESCENT_DANGER_Y))
+    assert software.screen.get_at(probe)[:3] == aws_cloudburst.AWS_RED
+    
+    game = aws_cloudburst.Game(renderer="texture-software", mode="descent")
+    game._start_new_game()
+    game._draw_game(game.backend.target)
+    assert game.backend.renderer.to_surface().get_at(probe)[:3] == aws_cloudburst.AWS_RED
+    game._draw_snapshot(game.snapshot(), game.backend.target)
+    game.backend.present(game.screen)
+    game.backend.close()
+    print("   ✅ Descent danger line drawn by the texture backend")
+
+def test_software_renderer_target():
+    """Test that the software backend draws straight onto the display surface."""
+    backend = aws_cloudburst.create_renderer("software", aws_cloudburst.DisplayConfig((320, 240), (320, 240)))
+    assert backend.name == "software"
+    assert backend.target is pygame.display.get_surface()
+    print("   ✅ Software backend targets the display surface")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_texture_renderer_matches_software()
+    test_textures_uploaded_once()
+    test_descent_on_texture_renderer()
+    test_software_renderer_target()
+    pygame.quit()
+    print("\n✅ All renderer tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script to verify cached background, overlay and paused-frame rendering.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_background_rendered_once():
+    """Test that the background is a cached surface matching the old pattern."""
+    print("🖼️  Testing cached background...")
+    game = aws_cloudburst.Game()
+    background = game._background
+    game._draw_background()
+    game._draw_background()
+    assert game._background is background
+    assert game.screen.get_at((29, 0))[:3] == (40, 55, 70)  # Edge of the cloud circle at the origin
+    assert game.screen.get_at((50, 50))[:3] == aws_cloudburst.AWS_DARK_BLUE
+    print("   ✅ Background blitted from cache")
+
+def test_overlays_cached():
+    """Test that overlays are rendered once per key."""
+    game = aws_cloudburst.Game()
+    pause = game.overlays.get("pause")
+    assert game.overlays.get("pause") is pause
+    assert game.overlays.get(("level", 2)) is not game.overlays.get(("level", 3))
+    game.overlays.invalidate()
+    assert game.overlays.get("pause") is not pause
+    print("   ✅ Overlays reused until invalidated")
+
+def test_paused_frame_reused():
+    """Test that the paused screen is composed once and then re-blitted."""
+    game = aws_cloudburst.Game()
+    game._start_new_game()
+    game._handle_game_input(pygame.K_p)
+    assert game.state == aws_cloudburst.GameState.PAUSED
+    
+    game._draw_paused()
+    frozen = game._paused_frame
+    game._draw_paused()
+    assert game._paused_frame is frozen
+    
+    # Pausing again recomposes the frame
+    game.state = aws_cloudburst.GameState.PLAYING
+    game._handle_game_input(pygame.K_p)
+    assert game._paused_frame is None
+    print("   ✅ Paused frame reused between pauses")
+
+def test_level_banner():
+    """Test that completing a level shows the level banner for a while."""
+    game = aws_cloudburst.Game()
+    game._start_new_game()
+    game._complete_level()
+    assert game.scheduler.is_active("level_banner")
+    game.scheduler.advance(aws_cloudburst.LEVEL_BANNER_DURATION)
+    assert not game.scheduler.is_active("level_banner")
+    print("   ✅ Level banner expires on schedule")
+
+def test_paused_benchmark():
+    """Run a short paused-frame benchmark."""
+    result = aws_cloudburst.benchmark_paused_frame(frames=20)
+    print(f"   • Paused frame: {result['cached_ms']:.3f} ms cached, {result['uncached_ms']:.3f} ms uncached")
+    assert result["cached_ms"] < result["uncached_ms"]
+
+if __name__ == "__main__":
+    pygame.init()
+    test_background_rendered_once()
+    test_overlays_cached()
+    test_paused_frame_reused()
+    test_level_banner()
+    test_paused_benchmark()
+    pygame.quit()
+    print("\n✅ All rendering cache tests passed!")
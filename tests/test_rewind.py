@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the rewind buffer of key frames and deltas.
+"""
+
+import sys
+import os
+import time
+import random
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import HeldKeys, InputEvent, RewindBuffer
+from conftest import make_game
+
+def play(game, frames, keys=None):
+    """Play frames, knocking out a brick now and then, and return each frame's fields."""
+    keys = keys or HeldKeys()
+    recorded = []
+    for frame in range(frames):
+        if frame % 7 == 3:
+            alive = [block for block in game.level.blocks if not block.destroyed]
+            game._hit_block(random.choice(alive), "ball")
+        game._update_game(1.0 / 60, keys)
+        recorded.append(RewindBuffer._capture(game))
+    return recorded
+
+def test_restore_every_frame():
+    """Test that every frame in the window restores to exactly what was recorded."""
+    print("⏪ Testing rewind buffer...")
+    game = make_game(11, balls=3)
+    recorded = play(game, 150)
+    assert game.rewind.frames == 150
+
+    for index in range(0, 150, 7):
+        game.rewind.restore(game, index)
+        assert RewindBuffer._capture(game) == recorded[index], f"Frame {index} differs"
+    print("   ✅ Key frames plus deltas restore every frame exactly")
+
+def test_deltas_hold_only_changes():
+    """Test that deltas only carry changed fields, with the alive mask as a bitset."""
+    game = make_game(11)
+    buffer = game.rewind
+    still = RewindBuffer._capture(game)
+    assert buffer._encode(still, still) == b"\x00"
+
+    score, paddle, balls, hits, movers = still
+    knocked = bytes([0]) + hits[1:]
+    delta = buffer._encode(still, (score, paddle, balls, knocked, movers))
+    assert len(delta) == 1 + 4 + (len(hits) + 7) // 8
+    assert buffer._decode(still, delta) == (score, paddle, balls, knocked, movers)
+    print(f"   ✅ Idle frame 1 byte, one brick lost {len(delta)} bytes")
+
+def test_memory_budget_and_window():
+    """Test that the buffer stays within its time window and memory budget."""
+    game = make_game(11, balls=10)
+    game.rewind = RewindBuffer(seconds=4, budget_kb=1000)
+    play(game, 600)
+    assert 4 * 60 <= game.rewind.frames <= 5 * 60
+
+    game.rewind = RewindBuffer(seconds=60, budget_kb=24)
+    play(game, 900)
+    assert game.rewind.size <= 24 * 1024
+    assert game.rewind.frames >= 60
+    print(f"   ✅ Bounded: {game.rewind.frames} frames in {game.rewind.size / 1024:.1f} KB")
+
+def test_scrubbing_is_fast():
+    """Test that restoring any frame is quick enough to scrub interactively."""
+    game = make_game(11, balls=20)
+    play(game, 600)
+    start = time.perf_counter()
+    for index in range(game.rewind.frames - 1, -1, -10):
+        game.rewind.restore(game, index)
+    average = (time.perf_counter() - start) / len(range(game.rewind.frames - 1, -1, -10))
+    assert average < 0.005, f"Restore took {average * 1000:.2f} ms"
+    print(f"   ✅ Restore {average * 1000:.2f} ms per frame")
+
+def test_hold_backspace_rewinds():
+    """Test that holding Backspace steps back through play and play resumes from there."""
+    game = make_game(11, balls=3)
+    keys = HeldKeys()
+    recorded = play(game, 90, keys)
+
+    keys.apply(InputEvent(0.0, pygame.K_BACKSPACE, True, True))
+    for _ in range(30):
+        game._update_game(1.0 / 60, keys)
+    assert game.rewind.frames == 60
+    assert RewindBuffer._capture(game) == recorded[59]
+
+    keys.apply(InputEvent(0.0, pygame.K_BACKSPACE, False, True))
+    play(game, 10, keys)
+    assert game.rewind.frames == 70
+    print("   ✅ Backspace rewinds and play continues from the rewound frame")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_restore_every_frame()
+    test_deltas_hold_only_changes()
+    test_memory_budget_and_window()
+    test_scrubbing_is_fast()
+    test_hold_backspace_rewinds()
+    pygame.quit()
+    print("\n✅ All rewind tests passed!")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test script to verify save states, autosave and resume.
+"""
+
+import sys
+import os
+import time
+import random
+import struct
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import GameState, HeldKeys, PowerUpType, SaveStateError
+
+def make_busy_game():
+    random.seed(7)
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    game.score, game.lives = 1234, 2
+    for _ in range(5):
+        game._update_game(1.0 / 60, HeldKeys())
+    game._hit_block(game.level.blocks[3], "ball")
+    game._hit_block(game.level.blocks[10], "ball")
+    game._activate_powerup(PowerUpType.PADDLE_EXTEND)
+    game._activate_powerup(PowerUpType.MULTI_BALL)
+    game._activate_powerup(PowerUpType.SHIELD)
+    game._activate_powerup(PowerUpType.SCORE_MULTIPLIER)
+    game.entities.spawn("powerups", aws_cloudburst.PowerUp(300, 400, PowerUpType.LASER_PADDLE))
+    game.entities.spawn("lasers", aws_cloudburst.Laser(500, 450))
+    game.events.dispatch()
+    game._update_game(1.0 / 60, HeldKeys())
+    return game
+
+def test_round_trip_is_exact():
+    """Test that loading a save state reproduces it byte for byte."""
+    print("💾 Testing save states...")
+    game = make_busy_game()
+    data = game.save_state()
+    
+    restored = aws_cloudburst.Game()
+    restored.load_state(data)
+    assert restored.save_state() == data
+    assert restored.score == game.score and restored.lives == 2
+    assert restored.paddle.extended and restored.score_multiplier == 2
+    assert len(restored.balls) == len(game.balls) and restored.shield.hits_remaining == game.shield.hits_remaining
+    assert restored.level.blocks[3].destroyed
+    assert restored.active_powerups[PowerUpType.PADDLE_EXTEND] == game.active_powerups[PowerUpType.PADDLE_EXTEND]
+    print(f"   ✅ {len(data)} byte save state round-trips exactly")
+
+def test_resumed_run_continues_identically():
+    """Test that a resumed run, RNG included, plays out exactly like the original."""
+    game = make_busy_game()
+    data = game.save_state()
+    for _ in range(240):
+        game._update_game(1.0 / 60, HeldKeys())
+    expected = game.save_state()
+    
+    random.seed(12345)  # Loading must restore the RNG
+    resumed = aws_cloudburst.Game()
+    resumed.detach_presentation()
+    resumed.load_state(data)
+    for _ in range(240):
+        resumed._update_game(1.0 / 60, HeldKeys())
+    assert resumed.save_state() == expected
+    print("   ✅ Resumed run matches the original after 240 steps")
+
+def test_compact_and_fast():
+    """Test that saves stay small and load quickly."""
+    game = make_busy_game()
+    data = game.save_state()
+    assert len(data) < 8 * 1024
+    
+    start = time.perf_counter()
+    for _ in range(20):
+        game.load_state(data)
+    load_ms = (time.perf_counter() - start) * 1000 / 20
+    assert load_ms < 20
+    print(f"   ✅ {len(data)} bytes, {load_ms:.2f} ms per load")
+
+def test_rejects_bad_data():
+    """Test that foreign, future-version and truncated data raise SaveStateError."""
+    game = make_busy_game()
+    data = game.save_state()
+    future = data[:4] + struct.pack("<H", aws_cloudburst.SAVE_VERSION + 1) + data[6:]
+    for bad in (b"JUNK" + data[4:], future, data[:len(data) // 2], data + b"\0"):
+        try:
+            game.load_state(bad)
+        except SaveStateError:
+            continue
+        raise AssertionError("bad save state accepted")
+    assert game.save_state() == data  # Failed loads leave the game untouched
+    print("   ✅ Bad save states rejected")
+
+def save_with_extra_value(game, target):
+    """A save state whose target-th array, counted from 0, has one value too many."""
+    write_array = aws_cloudburst._StateWriter.array
+    written = []
+    
+    def padded(writer, typecode, values):
+        values = list(values)
+        if len(written) == target:
+            values.append(values[-1] if values else 1)
+        written.append(typecode)
+        write_array(writer, typecode, values)
+    
+    aws_cloudburst._StateWriter.array = padded
+    try:
+        return game.save_state(), len(written)
+    finally:
+        aws_cloudburst._StateWriter.array = write_array
+
+def test_rejects_inconsistent_arrays():
+    """Test that arrays whose lengths disagree are rejected before the game is touched."""
+    game = make_busy_game()
+    data = game.save_state()
+    _, arrays = save_with_extra_value(game, -1)
+    
+    # Chain and mover indices (arrays 4 and 5) are checked against the bricks instead
+    for target in set(range(arrays)) - {4, 5}:
+        bad, _ = save_with_extra_value(game, target)
+        try:
+            game.load_state(bad)
+        except SaveStateError:
+            continue
+        raise AssertionError(f"Array {target} with an extra value accepted")
+    assert game.save_state() == data
+    
+    # A trail longer than any ball keeps
+    ball = game.balls[0]
+    ball._trail_count = aws_cloudburst.BALL_TRAIL_LENGTH + 2
+    bad = game.save_state()
+    ball._trail_count = aws_cloudburst.BALL_TRAIL_LENGTH
+    try:
+        game.load_state(bad)
+    except SaveStateError:
+        pass
+    else:
+        raise AssertionError("Overlong trail accepted")
+    game.load_state(data)
+    assert game.save_state() == data
+    
+    # A corrupt autosave is dropped from the menu instead of crashing it
+    game.state = GameState.MENU
+    with open(aws_cloudburst.AUTOSAVE_FILE, "wb") as file:
+        file.write(bad)
+    game.autosave = aws_cloudburst.AutosaveWriter(aws_cloudburst.AUTOSAVE_FILE)
+    game._resume_autosave()
+    assert game.state == GameState.MENU and not game.autosave.exists()
+    print(f"   ✅ {arrays} arrays checked against each other before loading")
+
+def test_autosave_on_pause_and_resume_from_menu():
+    """Test that pausing autosaves in the background and the menu can resume it."""
+    game = make_busy_game()
+    game._handle_game_input(pygame.K_p)
+    assert game.autosave.flush(timeout=2.0)
+    assert os.path.exists(aws_cloudburst.AUTOSAVE_FILE)
+    saved = game.save_state()
+    
+    fresh = aws_cloudburst.Game()
+    assert fresh.menu_options[0] == "Resume"
+    fresh.selected_menu_option = 0
+    fresh._handle_menu_input(pygame.K_RETURN)
+    assert fresh.state == GameState.PAUSED
+    assert fresh.save_state() == saved
+    
+    fresh.high_score = 10 ** 9  # Keep the real high score file untouched
+    fresh._game_over()
+    assert not os.path.exists(aws_cloudburst.AUTOSAVE_FILE)
+    assert "Resume" not in fresh.menu_options
+    print("   ✅ Autosave on pause, resume from menu, cleared at game over")
+
+def test_autosave_on_level_transition():
+    """Test that finishing a level autosaves the start of the next one."""
+    game = make_busy_game()
+    game._complete_level()
+    assert game.autosave.flush(timeout=2.0)
+    restored = aws_cloudburst.Game()
+    restored.load_state(restored.autosave.read())
+    assert restored.current_level == 2 and restored.level.level_number == 2
+    print("   ✅ Level transition autosaved")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_round_trip_is_exact()
+    test_resumed_run_continues_identically()
+    test_compact_and_fast()
+    test_rejects_bad_data()
+    test_rejects_inconsistent_arrays()
+    test_autosave_on_pause_and_resume_from_menu()
+    test_autosave_on_level_transition()
+    pygame.quit()
+    print("\n✅ All save state tests passed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the game-time scheduler behind timed power-ups.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_scheduler_ordering_and_restart():
+    """Test that timers fire in deadline order and restarts replace deadlines."""
+    print("⏱️  Testing scheduler ordering...")
+    scheduler = aws_cloudburst.GameScheduler()
+    fired = []
+    for key in ("a", "b", "c"):
+        scheduler.register(key, on_expire=lambda key=key: fired.append(key))
+    
+    scheduler.start("a", 3.0)
+    scheduler.start("b", 1.0)
+    scheduler.start("c", 2.0)
+    scheduler.start("b", 2.5)  # Restart pushes b past c
+    scheduler.advance(2.0)
+    assert fired == ["c"]
+    scheduler.advance(1.0)
+    assert fired == ["c", "b", "a"]
+    assert not scheduler.is_active("a")
+    print("   ✅ Timers fire in order and stale entries are skipped")
+
+def test_scheduler_pause_and_time_scale():
+    """Test that pausing stops the clock and time scale stretches it."""
+    scheduler = aws_cloudburst.GameScheduler()
+    fired = []
+    scheduler.register("effect", on_expire=lambda: fired.append("effect"))
+    scheduler.start("effect", 1.0)
+    
+    scheduler.paused = True
+    scheduler.advance(5.0)
+    assert not fired and scheduler.remaining("effect") == 1.0
+    
+    scheduler.paused = False
+    scheduler.time_scale = 0.5
+    scheduler.advance(1.0)
+    assert not fired and abs(scheduler.remaining("effect") - 0.5) < 1e-9
+    scheduler.advance(1.0)
+    assert fired == ["effect"]
+    print("   ✅ Pause and time scaling work")
+
+def test_scheduler_serialization():
+    """Test that timer state survives a save/load round trip."""
+    scheduler = aws_cloudburst.GameScheduler()
+    scheduler.register("effect")
+    scheduler.start("effect", 4.0)
+    scheduler.advance(1.5)
+    
+    restored = aws_cloudburst.GameScheduler()
+    restored.register("effect")
+    restored.load_dict(scheduler.to_dict())
+    assert abs(restored.remaining("effect") - 2.5) < 1e-9
+    print("   ✅ Scheduler state round-trips")
+
+def test_powerup_expiry_in_game():
+    """Test that power-up effects and the paddle extension expire via the scheduler."""
+    game = aws_cloudburst.Game()
+    game._start_new_game()
+    game._activate_powerup(aws_cloudburst.PowerUpType.PADDLE_EXTEND)
+    game._activate_powerup(aws_cloudburst.PowerUpType.SLOW_MOTION)
+    assert game.paddle.extended and game.slow_motion_active
+    assert game.active_powerups[aws_cloudburst.PowerUpType.PADDLE_EXTEND] == 15
+    
+    assert game.scheduler.time_scale == aws_cloudburst.SLOW_MOTION_FACTOR
+    game.scheduler.advance(10.5)
+    assert game.slow_motion_active, "Slow motion stretches its own timer too"
+    game.scheduler.advance(10.0 / aws_cloudburst.SLOW_MOTION_FACTOR - 10.5 + 0.1)
+    assert not game.slow_motion_active and game.paddle.extended
+    assert game.scheduler.time_scale == 1.0
+    game.scheduler.advance(5.0)
+    assert not game.paddle.extended
+    assert game.paddle.width == aws_cloudburst.PADDLE_WIDTH
+    assert all(remaining == 0 for remaining in game.active_powerups.values())
+    print("   ✅ Power-up effects expire on schedule")
+
+def test_pause_stops_game_timers():
+    """Test that pausing the game stops its timers until play resumes."""
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    game._activate_powerup(aws_cloudburst.PowerUpType.SCORE_MULTIPLIER)
+    game._handle_game_input(pygame.K_p)
+    game.scheduler.advance(60.0)
+    assert game.score_multiplier == 2
+    game._handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)])
+    assert game.state == aws_cloudburst.GameState.PLAYING and not game.scheduler.paused
+    game.scheduler.advance(60.0)
+    assert game.score_multiplier == 1
+    print("   ✅ Pausing the game pauses its timers")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_scheduler_ordering_and_restart()
+    test_scheduler_pause_and_time_scale()
+    test_scheduler_serialization()
+    test_powerup_expiry_in_game()
+    test_pause_stops_game_timers()
+    pygame.quit()
+    print("\n✅ All scheduler tests passed!")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script to verify cached static screens and idle frame throttling.
+"""
+
+import sys
+import os
+import time
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_menu_cached_until_selection_changes():
+    """Test that the menu is only re-rendered when the selection changes."""
+    print("📋 Testing cached menu screen...")
+    ui = aws_cloudburst.UI()
+    screen = pygame.Surface((1024, 768))
+    options = ["Play", "High Scores", "Controls", "Quit"]
+    
+    ui.draw_menu(screen, "AWS CloudBurst", options, 0)
+    first = ui._screen_cache["menu"][1]
+    ui.draw_menu(screen, "AWS CloudBurst", options, 0)
+    assert ui._screen_cache["menu"][1] is first
+    
+    ui.draw_menu(screen, "AWS CloudBurst", options, 1)
+    assert ui._screen_cache["menu"][1] is not first
+    print("   ✅ Menu re-rendered only on selection change")
+
+def test_score_screens_keyed_on_scores():
+    """Test that high-score and game-over screens follow score changes."""
+    ui = aws_cloudburst.UI()
+    screen = pygame.Surface((1024, 768))
+    
+    ui.draw_high_scores(screen, 1000)
+    cached = ui._screen_cache["high_scores"][1]
+    ui.draw_high_scores(screen, 1000)
+    assert ui._screen_cache["high_scores"][1] is cached
+    ui.draw_high_scores(screen, 6000)
+    assert ui._screen_cache["high_scores"][1] is not cached
+    
+    ui.draw_game_over(screen, 500, 1000)
+    ui.draw_controls(screen)
+    controls = ui._screen_cache["controls"][1]
+    ui.draw_controls(screen)
+    assert ui._screen_cache["controls"][1] is controls
+    print("   ✅ Score screens re-rendered only on score change")
+
+def test_idle_loop_blocks_on_input():
+    """Test that the menu loop waits for events rather than spinning."""
+    game = aws_cloudburst.Game()
+    assert game._is_idle_state()
+    pygame.event.clear()  # Drop window setup events
+    
+    start = time.perf_counter()
+    assert game._wait_for_events() == []
+    waited = time.perf_counter() - start
+    assert waited >= aws_cloudburst.IDLE_WAIT_MS / 1000 * 0.8
+    
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    game.run()
+    assert not game.running
+    print(f"   ✅ Idle wait blocked for {waited * 1000:.0f} ms and still handled QUIT")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_menu_cached_until_selection_changes()
+    test_score_screens_keyed_on_scores()
+    test_idle_loop_blocks_on_input()
+    pygame.quit()
+    print("\n✅ All static screen tests passed!")
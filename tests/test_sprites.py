@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script to verify cached sprites for the ball and paddle.
+"""
+
+import sys
+import os
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+
+def test_ball_trail_ring_buffer():
+    """Test that the trail keeps the last BALL_TRAIL_LENGTH positions in order."""
+    print("⚽ Testing ball trail ring buffer...")
+    ball = aws_cloudburst.Ball(500, 400, 0)
+    positions = []
+    for step in range(aws_cloudburst.BALL_TRAIL_LENGTH + 3):
+        ball.position = aws_cloudburst.Vector2D(500 + step, 400)
+        positions.append((500 + step, 400))
+        ball.update(1.0 / 60)
+    
+    assert ball.trail_positions == positions[-aws_cloudburst.BALL_TRAIL_LENGTH:]
+    print("   ✅ Trail keeps newest positions, oldest first")
+
+def test_ball_sprites_shared_per_radius():
+    """Test that ball sprites are rendered once per radius and reused."""
+    sprites = aws_cloudburst.BallSprites.get(8)
+    assert aws_cloudburst.BallSprites.get(8) is sprites
+    assert aws_cloudburst.BallSprites.get(12) is not sprites
+    
+    # Every alpha level a trail can use is pre-rendered
+    for length in range(1, aws_cloudburst.BALL_TRAIL_LENGTH + 1):
+        for i in range(length):
+            assert aws_cloudburst.BallSprites.trail_alpha(i, length) in sprites.trails
+    print("   ✅ Ball sprites cached per radius")
+
+def test_ball_draws_body():
+    """Test that drawing a ball puts its body on screen."""
+    screen = pygame.Surface((200, 200))
+    screen.fill(aws_cloudburst.AWS_DARK_BLUE)
+    ball = aws_cloudburst.Ball(100, 100, 0)
+    ball.draw(screen)
+    assert screen.get_at((100 - ball.radius + 1, 100))[:3] != aws_cloudburst.AWS_DARK_BLUE
+    print("   ✅ Ball body drawn from sprite")
+
+def test_paddle_sprites_keyed_by_width_and_state():
+    """Test that paddle sprites are cached per (width, extended)."""
+    print("🏓 Testing paddle sprite cache...")
+    normal = aws_cloudburst.PaddleSprites.get(120, False)
+    assert aws_cloudburst.PaddleSprites.get(120, False) is normal
+    assert aws_cloudburst.PaddleSprites.get(120, True) is not normal
+    assert aws_cloudburst.PaddleSprites.get(180, True).get_width() == 180
+    print("   ✅ Paddle sprites cached per key")
+
+def test_paddle_smooth_resize():
+    """Test that the drawn width eases to the extended width and back."""
+    paddle = aws_cloudburst.Paddle(500, 700)
+    keys = {pygame.K_LEFT: False, pygame.K_a: False, pygame.K_RIGHT: False, pygame.K_d: False}
+    
+    paddle.extend_paddle()
+    assert paddle.width == 180 and paddle.display_width == 120
+    paddle.update(aws_cloudburst.PADDLE_RESIZE_TIME / 2, keys)
+    assert 120 < paddle.display_width < 180
+    
+    screen = pygame.Surface((1024, 768))
+    paddle.draw(screen)  # Mid-transition widths draw from snapped variants
+    
+    paddle.update(aws_cloudburst.PADDLE_RESIZE_TIME, keys)
+    assert paddle.display_width == 180
+    
+    paddle.reset_extension()
+    paddle.update(aws_cloudburst.PADDLE_RESIZE_TIME * 2, keys)
+    assert paddle.display_width == 120
+    print("   ✅ Paddle width animates between sprite variants")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_ball_trail_ring_buffer()
+    test_ball_sprites_shared_per_radius()
+    test_ball_draws_body()
+    test_paddle_sprites_keyed_by_width_and_state()
+    test_paddle_smooth_resize()
+    pygame.quit()
+    print("\n✅ All sprite tests passed!")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the giant-board stress mode.
+"""
+
+import sys
+import os
+import random
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import (Ball, BlockGrid, Camera, HeldKeys, InputEvent, Level, StressConfig,
+                            SaveStateError, StressLevel)
+from conftest import make_game, scan
+
+def test_broadphase_matches_scan():
+    """Test that the grid finds exactly what a scan of every block finds, in order."""
+    print("🧪 Testing stress mode...")
+    rng = random.Random(1)
+    for level in (StressLevel(5000, 1), Level(1), Level(5)):
+        for block in rng.sample(level.blocks, len(level.blocks) // 3):
+            block.destroyed = True
+        grid = BlockGrid(level.blocks)
+        for _ in range(500):
+            rect = pygame.Rect(rng.uniform(-20, level.width), rng.uniform(-20, level.height),
+                               rng.choice((1, 16, 40, 300)), rng.choice((1, 16, 40, 300)))
+            assert grid.blocks_in(rect) == scan(level.blocks, rect)
+    print("   ✅ Broadphase agrees with a full scan")
+
+def test_board_sizes():
+    """Test that boards of any allowed size fit their world and oversize ones are refused."""
+    level = StressLevel(aws_cloudburst.STRESS_MAX_BRICKS)
+    assert len(level.blocks) == aws_cloudburst.STRESS_MAX_BRICKS
+    assert level.width > aws_cloudburst.SCREEN_WIDTH and level.height > aws_cloudburst.SCREEN_HEIGHT
+    assert all(0 < block.position.x < level.width and 0 < block.position.y < level.height
+               for block in level.blocks[::97])
+    assert len({block.block_type for block in level.blocks}) == len(aws_cloudburst.BlockType)
+    assert not level.is_complete() and not level.advances
+
+    for bricks, balls in ((0, 10), (aws_cloudburst.STRESS_MAX_BRICKS + 1, 10), (100, 0),
+                          (100, aws_cloudburst.STRESS_MAX_BALLS + 1)):
+        try:
+            StressConfig(bricks, balls)
+        except ValueError:
+            continue
+        raise AssertionError(f"Accepted {bricks} bricks, {balls} balls")
+    try:
+        aws_cloudburst.Game(mode="stress", threaded=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Threaded stress mode accepted")
+    print(f"   ✅ {len(level.blocks)} bricks in a {level.width}x{level.height} world")
+
+def test_play_in_a_large_world():
+    """Test that balls, paddle and camera use the whole world, not the screen."""
+    game = make_game(3, mode="stress", stress=StressConfig(20000, 20))
+    level = game.level
+    assert len(game.balls) == 20 and game.camera is not None
+    assert game.paddle.position.y == level.height - 50
+
+    ball = Ball(level.width - 100, level.height - 200)
+    ball.velocity = aws_cloudburst.Vector2D(400, 0)
+    game.entities.spawn("balls", ball)
+    keys = HeldKeys()
+    keys.apply(InputEvent(0.0, pygame.K_RIGHT, True, True))
+    for _ in range(60):
+        game._update_game(1.0 / 60, keys)
+    assert ball.velocity.x < 0, "Ball should bounce off the world's right wall"
+    assert ball.position.x > level.width - 400
+    for _ in range(540):
+        game._update_game(1.0 / 60, keys)
+    assert game.paddle.position.x > aws_cloudburst.SCREEN_WIDTH
+    assert game.camera.x == level.width - aws_cloudburst.SCREEN_WIDTH
+    assert game.camera.y == level.height - aws_cloudburst.SCREEN_HEIGHT
+    assert level.get_remaining_blocks() < len(level.blocks)
+
+    keys.apply(InputEvent(0.0, pygame.K_UP, True, True))
+    game._update_game(0.5, keys)
+    assert game.camera.y < level.height - aws_cloudburst.SCREEN_HEIGHT
+    camera = Camera(level.width, 5000)
+    camera.update(1.0, keys, -500)
+    assert (camera.x, camera.y) == (0.0, 5000 - aws_cloudburst.SCREEN_HEIGHT - aws_cloudburst.CAMERA_PAN_SPEED)
+    game._draw_game()
+    print("   ✅ World-sized walls, paddle range and camera")
+
+def test_save_state_round_trip():
+    """Test that a stress game saves and loads exactly, board size included."""
+    game = make_game(3, mode="stress", stress=StressConfig(2000, 30))
+    for _ in range(120):
+        game._update_game(1.0 / 60, HeldKeys())
+    data = game.save_state()
+    restored = aws_cloudburst.Game()
+    restored.load_state(data)
+    assert restored.save_state() == data
+    assert isinstance(restored.level, StressLevel)
+    assert (restored.level.width, restored.level.height) == (game.level.width, game.level.height)
+    assert restored.camera is not None
+    assert restored.mode == "levels", "Loading a save keeps the game's own mode"
+    restored._start_new_game()
+    assert not isinstance(restored.level, StressLevel) and restored.camera is None
+    try:
+        aws_cloudburst.Game(threaded=True).load_state(data)
+        assert False, "A threaded game should reject a stress save"
+    except SaveStateError:
+        pass
+    print(f"   ✅ {len(data)} byte stress save state round-trips")
+
+def test_perf_report():
+    """Test that the stress report covers update phases, drawing and memory."""
+    report = aws_cloudburst.run_stress_test(bricks=5000, balls=50, frames=20)
+    phases = sum(report[f"{phase}_ms"] for phase in aws_cloudburst.STRESS_PHASES)
+    assert report["update_ms"] >= phases > 0
+    assert report["draw_ms"] > 0 and report["board_kb"] > 0
+    assert 0 < report["visible_bricks"] < report["bricks"]
+    print(f"   ✅ 5000 bricks, 50 balls: update {report['update_ms']:.2f} ms, "
+          f"draw {report['draw_ms']:.2f} ms, board {report['board_kb']:.0f} KB")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_broadphase_matches_scan()
+    test_board_sizes()
+    test_play_in_a_large_world()
+    test_save_state_round_trip()
+    test_perf_report()
+    pygame.quit()
+    print("\n✅ All stress mode tests passed!")
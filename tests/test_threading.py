@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script to verify render snapshots and the simulation-thread split.
+"""
+
+import sys
+import os
+import time
+import dataclasses
+import pygame
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import aws_cloudburst
+from aws_cloudburst import InputEvent, PowerUpType, SimulationThread, SnapshotBuffer
+
+def make_busy_game():
+    game = aws_cloudburst.Game()
+    game.detach_presentation()
+    game._start_new_game()
+    for _ in range(3):
+        game.balls[0].update(1.0 / 60)
+    game._hit_block(game.level.blocks[0], "ball")
+    game.events.dispatch()
+    game.entities.spawn("powerups", aws_cloudburst.PowerUp(300.5, 400.25, PowerUpType.SHIELD))
+    game.entities.spawn("lasers", aws_cloudburst.Laser(500, 450))
+    game.shield = aws_cloudburst.Shield(game.paddle.position.x, game.paddle.position.y, game.paddle.width)
+    game.active_powerups[PowerUpType.SLOW_MOTION] = 5.0
+    game.scheduler.start("level_banner", 1.0)
+    return game
+
+def test_snapshot_draws_same_frame():
+    """Test that drawing a snapshot matches drawing the live game pixel for pixel."""
+    print("🧵 Testing render snapshots...")
+    game = make_busy_game()
+    game._draw_game()
+    expected = pygame.image.tostring(game.screen, "RGB")
+    
+    game.screen.fill((0, 0, 0))
+    game._draw_snapshot(game.snapshot())
+    assert pygame.image.tostring(game.screen, "RGB") == expected
+    print("   ✅ Snapshot frame identical to live frame")
+
+def test_snapshot_is_immutable_and_compact():
+    """Test that snapshots are frozen and share the level layout."""
+    game = make_busy_game()
+    first, second = game.snapshot(1), game.snapshot(2)
+    try:
+        first.score = 1
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("snapshot should be frozen")
+    assert first.blocks is second.blocks
+    assert first.block_hits[0] == 0 and len(first.block_hits) == len(game.level.blocks)
+    print("   ✅ Frozen snapshots, shared layout, packed block state")
+
+def test_snapshot_buffer():
+    """Test that the buffer hands out the newest published snapshot."""
+    game = make_busy_game()
+    buffer = SnapshotBuffer(slots=3)
+    assert buffer.latest() is None
+    for sequence in range(5):
+        buffer.publish(game.snapshot(sequence))
+    assert buffer.latest().sequence == 4 and buffer.published == 5
+    print("   ✅ Newest snapshot returned")
+
+def test_simulation_applies_forwarded_input():
+    """Test that forwarded key events drive the paddle and pause on the simulation side."""
+    game = make_busy_game()
+    simulation = game.simulation = SimulationThread(game)
+    start_x = game.paddle.position.x
+    
+    simulation.send(InputEvent(time.perf_counter(), pygame.K_RIGHT, True, True))
+    for _ in range(10):
+        simulation.tick()
+    assert game.paddle.position.x > start_x
+    assert simulation.buffer.latest().sequence == 10
+    assert simulation.buffer.latest().input_time > 0
+    
+    simulation.send(InputEvent(time.perf_counter(), pygame.K_RIGHT, False, True))
+    simulation.send(InputEvent(time.perf_counter(), pygame.K_p, True, True))
+    simulation.tick()
+    assert game.state == aws_cloudburst.GameState.PAUSED
+    assert len(simulation.input_latencies) == 3
+    print("   ✅ Forwarded input moved the paddle and paused the game")
+
+def test_simulation_thread_runs_at_fixed_rate():
+    """Test that the thread steps and publishes on its own, then stops cleanly."""
+    game = make_busy_game()
+    game.lives = 100
+    simulation = SimulationThread(game, rate=120)
+    simulation.start()
+    time.sleep(0.25)
+    simulation.stop()
+    assert not simulation.is_alive()
+    assert 10 <= simulation.steps <= 60
+    assert simulation.buffer.published == simulation.steps
+    print(f"   ✅ {simulation.steps} steps in 0.25 s at 120 Hz")
+
+if __name__ == "__main__":
+    pygame.init()
+    test_snapshot_draws_same_frame()
+    test_snapshot_is_immutable_and_compact()
+    test_snapshot_buffer()
+    test_simulation_applies_forwarded_input()
+    test_simulation_thread_runs_at_fixed_rate()
+    pygame.quit()
+    print("\n✅ All threading tests passed!")